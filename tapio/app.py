@@ -1,7 +1,10 @@
 """Gradio interface for the Tapio Assistant RAG chatbot."""
 
+import asyncio
 import logging
-from collections.abc import Generator
+import threading
+import time
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import gradio as gr
@@ -18,11 +21,15 @@ DEFAULT_CHROMA_DB_PATH = "chroma_db"
 DEFAULT_MODEL_NAME = "llama3.2"
 DEFAULT_MAX_TOKENS = 1024
 DEFAULT_NUM_RESULTS = 5
+DEFAULT_CONCURRENCY_LIMIT = 4
 
 
 class TapioAssistantApp:
     """Class representing the Tapio Assistant Gradio application."""
 
+    # Minimum number of seconds between chat updates while a response streams in
+    STREAM_UPDATE_INTERVAL = 0.05
+
     def __init__(
         self,
         collection_name: str = DEFAULT_COLLECTION_NAME,
@@ -30,6 +37,7 @@ class TapioAssistantApp:
         model_name: str = DEFAULT_MODEL_NAME,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         num_results: int = DEFAULT_NUM_RESULTS,
+        concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT,
     ) -> None:
         """Initialize the Tapio Assistant application.
 
@@ -39,13 +47,19 @@ class TapioAssistantApp:
             model_name: Name of the LLM model to use
             max_tokens: Maximum number of tokens to generate
             num_results: Number of documents to retrieve from the vector store
+            concurrency_limit: Maximum number of questions answered at the same time.
+                Match it to Ollama's OLLAMA_NUM_PARALLEL so concurrent users share its slots.
         """
         self.collection_name = collection_name
         self.persist_directory = persist_directory
         self.model_name = model_name
         self.max_tokens = max_tokens
         self.num_results = num_results
+        self.concurrency_limit = concurrency_limit
         self.rag_orchestrator: RAGOrchestrator | None = None
+        # The orchestrator is built on a worker thread, so concurrent first queries
+        # must not each build an orchestrator with its own embedding model
+        self._rag_orchestrator_lock = threading.Lock()
         self.demo = self._build_interface()
 
     def _init_rag_orchestrator(self) -> RAGOrchestrator:
@@ -55,20 +69,23 @@ class TapioAssistantApp:
             Initialized RAGOrchestrator instance
         """
         if self.rag_orchestrator is None:
-            logger.info(
-                f"Initializing RAG orchestrator with {self.model_name} model",
-            )
-            self.rag_orchestrator = RAGOrchestrator(
-                collection_name=self.collection_name,
-                persist_directory=self.persist_directory,
-                model_name=self.model_name,
-                max_tokens=self.max_tokens,
-                num_results=self.num_results,
-            )
+            with self._rag_orchestrator_lock:
+                # Check again, another thread may have initialized it while this one waited
+                if self.rag_orchestrator is None:
+                    logger.info(
+                        f"Initializing RAG orchestrator with {self.model_name} model",
+                    )
+                    self.rag_orchestrator = RAGOrchestrator(
+                        collection_name=self.collection_name,
+                        persist_directory=self.persist_directory,
+                        model_name=self.model_name,
+                        max_tokens=self.max_tokens,
+                        num_results=self.num_results,
+                    )
 
         return self.rag_orchestrator
 
-    def generate_rag_response(
+    async def generate_rag_response(
         self,
         query: str,
         history: list[dict[str, Any]] | None = None,
@@ -83,11 +100,12 @@ class TapioAssistantApp:
             Tuple containing the response and formatted documents for display
         """
         try:
-            # Initialize RAG orchestrator if not already done
-            orchestrator = self._init_rag_orchestrator()
+            # Initialize RAG orchestrator if not already done, off the event loop
+            # as the first call loads the embedding model
+            orchestrator = await asyncio.to_thread(self._init_rag_orchestrator)
 
             # Get response and retrieved docs from the RAG orchestrator
-            response, retrieved_docs = orchestrator.query(
+            response, retrieved_docs = await orchestrator.aquery(
                 query_text=query,
                 history=history,
             )
@@ -105,13 +123,16 @@ class TapioAssistantApp:
                 "Error retrieving documents.",
             )
 
-    def respond_stream(
+    async def respond_stream(
         self,
         message: str,
         chat_history: list[dict[str, str]],
-    ) -> Generator[tuple[str, list[dict[str, str]], str], None, None]:
+    ) -> AsyncGenerator[tuple[str, list[dict[str, str]], str], None]:
         """Process user message and stream the response.
 
+        The handler runs on Gradio's event loop, so while one response waits
+        on Ollama the responses to other users keep streaming.
+
         Args:
             message: User's message
             chat_history: Current chat history
@@ -131,18 +152,22 @@ class TapioAssistantApp:
         yield "", chat_history, "Retrieving relevant documents..."
 
         try:
-            # Initialize RAG orchestrator if not already done
-            rag_orchestrator = self._init_rag_orchestrator()
+            # Initialize RAG orchestrator if not already done, off the event loop
+            # as the first call loads the embedding model
+            rag_orchestrator = await asyncio.to_thread(self._init_rag_orchestrator)
 
             # Get streaming response and retrieved docs from the RAG orchestrator
-            response_stream, retrieved_docs = rag_orchestrator.query_stream(
+            response_stream, retrieved_docs = await rag_orchestrator.aquery_stream(
                 query_text=message,
                 history=chat_history,
             )
 
+            # The documents are retrieved before generation starts, so format them
+            # once and show them while the answer is still being generated
+            formatted_docs = rag_orchestrator.format_documents_for_display(retrieved_docs)
+
             # Start building the assistant response and immediately start streaming
             assistant_response = "..."  # Start with ellipsis for immediate feedback
-            formatted_docs = "Retrieving relevant documents..."
             first_chunk = True
 
             # Update chat history immediately with ellipsis to show activity
@@ -151,13 +176,14 @@ class TapioAssistantApp:
                 {"role": "assistant", "content": assistant_response},
             )
             yield "", current_history, formatted_docs
+            last_update = time.monotonic()
 
             # Immediately start consuming the generator to trigger LLM processing
             logger.info("Starting to consume response stream")
 
             # Stream the response - start consuming immediately
-            for chunk in response_stream:
-                logger.debug(f"App received chunk: '{chunk}'")
+            async for chunk in response_stream:
+                logger.debug("App received chunk: '%s'", chunk)
                 # Replace the ellipsis with actual content on first meaningful chunk
                 if first_chunk and chunk.strip():  # Only replace if chunk has content
                     logger.info(
@@ -165,23 +191,26 @@ class TapioAssistantApp:
                     )
                     assistant_response = chunk
                     first_chunk = False
+                    # Show the first chunk right away, whatever the update interval
+                    last_update = float("-inf")
                 elif not first_chunk:
                     # Normal streaming - append chunks
                     assistant_response += chunk
                 # If first_chunk is True but chunk is empty/whitespace, keep the ellipsis
 
+                # Re-rendering the chat on every token would swamp the browser, so
+                # chunks arriving within the update interval are batched together
+                now = time.monotonic()
+                if now - last_update < self.STREAM_UPDATE_INTERVAL:
+                    continue
+                last_update = now
+
                 # Update chat history with current response
                 current_history = chat_history.copy()
                 current_history.append(
                     {"role": "assistant", "content": assistant_response},
                 )
 
-                # Format documents for display once we have them
-                if retrieved_docs and formatted_docs == "Retrieving relevant documents...":
-                    formatted_docs = rag_orchestrator.format_documents_for_display(
-                        retrieved_docs,
-                    )
-
                 yield "", current_history, formatted_docs
 
             # Final update with complete response
@@ -189,12 +218,6 @@ class TapioAssistantApp:
                 {"role": "assistant", "content": assistant_response},
             )
 
-            # Ensure documents are formatted for final display
-            if retrieved_docs:
-                formatted_docs = rag_orchestrator.format_documents_for_display(
-                    retrieved_docs,
-                )
-
             yield "", chat_history, formatted_docs
 
         except Exception as e:
@@ -213,7 +236,7 @@ class TapioAssistantApp:
         """
         return [], ""
 
-    def respond(
+    async def respond(
         self,
         message: str,
         chat_history: list[dict[str, str]],
@@ -232,7 +255,7 @@ class TapioAssistantApp:
         if not chat_history:
             chat_history = []
 
-        response, docs = self.generate_rag_response(message, chat_history)
+        response, docs = await self.generate_rag_response(message, chat_history)
 
         # Add the new messages
         chat_history.append({"role": "user", "content": message})
@@ -294,6 +317,7 @@ class TapioAssistantApp:
                     chatbot,
                     docs_display,
                 ],
+                concurrency_limit=self.concurrency_limit,
             )
             # Make submit button trigger the same behavior as Enter key
             submit.click(
@@ -304,6 +328,7 @@ class TapioAssistantApp:
                     chatbot,
                     docs_display,
                 ],
+                concurrency_limit=self.concurrency_limit,
             )
             clear.click(self.clear_chat, None, [chatbot, docs_display])
 
@@ -318,6 +343,9 @@ class TapioAssistantApp:
                 inputs=msg,
             )
 
+        # Answer up to concurrency_limit questions at once instead of one at a time
+        demo.queue(default_concurrency_limit=self.concurrency_limit)
+
         return demo
 
     def check_model_availability(self) -> bool:
@@ -352,6 +380,7 @@ def main(
     model_name: str = DEFAULT_MODEL_NAME,
     max_tokens: int = DEFAULT_MAX_TOKENS,
     num_results: int = DEFAULT_NUM_RESULTS,
+    concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT,
     share: bool = False,
 ) -> None:
     """Run the Tapio Assistant app with the specified parameters.
@@ -362,6 +391,7 @@ def main(
         model_name: Name of the LLM model to use
         max_tokens: Maximum number of tokens to generate
         num_results: Number of documents to retrieve from the vector store
+        concurrency_limit: Maximum number of questions answered at the same time
         share: Whether to create a shareable link for the app
     """
     # Create the app
@@ -371,6 +401,7 @@ def main(
         model_name=model_name,
         max_tokens=max_tokens,
         num_results=num_results,
+        concurrency_limit=concurrency_limit,
     )
 
     # Check model availability
@@ -1,13 +1,16 @@
 import logging
 import os
+from typing import NoReturn
 
 import typer
 
 from tapio.config import ConfigManager
-from tapio.config.settings import DEFAULT_CHROMA_COLLECTION, DEFAULT_CONTENT_DIR, DEFAULT_DIRS
-from tapio.crawler.runner import CrawlerRunner
-from tapio.parser import Parser
-from tapio.vectorstore.vectorizer import MarkdownVectorizer
+from tapio.config.settings import (
+    DEFAULT_CHROMA_COLLECTION,
+    DEFAULT_CONTENT_DIR,
+    DEFAULT_DIRS,
+    DEFAULT_VECTORIZE_BATCH_SIZE,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +27,19 @@ logging.getLogger("transformers").setLevel(
 logging.getLogger("chromadb").setLevel(logging.WARNING)  # Reduce ChromaDB debug noise
 
 
+def _set_verbose_logging(verbose: bool) -> None:
+    """Switch the root logger to DEBUG level when verbose output is requested."""
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+
+def _exit_unsupported_site(site: str, available_sites: list[str]) -> NoReturn:
+    """Report an unknown site name together with the configured ones and exit."""
+    typer.echo(f"❌ Unsupported site: {site}")
+    typer.echo(f"Available sites: {', '.join(available_sites)}")
+    raise typer.Exit(code=1)
+
+
 def find_sites_with_crawled_content(content_dir: str, crawled_subdir: str) -> list[str]:
     """Find all sites that have crawled HTML content.
 
@@ -60,6 +76,20 @@ def crawl(
         "-d",
         help="Maximum link-following depth (if not specified, uses config file default)",
     ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-n",
+        min=1,
+        max=50,
+        help="Maximum number of concurrent requests (if not specified, uses config file default)",
+    ),
+    delay: float | None = typer.Option(
+        None,
+        "--delay",
+        min=0.0,
+        help="Delay between requests in seconds (if not specified, uses config file default)",
+    ),
     config_path: str | None = typer.Option(
         None,
         "--config",
@@ -81,12 +111,12 @@ def crawl(
 
     The crawler is interruptible - press Ctrl+C to stop and save current progress.
 
-    Example:
+    Examples:
         $ python -m tapio.cli crawl migri -d 2
+        $ python -m tapio.cli crawl migri --concurrency 10 --delay 0.2
     """
     # Set log level based on verbose flag
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    _set_verbose_logging(verbose)
 
     # Use ConfigManager for site configuration management
     try:
@@ -94,9 +124,7 @@ def crawl(
         available_sites = config_manager.list_available_sites()
 
         if site not in available_sites:
-            typer.echo(f"❌ Unsupported site: {site}")
-            typer.echo(f"Available sites: {', '.join(available_sites)}")
-            raise typer.Exit(code=1)
+            _exit_unsupported_site(site, available_sites)
 
         # Get the site configuration
         site_config = config_manager.get_site_config(site)
@@ -110,9 +138,14 @@ def crawl(
     # Implement depth precedence logic:
     # 1. Use user-provided value if given
     # 2. Otherwise, use config value (which could be default or explicitly set)
+    # The same precedence applies to the rate limiting settings
     if depth is not None:
         # User explicitly provided a depth value
         site_config.crawler_config.max_depth = depth
+    if concurrency is not None:
+        site_config.crawler_config.max_concurrent = concurrency
+    if delay is not None:
+        site_config.crawler_config.delay_between_requests = delay
 
     # Construct the actual output directory path
     crawled_dir = os.path.join(DEFAULT_CONTENT_DIR, site, DEFAULT_DIRS["CRAWLED_DIR"])
@@ -125,16 +158,26 @@ def crawl(
     )
 
     try:
+        # Import lazily so other commands don't pay for loading the crawler
+        from tqdm import tqdm  # type: ignore[import-untyped]
+        from tqdm.contrib.logging import logging_redirect_tqdm  # type: ignore[import-untyped]
+
+        from tapio.crawler.runner import CrawlerRunner
+
         # Initialize crawler runner
         runner = CrawlerRunner()
 
         typer.echo("⚠️ Press Ctrl+C at any time to interrupt crawling.")
 
-        # Start crawling with simplified interface
-        results = runner.run(site, site_config)
+        # Start crawling, advancing the progress bar as each page is saved. Pages are
+        # counted as they stream past instead of being collected in memory. Log
+        # records are routed through tqdm so they don't break up the bar.
+        with logging_redirect_tqdm(), tqdm(unit="page", desc=f"Crawling {site}") as progress:
+            runner.run(site, site_config, on_page=lambda _page: progress.update(1), collect_results=False)
+            page_count = progress.n
 
         # Output information
-        typer.echo(f"✅ Crawling completed! Processed {len(results)} pages.")
+        typer.echo(f"✅ Crawling completed! Processed {page_count} pages.")
         typer.echo(f"💾 Content saved as HTML files in {crawled_dir}")
 
     except KeyboardInterrupt:
@@ -158,6 +201,12 @@ def parse(
         "-c",
         help="Path to custom parser configurations file",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Parse all files again, even those whose output is up to date",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -178,15 +227,18 @@ def parse(
         $ python -m tapio.cli parse migri
         $ python -m tapio.cli parse te_palvelut
         $ python -m tapio.cli parse kela --config custom_configs.yaml
+        $ python -m tapio.cli parse migri --force
     """
     # Set log level based on verbose flag
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    _set_verbose_logging(verbose)
 
     typer.echo(f"📝 Starting HTML parsing from {DEFAULT_DIRS['CRAWLED_DIR']}")
     typer.echo(f"📄 Saving parsed content to: {DEFAULT_DIRS['PARSED_DIR']}")
 
     try:
+        # Import lazily so other commands don't pay for loading the parser
+        from tapio.parser import Parser
+
         # Use ConfigManager for site configuration management
         config_manager = ConfigManager(config_path)
         available_sites = config_manager.list_available_sites()
@@ -199,7 +251,7 @@ def parse(
                     site_name=site,
                     config_path=config_path,
                 )
-                results = parser.parse_all()
+                results = parser.parse_all(force=force)
 
                 # Output information
                 typer.echo(f"✅ Parsing completed! Processed {len(results)} files.")
@@ -207,9 +259,7 @@ def parse(
                 typer.echo(f"📝 Content saved as Markdown files in {parsed_dir}")
                 typer.echo(f"📝 Index created at {parsed_dir}/index.md")
             else:
-                typer.echo(f"❌ Unsupported site: {site}")
-                typer.echo(f"Available sites: {', '.join(available_sites)}")
-                raise typer.Exit(code=1)
+                _exit_unsupported_site(site, available_sites)
         else:
             # Parse all sites that have crawled content
             typer.echo("🔧 No site specified, parsing all available sites with crawled content")
@@ -243,8 +293,9 @@ def parse(
 
             typer.echo(f"🎯 Parsing sites: {', '.join(sites_to_parse)}")
 
-            # Parse each site
-            total_results = []
+            # Parse each site, keeping only a running count so the per-site
+            # results can be released as soon as they are reported
+            total_count = 0
             for site_name in sites_to_parse:
                 typer.echo(f"🔧 Parsing site: {site_name}")
                 parser = Parser(
@@ -252,12 +303,12 @@ def parse(
                     config_path=config_path,
                 )
 
-                site_results = parser.parse_all()
-                total_results.extend(site_results)
+                site_results = parser.parse_all(force=force)
+                total_count += len(site_results)
                 typer.echo(f"  ✅ {site_name}: Processed {len(site_results)} files")
 
             # Output summary information
-            typer.echo(f"✅ All parsing completed! Processed {len(total_results)} files total.")
+            typer.echo(f"✅ All parsing completed! Processed {total_count} files total.")
             typer.echo(f"📝 Content saved as Markdown files in {DEFAULT_CONTENT_DIR}")
             typer.echo(f"📊 Parsed {len(sites_to_parse)} sites: {', '.join(sites_to_parse)}")
 
@@ -279,10 +330,20 @@ def vectorize(
         help="Name of the sentence-transformers model to use",
     ),
     batch_size: int = typer.Option(
-        20,
+        DEFAULT_VECTORIZE_BATCH_SIZE,
         "--batch-size",
         "-b",
-        help="Number of documents to process in each batch",
+        help="Number of markdown files to embed and store in each batch",
+    ),
+    backend: str = typer.Option(
+        "torch",
+        "--backend",
+        help="Embedding inference backend: 'torch', 'onnx' or 'openvino'",
+    ),
+    model_file: str | None = typer.Option(
+        None,
+        "--model-file",
+        help="Model file for the ONNX/OpenVINO backends, e.g. 'onnx/model_qint8_avx512_vnni.onnx'",
     ),
     verbose: bool = typer.Option(
         False,
@@ -300,10 +361,10 @@ def vectorize(
     Examples:
         $ python -m tapio.cli vectorize migri
         $ python -m tapio.cli vectorize
+        $ python -m tapio.cli vectorize --backend onnx --model-file onnx/model_qint8_avx512_vnni.onnx
     """
     # Set log level based on verbose flag
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    _set_verbose_logging(verbose)
 
     db_dir = DEFAULT_DIRS["CHROMA_DIR"]
     collection_name = DEFAULT_CHROMA_COLLECTION
@@ -327,6 +388,9 @@ def vectorize(
     typer.echo(f"📑 Using collection name: {collection_name}")
 
     try:
+        # Import lazily as this loads the embedding and vector database stack
+        from tapio.vectorstore.vectorizer import MarkdownVectorizer
+
         # Initialize vectorizer
         vectorizer = MarkdownVectorizer(
             collection_name=collection_name,
@@ -334,6 +398,8 @@ def vectorize(
             embedding_model_name=embedding_model,
             chunk_size=1000,
             chunk_overlap=200,
+            embedding_backend=backend,
+            embedding_model_file=model_file,
         )
 
         # Process files in the directory
@@ -430,6 +496,22 @@ def tapio_app(
     ),
 ) -> None:
     """Launch the Tapio web interface for RAG-powered chatbot."""
+    _launch_app(model_name=model_name, max_tokens=max_tokens, share=share)
+
+
+def _launch_app(model_name: str, max_tokens: int = 1024, share: bool = False) -> None:
+    """
+    Launch the Gradio app with the default ChromaDB collection.
+
+    Shared by the tapio-app and dev commands so that neither has to call a
+    Typer command function directly, where any omitted option would be passed
+    through as a Typer OptionInfo object rather than its default value.
+
+    Args:
+        model_name: Ollama model to use for LLM inference
+        max_tokens: Maximum number of tokens to generate
+        share: Whether to create a shareable link for the app
+    """
     try:
         # Import the main function from the gradio_app module
         from tapio.app import main as launch_app
@@ -465,8 +547,8 @@ def tapio_app(
 def dev() -> None:
     """Launch the development server for the Tapio Assistant chatbot."""
     typer.echo("🚀 Launching Tapio Assistant chatbot development server...")
-    # Call the tapio_app function with default settings
-    tapio_app(
+    # Launch the app with default settings
+    _launch_app(
         model_name="llama3.2",
         share=False,
     )
@@ -534,8 +616,8 @@ def list_sites(
 
 def run_tapio_app() -> None:
     """Entry point for the 'dev' command to launch the Tapio app with default settings."""
-    # This function calls the tapio_app command with default settings
-    tapio_app(
+    # Launch the app with the same default settings as the dev command
+    _launch_app(
         model_name="llama3.2",
         share=False,
     )
@@ -4,6 +4,7 @@ This module handles loading and accessing configurations
 from YAML files, providing a centralized interface for configuration data throughout the application.
 """
 
+import functools
 import logging
 import os
 
@@ -11,6 +12,33 @@ import yaml
 
 from tapio.config.config_models import ParserConfigRegistry, SiteConfig
 
+try:
+    # libyaml's C loader is many times faster than PyYAML's pure-Python one
+    from yaml import CSafeLoader as ConfigLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as ConfigLoader  # type: ignore[assignment]
+
+# Default config path is in the same directory as this file
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site_configs.yaml")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_registry(config_yaml: str) -> ParserConfigRegistry:
+    """
+    Parse and validate a configuration, once per distinct file content.
+
+    Keying the cache on the content rather than the path means an edited file
+    is parsed again, while re-reading an unchanged file costs only the read.
+
+    Args:
+        config_yaml: Content of the configuration file
+
+    Returns:
+        ParserConfigRegistry containing all site configurations
+    """
+    config_data = yaml.load(config_yaml, Loader=ConfigLoader)
+    return ParserConfigRegistry(**config_data)
+
 
 class ConfigManager:
     """
@@ -35,6 +63,9 @@ class ConfigManager:
         """
         Load site configuration registry from YAML.
 
+        The parsed registry is shared by every ConfigManager loading the same
+        configuration, so the YAML is only parsed and validated once.
+
         Args:
             config_path: Optional path to a custom configuration file.
                          If not provided, the default configuration file is used.
@@ -47,15 +78,12 @@ class ConfigManager:
             yaml.YAMLError: If the YAML is invalid
             ValueError: If the configuration is invalid
         """
-        # Default config path is in the same directory as this file
         if not config_path:
-            config_dir = os.path.dirname(os.path.abspath(__file__))
-            config_path = os.path.join(config_dir, "site_configs.yaml")
+            config_path = DEFAULT_CONFIG_PATH
 
         try:
             with open(config_path, encoding="utf-8") as file:
-                config_data = yaml.safe_load(file)
-                return ParserConfigRegistry(**config_data)
+                return _parse_config_registry(file.read())
         except FileNotFoundError:
             self.logger.error(f"Configuration file not found: {config_path}")
             raise
@@ -70,6 +98,9 @@ class ConfigManager:
         """
         Get configuration for a specific site.
 
+        The configuration is a copy, so callers can adjust it, e.g. with command
+        line overrides, without affecting the shared registry.
+
         Args:
             site: Site identifier to get configuration for
 
@@ -82,7 +113,7 @@ class ConfigManager:
         if site not in self._config_registry.sites:
             raise ValueError(f"Site '{site}' not found in configuration")
 
-        return self._config_registry.sites[site]
+        return self._config_registry.sites[site].model_copy(deep=True)
 
     def list_available_sites(self) -> list[str]:
         """
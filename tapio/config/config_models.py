@@ -5,12 +5,27 @@ site-specific HTML parsing, including content selectors and HTML-to-Markdown
 conversion settings.
 """
 
+import functools
 from typing import Annotated, Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
+from lxml import etree
 from pydantic import BaseModel, Field, HttpUrl
 
 
+@functools.lru_cache(maxsize=64)
+def compile_xpath(selector: str) -> etree.XPath:
+    """Compile an XPath selector once per process.
+
+    Args:
+        selector: XPath expression
+
+    Returns:
+        The compiled XPath
+    """
+    return etree.XPath(selector)
+
+
 class HtmlToMarkdownConfig(BaseModel):
     """Configuration settings for HTML to Markdown conversion.
 
@@ -65,8 +80,9 @@ class ParserConfig(BaseModel):
         Returns:
             The first matching element or None if no match is found
         """
+        # The selectors are tried in order of priority, so they are not combined into one union
         for selector in self.content_selectors:
-            elements = tree.xpath(selector)
+            elements = compile_xpath(selector)(tree)
             if elements:
                 return elements[0]
         return None
@@ -94,7 +110,7 @@ class SiteConfig(BaseModel):
             Domain name without protocol prefix (e.g., 'migri.fi')
         """
         url_str = str(self.base_url)
-        parsed = urlparse(url_str)
+        parsed = urlsplit(url_str)
         # Use hostname to strip any port, and ensure a non-empty result
         host = parsed.hostname
         if not host:
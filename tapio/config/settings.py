@@ -5,14 +5,23 @@ components of the migri-assistant application, including default directories
 for storing crawled and parsed content.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 DEFAULT_CONTENT_DIR = "content"
 
-# Default directory paths
-DEFAULT_DIRS = {
-    "CRAWLED_DIR": "crawled",
-    "PARSED_DIR": "parsed",
-    "CHROMA_DIR": "chroma_db",
-}
+# Default directory paths, read-only so no caller can change them for the
+# rest of the process
+DEFAULT_DIRS: Mapping[str, str] = MappingProxyType(
+    {
+        "CRAWLED_DIR": "crawled",
+        "PARSED_DIR": "parsed",
+        "CHROMA_DIR": "chroma_db",
+    },
+)
 
 DEFAULT_CHROMA_COLLECTION = "tapio_knowledge"
+# Markdown files embedded and written to ChromaDB per add call. Larger batches
+# amortize the SQLite commit and HNSW index update over more chunks.
+DEFAULT_VECTORIZE_BATCH_SIZE = 256
 DEFAULT_CRAWLER_TIMEOUT = 30
@@ -1,17 +1,112 @@
 import asyncio
-import json
+import contextlib
+import hashlib
+import inspect
 import logging
 import os
+import re
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import TypedDict
-from urllib.parse import urljoin, urlparse
+from typing import BinaryIO, TypedDict
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree, html
 
 from tapio.config.config_models import SiteConfig
 from tapio.config.settings import DEFAULT_CONTENT_DIR, DEFAULT_CRAWLER_TIMEOUT, DEFAULT_DIRS
 
+# Query parameters that only track where a visitor came from and never change
+# the page content. Parameters starting with "utm_" are dropped as well.
+TRACKING_QUERY_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "yclid"})
+
+# Ports implied by the URL scheme, dropped from the canonical form
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+# Link extraction only needs the href attributes, so the page is parsed with
+# lxml and the anchors are selected with a precompiled XPath expression
+_LINK_PARSER = html.HTMLParser(encoding="utf-8")
+_HREF_XPATH = etree.XPath("//a/@href")
+
+# Links that are already absolute, which urljoin would return as they are
+_ABSOLUTE_HREF_PREFIXES = ("http://", "https://")
+
+# Links that can never lead to a crawlable page: in-page fragments and
+# non-HTTP schemes. Matched on the raw href before any URL parsing.
+_SKIP_HREF_RE = re.compile(r"\s*(?:#|mailto:|tel:|javascript:|data:)", re.IGNORECASE)
+
+# File extensions of linked resources that are not HTML pages. Following them
+# would cost a full download only to be skipped by the content type check.
+NON_HTML_EXTENSIONS = (
+    ".pdf",
+    ".doc",
+    ".docx",
+    ".xls",
+    ".xlsx",
+    ".ppt",
+    ".pptx",
+    ".odt",
+    ".csv",
+    ".zip",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".svg",
+    ".webp",
+    ".ico",
+    ".css",
+    ".js",
+    ".mp3",
+    ".mp4",
+    ".woff",
+    ".woff2",
+)
+
+# Query string characters replaced with underscores in saved file names
+_QUERY_FILENAME_TABLE = str.maketrans("=&", "__")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Reduce a URL to a canonical form for duplicate detection.
+
+    The scheme and host are lowercased, default ports and the fragment are
+    dropped, an empty path becomes "/" and tracking query parameters are
+    removed. Other query parameters keep their order.
+
+    Args:
+        url: Absolute URL to canonicalize.
+
+    Returns:
+        The canonical URL.
+
+    Raises:
+        ValueError: If the URL cannot be parsed.
+    """
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    default_port = _DEFAULT_PORTS.get(parts.scheme)
+    if default_port:
+        netloc = netloc.removesuffix(default_port)
+    path = parts.path or "/"
+
+    query = parts.query
+    if query:
+        params = parse_qsl(query, keep_blank_values=True)
+        kept = [(key, value) for key, value in params if not _is_tracking_param(key)]
+        if len(kept) != len(params):
+            query = urlencode(kept)
+
+    return urlunsplit((parts.scheme, netloc, path, query, ""))
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Check whether a query parameter name is a known tracking parameter."""
+    key = key.lower()
+    return key.startswith("utm_") or key in TRACKING_QUERY_PARAMS
+
 
 class UrlMappingData(TypedDict):
     """Type definition for URL mapping data."""
@@ -22,10 +117,13 @@ class UrlMappingData(TypedDict):
 
 
 class CrawlResult(TypedDict):
-    """Type definition for crawl result data."""
+    """Type definition for crawl result data.
+
+    The page content itself is not included, it is read from file_path when needed.
+    """
 
     url: str
-    html: str
+    file_path: str
     depth: int
     crawl_timestamp: str
     content_type: str
@@ -33,12 +131,15 @@ class CrawlResult(TypedDict):
 
 class BaseCrawler:
     """
-    Base crawler implementation for web scraping using httpx and BeautifulSoup.
+    Base crawler implementation for web scraping using httpx and lxml.
 
     This crawler is responsible for fetching web pages, storing their content,
     and following links up to a specified depth using async/await patterns.
     """
 
+    # Number of journaled URL mappings buffered before flushing to disk
+    JOURNAL_FLUSH_INTERVAL = 100
+
     def __init__(
         self,
         site_name: str,
@@ -56,11 +157,15 @@ class BaseCrawler:
 
         # Extract configuration values from site_config
         base_url_str = str(site_config.base_url)
-        self.start_urls = [base_url_str]
+        self.start_urls = [canonicalize_url(base_url_str)]
 
-        # Extract domain from base_url for allowed_domains
-        parsed_url = urlparse(base_url_str)
-        self.allowed_domains = [parsed_url.netloc] if parsed_url.netloc else []
+        # Extract domains from the start URLs for allowed_domains. The hostname is
+        # lowercased and free of port and credentials, so it is normalized once here.
+        # Duplicates are dropped while keeping the start URL order, and a frozenset
+        # copy serves the per-link membership checks.
+        hostnames = (urlsplit(start_url).hostname for start_url in self.start_urls)
+        self.allowed_domains = list(dict.fromkeys(hostname for hostname in hostnames if hostname))
+        self._allowed_hosts = frozenset(self.allowed_domains)
 
         # Use crawler config values
         self.max_depth = site_config.crawler_config.max_depth
@@ -73,27 +178,55 @@ class BaseCrawler:
         # Create output directory using centralized settings
         self.output_dir = os.path.join(DEFAULT_CONTENT_DIR, self.site_name, DEFAULT_DIRS["CRAWLED_DIR"])
         os.makedirs(self.output_dir, exist_ok=True)
+        self._abs_output_dir = os.path.abspath(self.output_dir)
+
+        # Directories known to exist, to skip repeated os.makedirs calls when saving pages
+        self._created_dirs: set[str] = {self.output_dir}
 
         # Track visited URLs to avoid duplicates
         self.visited_urls: set[str] = set()
 
+        # Content digest -> path of the first page saved with that content
+        self._content_hashes: dict[bytes, str] = {}
+
+        # Number of pages crawled, kept even when results are not collected
+        self.pages_crawled = 0
+
         # URL mapping dictionary to store file path -> original URL mappings
         self.url_mappings: dict[str, UrlMappingData] = {}
 
         # Path for the URL mapping file
         self.mapping_file = os.path.join(self.output_dir, "url_mappings.json")
 
+        # Append-only JSON Lines journal of mappings recorded during a crawl
+        self.journal_file = os.path.join(self.output_dir, "url_mappings.jsonl")
+        self._journal: BinaryIO | None = None
+        self._journal_unflushed = 0
+        # Whether a crawl is running, during which the journal is kept open once created
+        self._journaling = False
+
+        # Whether url_mappings has changed since it was last written to the mapping file
+        self._mappings_dirty = False
+
         # Semaphore will be created in async context
         self._semaphore: asyncio.Semaphore | None = None
 
-        # Load existing mappings if they exist
-        if os.path.exists(self.mapping_file):
-            try:
-                with open(self.mapping_file, encoding="utf-8") as f:
-                    self.url_mappings = json.load(f)
-                logging.info(f"Loaded {len(self.url_mappings)} existing URL mappings")
-            except Exception as e:
-                logging.error(f"Error loading URL mappings: {str(e)}")
+        # Optional callback invoked for every crawled page
+        self._on_page: Callable[[CrawlResult], Awaitable[None] | None] | None = None
+
+        # Load existing mappings if they exist. Opening directly instead of checking
+        # for the file first saves a stat call and cannot race with its removal.
+        try:
+            with open(self.mapping_file, "rb") as f:
+                self.url_mappings = orjson.loads(f.read())
+            logging.info(f"Loaded {len(self.url_mappings)} existing URL mappings")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"Error loading URL mappings: {str(e)}")
+
+        # Recover mappings journaled by a crawl that did not finish
+        self._load_url_mapping_journal()
 
         logging.info(
             f"Starting crawler for site '{site_name}' with max depth {self.max_depth}",
@@ -109,28 +242,47 @@ class BaseCrawler:
             self._semaphore = asyncio.Semaphore(self.max_concurrent)
         return self._semaphore
 
-    async def crawl(self) -> list[CrawlResult]:
+    async def crawl(
+        self,
+        on_page: Callable[[CrawlResult], Awaitable[None] | None] | None = None,
+        collect_results: bool = True,
+    ) -> list[CrawlResult]:
         """
         Start the crawling process and return the results.
 
+        Args:
+            on_page: Optional callback invoked with each page as soon as it has been crawled,
+                e.g. to report progress. It runs on the event loop, so it must not block;
+                a coroutine function is awaited, which lets it wait without stalling other requests.
+            collect_results: Whether to keep every page in the returned list. Callers that
+                consume pages through on_page can disable this to keep memory use flat.
+
         Returns:
-            List of CrawlResult dictionaries containing page data.
+            List of CrawlResult dictionaries containing page data, empty when
+            collect_results is False.
         """
         results: list[CrawlResult] = []
+        sink = results if collect_results else None
+        self._on_page = on_page
 
         # Use a timeout for the entire client session
         timeout = httpx.Timeout(self.timeout)
 
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            # Create initial tasks for all starting URLs
-            tasks = [self._crawl_url(client, url, 0, results) for url in self.start_urls]
-
-            # Process all tasks
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Save final URL mappings
-        self._save_url_mappings()
-        logging.info(f"Crawling completed. Processed {len(results)} pages.")
+        self._open_journal()
+        try:
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                # Create initial tasks for all starting URLs
+                tasks = [self._crawl_url(client, url, 0, sink) for url in self.start_urls]
+
+                # Process all tasks
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Save final URL mappings, also when the crawl is interrupted. The
+            # mapping file is only rewritten when the crawl changed it.
+            self._close_journal()
+            if self._mappings_dirty:
+                self._save_url_mappings()
+        logging.info(f"Crawling completed. Processed {self.pages_crawled} pages.")
 
         return results
 
@@ -139,7 +291,7 @@ class BaseCrawler:
         client: httpx.AsyncClient,
         url: str,
         current_depth: int,
-        results: list[CrawlResult],
+        results: list[CrawlResult] | None,
     ) -> None:
         """
         Crawl a single URL and recursively crawl linked pages.
@@ -148,7 +300,7 @@ class BaseCrawler:
             client: httpx async client for making requests.
             url: URL to crawl.
             current_depth: Current crawling depth.
-            results: List to append crawl results to.
+            results: List to append crawl results to, or None to not collect them.
         """
         # Check if URL was already visited
         if url in self.visited_urls:
@@ -185,37 +337,58 @@ class BaseCrawler:
                     logging.info(f"Skipping non-HTML content type '{content_type}' at {url}")
                     return
 
-                # Parse HTML content
-                html_content = response.text
-                soup = BeautifulSoup(html_content, "lxml")
-
-                # Save the HTML content and store URL mapping
-                file_path = self._save_html_content(url, html_content)
-                rel_path = os.path.relpath(file_path, self.output_dir)
-
-                self.url_mappings[rel_path] = UrlMappingData(
-                    url=url,
-                    timestamp=datetime.now().isoformat(),
-                    content_type=content_type,
-                )
+                # The page is only kept as UTF-8 bytes, which are saved, hashed and
+                # parsed for links without encoding the decoded text again
+                html_bytes = response.text.encode("utf-8")
+
+                # One timestamp for both the mapping and the crawl result
+                crawled_at = datetime.now().isoformat()
+
+                # Pages with the same content as an already saved page, e.g. the same
+                # page served under an alias URL, are not written or mapped again
+                content_hash = hashlib.blake2b(html_bytes, digest_size=16).digest()
+                duplicate_of = self._content_hashes.get(content_hash)
+                if duplicate_of is not None:
+                    logging.info(f"Skipping duplicate content at {url}, already saved as {duplicate_of}")
+                    file_path = duplicate_of
+                else:
+                    # Save the HTML content in a worker thread, so the event loop keeps
+                    # serving the other requests while the file is written
+                    file_path = await asyncio.to_thread(self._save_html_content, url, html_bytes)
+                    rel_path = os.path.relpath(file_path, self.output_dir)
+                    self._content_hashes[content_hash] = file_path
+
+                    mapping = UrlMappingData(
+                        url=url,
+                        timestamp=crawled_at,
+                        content_type=content_type,
+                    )
+                    self.url_mappings[rel_path] = mapping
+                    self._mappings_dirty = True
+
+                    # Journal the mapping instead of rewriting the whole mapping file
+                    self._append_url_mapping(rel_path, mapping)
 
                 # Create crawl result
                 crawl_result: CrawlResult = {
                     "url": url,
-                    "html": html_content,
+                    "file_path": file_path,
                     "depth": current_depth,
-                    "crawl_timestamp": datetime.now().isoformat(),
+                    "crawl_timestamp": crawled_at,
                     "content_type": content_type,
                 }
-                results.append(crawl_result)
-
-                # Save URL mappings periodically
-                self._save_url_mappings()
+                self.pages_crawled += 1
+                if results is not None:
+                    results.append(crawl_result)
+                if self._on_page is not None:
+                    page_handled = self._on_page(crawl_result)
+                    if inspect.isawaitable(page_handled):
+                        await page_handled
 
                 # Extract links for following if we haven't reached max depth
                 links_to_follow = []
                 if current_depth < self.max_depth:
-                    links = self._extract_links(soup, url)
+                    links = self._extract_links(html_bytes, url)
                     links_to_follow = [link for link in links if link not in self.visited_urls]
 
             except httpx.HTTPStatusError as e:
@@ -244,19 +417,35 @@ class BaseCrawler:
         Returns:
             True if the URL domain is allowed, False otherwise.
         """
-        if not self.allowed_domains:
+        try:
+            hostname = urlsplit(url).hostname
+        except ValueError:
+            return False
+
+        return self._is_allowed_host(hostname)
+
+    def _is_allowed_host(self, hostname: str | None) -> bool:
+        """
+        Check if an already parsed host name belongs to an allowed domain.
+
+        Args:
+            hostname: Lowercased host name of a URL, as given by urlsplit.
+
+        Returns:
+            True if the host is allowed, False otherwise.
+        """
+        if not self._allowed_hosts:
             return True
 
-        parsed_url = urlparse(url)
-        return parsed_url.netloc in self.allowed_domains
+        return hostname in self._allowed_hosts
 
-    def _save_html_content(self, url: str, html_content: str) -> str:
+    def _save_html_content(self, url: str, html_content: str | bytes) -> str:
         """
         Save the HTML content to a file.
 
         Args:
             url: The URL of the page.
-            html_content: The HTML content to save.
+            html_content: The HTML content to save, as text or UTF-8 encoded bytes.
 
         Returns:
             The absolute path to the saved file.
@@ -264,11 +453,18 @@ class BaseCrawler:
         # Convert the URL to a file path
         file_path = self._get_file_path_from_url(url)
 
-        # Create parent directories if needed
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        # Save the HTML content
-        with open(file_path, "w", encoding="utf-8") as f:
+        # Create parent directories if needed. Directories already created during
+        # this crawl are remembered, so most pages skip the makedirs syscalls.
+        parent_dir = os.path.dirname(file_path)
+        if parent_dir not in self._created_dirs:
+            os.makedirs(parent_dir, exist_ok=True)
+            self._created_dirs.add(parent_dir)
+
+        # Save the HTML content as UTF-8 in one binary write, skipping the text
+        # layer's incremental encoder and newline translation
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+        with open(file_path, "wb") as f:
             f.write(html_content)
 
         logging.info(f"Saved HTML content to {file_path}")
@@ -285,35 +481,22 @@ class BaseCrawler:
         Returns:
             The absolute path for saving the URL content.
         """
-        parsed_url = urlparse(url)
-        path = parsed_url.path
+        parsed_url = urlsplit(url)
 
-        # Handle empty path or just "/"
-        if not path or path == "/":
-            path = "index.html"
-        elif not path.endswith(".html"):
-            # Add .html extension if not present and remove trailing slash
-            path = path.rstrip("/") + ".html"
+        # Drop the trailing slash and any .html extension, so that the query can be
+        # added before the extension. An empty path or just "/" becomes the index page.
+        stem = parsed_url.path.rstrip("/").removesuffix(".html") or "index"
 
-        # Handle query parameters
+        # Add the query to the filename, sanitized in a single pass
         if parsed_url.query:
-            # Sanitize query string for filename
-            safe_query = parsed_url.query.replace("=", "_").replace("&", "_")
-            # Add query to filename (before extension)
-            if path.endswith(".html"):
-                path = path[:-5] + "_" + safe_query + ".html"
-            else:
-                path = path + "_" + safe_query + ".html"
+            stem = f"{stem}_{parsed_url.query.translate(_QUERY_FILENAME_TABLE)}"
 
         # Create full path with domain subdirectory for organization
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        full_path = os.path.join(self.output_dir, domain, path.lstrip("/"))
+        full_path = os.path.join(self.output_dir, parsed_url.netloc, f"{stem}.html".lstrip("/"))
 
         # Ensure the path stays within output_dir (security check for path traversal)
         abs_full_path = os.path.abspath(full_path)
-        abs_output_dir = os.path.abspath(self.output_dir)
-        if not abs_full_path.startswith(abs_output_dir):
+        if not abs_full_path.startswith(self._abs_output_dir):
             raise ValueError(f"Invalid URL results in path outside output directory: {url}")
 
         return full_path
@@ -323,48 +506,150 @@ class BaseCrawler:
         Save the URL mappings to a JSON file.
 
         This allows future reference of which file corresponds to which URL.
+        The mappings are written as compact JSON, which keeps large mapping
+        files small and quick to serialize. The file is written to a temporary
+        path and moved into place, so an interrupted save never leaves a
+        truncated mapping file behind. Once the full mapping file is written,
+        the crawl journal is no longer needed and is removed.
         """
         try:
-            with open(self.mapping_file, "w", encoding="utf-8") as f:
-                json.dump(self.url_mappings, f, indent=2, ensure_ascii=False)
+            data = orjson.dumps(self.url_mappings)
+            tmp_file = f"{self.mapping_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file, self.mapping_file)
+            self._mappings_dirty = False
             logging.debug(
                 f"Saved {len(self.url_mappings)} URL mappings to {self.mapping_file}",
             )
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.journal_file)
         except Exception as e:
             logging.error(f"Error saving URL mappings: {str(e)}")
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _append_url_mapping(self, rel_path: str, mapping: UrlMappingData) -> None:
+        """
+        Append a single URL mapping to the JSON Lines journal.
+
+        Each line is a self-contained JSON object, so a journal cut short by an
+        interrupted crawl is still readable up to its last complete line.
+
+        Args:
+            rel_path: Path of the saved HTML file relative to the output directory.
+            mapping: Mapping data for the file.
+        """
+        line = orjson.dumps({"path": rel_path, **mapping}) + b"\n"
+        try:
+            if self._journal is None:
+                if not self._journaling:
+                    with open(self.journal_file, "ab") as f:
+                        f.write(line)
+                    return
+                # Created on the first mapping, so a crawl that maps nothing new leaves no journal
+                self._journal = open(self.journal_file, "ab", buffering=1024 * 1024)
+                self._journal_unflushed = 0
+
+            self._journal.write(line)
+            self._journal_unflushed += 1
+            if self._journal_unflushed >= self.JOURNAL_FLUSH_INTERVAL:
+                self._journal.flush()
+                self._journal_unflushed = 0
+        except Exception as e:
+            logging.error(f"Error journaling URL mapping: {str(e)}")
+
+    def _open_journal(self) -> None:
+        """Keep the mapping journal open with a large write buffer for the duration of a crawl.
+
+        The journal file itself is only created when the first mapping is written.
+        """
+        self._journaling = True
+
+    def _close_journal(self) -> None:
+        """Flush any buffered journal lines and close the journal."""
+        self._journaling = False
+        if self._journal is None:
+            return
+        try:
+            self._journal.close()
+        except Exception as e:
+            logging.error(f"Error closing URL mapping journal: {str(e)}")
+        finally:
+            self._journal = None
+
+    def _load_url_mapping_journal(self) -> None:
+        """Merge mappings from the JSON Lines journal left by an unfinished crawl, if any."""
+        recovered = 0
+        try:
+            with open(self.journal_file, "rb") as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A partially written final line from an interrupted crawl
+                        continue
+                    rel_path = record.pop("path")
+                    self.url_mappings[rel_path] = record
+                    recovered += 1
+            # The recovered mappings are not in the mapping file yet
+            self._mappings_dirty = recovered > 0
+            logging.info(f"Recovered {recovered} URL mappings from {self.journal_file}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"Error loading URL mapping journal: {str(e)}")
+
+    def _extract_links(self, html_content: str | bytes, base_url: str) -> list[str]:
         """
-        Extract valid links to follow from a BeautifulSoup object.
+        Extract valid links to follow from an HTML page.
 
         Args:
-            soup: BeautifulSoup object of the parsed HTML.
+            html_content: HTML content of the page, as text or UTF-8 encoded bytes.
             base_url: Base URL for resolving relative links.
 
         Returns:
             A list of absolute URLs to follow.
         """
-        links = []
+        # The page is passed as UTF-8 bytes, since lxml rejects str input that
+        # carries an XML encoding declaration
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+        try:
+            document = html.document_fromstring(html_content, parser=_LINK_PARSER)
+        except (etree.ParserError, ValueError):
+            return []
 
-        # Extract all href attributes from anchor tags
-        for anchor in soup.find_all("a", href=True):
-            # Get href attribute - BeautifulSoup guarantees it exists due to href=True filter
-            href = anchor["href"]  # type: ignore[index]
+        # Keyed by canonical URL, so each page is returned once however it is linked
+        links: dict[str, None] = {}
 
-            # Skip if href is None or empty
-            if not href:
+        # Extract all href attributes from anchor tags
+        for href in _HREF_XPATH(document):
+            # Skip empty href attributes and links that cannot be pages
+            if not href or _SKIP_HREF_RE.match(href):
                 continue
 
-            # Convert to string (BeautifulSoup can return different types)
-            href = str(href)
+            # Convert relative URLs to absolute URLs; absolute ones need no urljoin
+            absolute_url = href if href.startswith(_ABSOLUTE_HREF_PREFIXES) else urljoin(base_url, href)
 
-            # Convert relative URLs to absolute URLs
-            absolute_url = urljoin(base_url, href)
+            # Filter out fragments
+            if "#" in absolute_url:
+                continue
+
+            # Canonicalize so that variants of one URL are visited only once, and
+            # parse it once for both the scheme and the domain check
+            try:
+                canonical_url = canonicalize_url(absolute_url)
+                parts = urlsplit(canonical_url)
+                hostname = parts.hostname
+            except ValueError:
+                continue
 
-            # Filter out non-http(s) schemes and fragments
-            if absolute_url.startswith(("http://", "https://")) and "#" not in absolute_url:
-                # Check if the domain is allowed
-                if self._is_allowed_domain(absolute_url):
-                    links.append(absolute_url)
+            # Filter out non-http(s) schemes, links outside the allowed domains and
+            # links to files that are not HTML pages
+            if (
+                parts.scheme in ("http", "https")
+                and self._is_allowed_host(hostname)
+                and not parts.path.lower().endswith(NON_HTML_EXTENSIONS)
+            ):
+                links[canonical_url] = None
 
-        return links
+        return list(links)
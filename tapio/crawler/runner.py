@@ -1,9 +1,42 @@
 import asyncio
 import logging
+import queue
+import threading
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from tapio.config.config_models import SiteConfig
 from tapio.crawler.crawler import BaseCrawler, CrawlResult
 
+try:
+    import uvloop  # type: ignore[import-not-found]
+
+    # uvloop.run was added in uvloop 0.18; older releases fall back to asyncio
+    HAS_UVLOOP = hasattr(uvloop, "run")
+except ImportError:  # uvloop is the optional "speedups" extra and not available on Windows
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def _run_event_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    The loop is a uvloop loop when uvloop 0.18 or newer is installed (the
+    "speedups" extra), which lowers the event loop overhead per request.
+
+    Args:
+        coroutine: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    if HAS_UVLOOP:
+        return uvloop.run(coroutine)
+    return asyncio.run(coroutine)
+
 
 class CrawlerRunner:
     """
@@ -15,25 +48,18 @@ class CrawlerRunner:
 
     def __init__(self) -> None:
         """
-        Initialize the crawler runner with logging configuration.
-        """
-        self.logger = logging.getLogger(__name__)
-        self.setup_logging()
+        Initialize the crawler runner.
 
-    def setup_logging(self) -> None:
+        Logging is configured by the application (see tapio.cli), not by the runner.
         """
-        Set up logging configuration for the crawler runner.
-        """
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[logging.StreamHandler()],
-        )
+        self.logger = logging.getLogger(__name__)
 
     async def run_async(
         self,
         site_name: str,
         site_config: SiteConfig,
+        on_page: Callable[[CrawlResult], Awaitable[None] | None] | None = None,
+        collect_results: bool = True,
     ) -> list[CrawlResult]:
         """
         Run the crawler asynchronously and return crawled page data.
@@ -41,6 +67,9 @@ class CrawlerRunner:
         Args:
             site_name: Name/identifier of the site being crawled.
             site_config: Site configuration containing all crawler settings.
+            on_page: Optional callback invoked with each page as soon as it has been crawled;
+                a coroutine function is awaited.
+            collect_results: Whether to collect all pages into the returned list.
 
         Returns:
             List of CrawlResult dictionaries containing page data.
@@ -51,26 +80,122 @@ class CrawlerRunner:
         crawler = BaseCrawler(site_name, site_config)
 
         # Run the crawler
-        results = await crawler.crawl()
+        results = await crawler.crawl(on_page=on_page, collect_results=collect_results)
 
-        self.logger.info(f"Async crawling completed. Processed {len(results)} items.")
+        self.logger.info(f"Async crawling completed. Processed {crawler.pages_crawled} items.")
         return results
 
     def run(
         self,
         site_name: str,
         site_config: SiteConfig,
+        on_page: Callable[[CrawlResult], Awaitable[None] | None] | None = None,
+        collect_results: bool = True,
     ) -> list[CrawlResult]:
         """
         Run the crawler synchronously and return crawled page data.
 
-        This is a convenience method that wraps the async version.
+        This is a convenience method that wraps the async version. The crawl runs on
+        uvloop when it is installed.
 
         Args:
             site_name: Name/identifier of the site being crawled.
             site_config: Site configuration containing all crawler settings.
+            on_page: Optional callback invoked with each page as soon as it has been crawled;
+                a coroutine function is awaited.
+            collect_results: Whether to collect all pages into the returned list.
 
         Returns:
             List of CrawlResult dictionaries containing page data.
         """
-        return asyncio.run(self.run_async(site_name, site_config))
+        return _run_event_loop(
+            self.run_async(site_name, site_config, on_page=on_page, collect_results=collect_results),
+        )
+
+    def iter_pages(
+        self,
+        site_name: str,
+        site_config: SiteConfig,
+        max_buffered: int = 1000,
+    ) -> Iterator[CrawlResult]:
+        """
+        Crawl in a background thread and yield pages as soon as they are crawled.
+
+        Pages pass through a bounded queue, so memory use stays flat however large
+        the crawl is, and a slow consumer throttles the crawler instead of letting
+        pages pile up. A full queue is waited on in a separate thread, so only the
+        crawl tasks handing over pages wait, while the event loop keeps serving the
+        other requests. Closing the iterator early cancels the crawl; the URL
+        mappings gathered so far are still saved.
+
+        Args:
+            site_name: Name/identifier of the site being crawled.
+            site_config: Site configuration containing all crawler settings.
+            max_buffered: Maximum number of crawled pages waiting to be consumed.
+
+        Yields:
+            CrawlResult dictionaries in the order the pages were crawled.
+
+        Raises:
+            Exception: Any error that stopped the crawl is re-raised here.
+        """
+        # None marks the end of the crawl
+        pages: queue.Queue[CrawlResult | None] = queue.Queue(maxsize=max_buffered)
+        errors: list[BaseException] = []
+        crawl_tasks: list[asyncio.Task[Any]] = []
+        cancelled = threading.Event()
+        # A single thread hands the pages over in crawl order, blocking on the queue
+        # in place of the event loop
+        put_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"crawler-{site_name}-pages")
+
+        async def put_page(page: CrawlResult) -> None:
+            await asyncio.get_running_loop().run_in_executor(put_executor, pages.put, page)
+
+        async def crawl() -> None:
+            task = asyncio.current_task()
+            if task is not None:
+                crawl_tasks.append(task)
+            # The consumer may have closed before the task was registered for cancellation
+            if cancelled.is_set():
+                return
+            await self.run_async(site_name, site_config, on_page=put_page, collect_results=False)
+
+        def worker() -> None:
+            try:
+                _run_event_loop(crawl())
+            except BaseException as e:
+                if not cancelled.is_set():
+                    errors.append(e)
+            finally:
+                # Let a hand-over still waiting on the queue finish before the end marker
+                put_executor.shutdown(wait=True)
+                pages.put(None)
+
+        thread = threading.Thread(target=worker, name=f"crawler-{site_name}", daemon=True)
+        thread.start()
+        finished = False
+        try:
+            while (page := pages.get()) is not None:
+                yield page
+            finished = True
+        finally:
+            if not finished:
+                # Cancel the crawl, and drain the queue so that a crawler blocked on a
+                # full queue gets to process the cancellation
+                cancelled.set()
+                for task in crawl_tasks:
+                    loop = task.get_loop()
+                    # A crawl that has already finished has nothing to cancel, and its loop may be closed
+                    if task.done() or loop.is_closed():
+                        continue
+                    try:
+                        loop.call_soon_threadsafe(task.cancel)
+                    except RuntimeError:
+                        # The loop closed after the check above
+                        pass
+                while pages.get() is not None:
+                    pass
+            thread.join()
+
+        if errors:
+            raise errors[0]
@@ -1,4 +1,5 @@
 # This file initializes the models module.
 from tapio.models.document import Document
+from tapio.models.parse_result import ParseResult
 
-__all__ = ["Document"]
+__all__ = ["Document", "ParseResult"]
@@ -1,8 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
 class Document:
-    def __init__(self, url: str, content: str, metadata: dict):
-        self.url = url
-        self.content = content
-        self.metadata = metadata
+    url: str
+    content: str
+    metadata: dict
 
     def to_dict(self) -> dict[str, str | dict]:
         return {
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ParseResult:
+    source_file: str
+    output_file: str
+    title: str
+    domain: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "source_file": self.source_file,
+            "output_file": self.output_file,
+            "title": self.title,
+            "domain": self.domain,
+        }
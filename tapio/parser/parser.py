@@ -4,23 +4,102 @@ This module contains the Parser class, which loads site-specific
 configurations and extracts content from HTML pages accordingly.
 """
 
-import json
+import contextlib
+import hashlib
 import logging
 import os
+import threading
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
 
 import html2text
+import orjson
 import yaml
-from lxml import html
+from lxml import etree, html
 
 from tapio.config import (
     ConfigManager,
     settings,
 )
-from tapio.config.config_models import SiteConfig
+from tapio.config.config_models import SiteConfig, compile_xpath
+from tapio.models.parse_result import ParseResult
+
+try:
+    # libyaml's C emitter is many times faster than PyYAML's pure-Python one
+    from yaml import CSafeDumper as FrontmatterDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as FrontmatterDumper  # type: ignore[assignment]
+
+# Elements with links to make absolute, including the element the search starts from
+_LINK_ELEMENTS_XPATH = etree.XPath("descendant-or-self::*[@href or @src]")
+_BODY_XPATH = etree.XPath("//body")
+
+# Prefixes of links that are already absolute or must not be resolved
+_HREF_ABSOLUTE_PREFIXES = ("http://", "https://", "//", "mailto:", "#", "tel:")
+_SRC_ABSOLUTE_PREFIXES = ("http://", "https://", "//", "data:")
+
+# Metadata keys written by _create_metadata, which are safe to emit as plain YAML keys
+_FRONTMATTER_KEYS = frozenset({"domain", "parse_timestamp", "parser", "source_file", "source_url", "title"})
+
+# Characters that JSON leaves as they are but YAML treats as line breaks or does
+# not allow unescaped: C1 controls, line and paragraph separators, BOM and non-characters
+_YAML_EXTRA_ESCAPES = {code: f"\\u{code:04x}" for code in (*range(0x7F, 0xA0), 0x2028, 0x2029, 0xFEFF, 0xFFFE, 0xFFFF)}
+
+
+def _dump_frontmatter(metadata: dict[str, Any]) -> str:
+    """
+    Serialize metadata as YAML frontmatter.
+
+    The metadata written by the parser is a few known keys with string values,
+    which are written directly as double-quoted YAML scalars. A JSON string is a
+    valid YAML double-quoted scalar once the characters YAML treats differently
+    are escaped too. Any other metadata goes through PyYAML. Keys are sorted,
+    as yaml.dump does.
+
+    Args:
+        metadata: Dictionary of metadata
+
+    Returns:
+        The YAML document, without the surrounding --- lines
+    """
+    if metadata.keys() <= _FRONTMATTER_KEYS and all(isinstance(value, str) for value in metadata.values()):
+        try:
+            return "".join(
+                f"{key}: {orjson.dumps(metadata[key]).decode('utf-8').translate(_YAML_EXTRA_ESCAPES)}\n"
+                for key in sorted(metadata)
+            )
+        except orjson.JSONEncodeError:
+            # Strings that are not valid Unicode, such as undecodable file names
+            pass
+    return yaml.dump(metadata, Dumper=FrontmatterDumper, default_flow_style=False)
+
+
+# lxml parsers must not be shared between threads, so each thread gets its own
+_html_parsers = threading.local()
+
+
+def _get_html_parser() -> html.HTMLParser:
+    """
+    Get this thread's HTML parser.
+
+    Files are decoded as UTF-8 by libxml2, with undecodable bytes replaced, so
+    their content never has to be decoded into a Python string. Comments and
+    processing instructions are dropped, and no ID index is built, as none of
+    them are used when extracting content.
+
+    Returns:
+        The HTML parser
+    """
+    parser = getattr(_html_parsers, "parser", None)
+    if parser is None:
+        parser = html.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True, collect_ids=False)
+        _html_parsers.parser = parser
+    return parser
 
 
 class DirectoryScope:
@@ -71,6 +150,15 @@ class Parser:
     content using the appropriate selectors for each site.
     """
 
+    # Number of files read ahead in the background while parsing in-process
+    PREFETCH_FILES = 16
+
+    # Number of parsed files between progress messages
+    PROGRESS_INTERVAL = 500
+
+    # Results of the last run, kept in the output directory so unchanged files can be skipped
+    RESULTS_FILE = "parse_results.json"
+
     def __init__(
         self,
         site_name: str,
@@ -90,159 +178,225 @@ class Parser:
         self.config = config_manager.get_site_config(site_name)
 
         self.current_base_url: str | None = None  # Will store the base URL of the current document
+        self._run_timestamp: str | None = None  # Shared parse timestamp while parse_all runs
+        # Results by content hash while parse_all runs, so duplicate pages are parsed once
+        self._content_hashes: dict[bytes, ParseResult] | None = None
 
         # Use standard directory structure based on site name
         self.input_dir = os.path.join(settings.DEFAULT_CONTENT_DIR, site_name, settings.DEFAULT_DIRS["CRAWLED_DIR"])
         self.output_dir = os.path.join(settings.DEFAULT_CONTENT_DIR, site_name, settings.DEFAULT_DIRS["PARSED_DIR"])
+        # Absolute input directory with a trailing separator, so relative paths are a slice
+        self._input_prefix = os.path.join(os.path.abspath(self.input_dir), "")
 
-        self.setup_logging()
+        # Logging is configured by the application (see tapio.cli), not by each parser
         self.logger = logging.getLogger(__name__)
 
-        # Load URL mappings if available
-        self.url_mappings: dict[str, dict[str, str]] = {}
+        # Load URL mappings if available; assigning url_mappings also builds its lookup indexes
+        self.url_mappings = {}
         self._load_url_mappings()
 
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
+        # Output directories known to exist, so each is only created once
+        self._created_dirs: set[str] = {self.output_dir}
 
         self.logger.info(f"Initialized Parser for {self.site}")
 
-    def setup_logging(self) -> None:
-        """Set up logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[logging.StreamHandler()],
-        )
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the parser state for pickling, without the logger."""
+        state = self.__dict__.copy()
+        # Loggers are per process, and tests may replace the logger with a mock
+        state.pop("logger", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the parser state in another process and re-acquire the logger."""
+        self.__dict__.update(state)
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def url_mappings(self) -> dict[str, dict[str, str]]:
+        """URL mappings from crawled file paths to their original URLs and metadata."""
+        return self._url_mappings
+
+    @url_mappings.setter
+    def url_mappings(self, url_mappings: dict[str, dict[str, str]]) -> None:
+        self._url_mappings = url_mappings
+        self._build_url_mapping_indexes()
 
     def _load_url_mappings(self) -> None:
-        """Load URL mappings from the JSON file"""
+        """Load URL mappings from the JSON file and any crawl journal
+
+        Mapping files from large crawls run to tens of megabytes, so they are read
+        as bytes and decoded with orjson rather than the standard library parser.
+        """
         mapping_file = os.path.join(self.input_dir, "url_mappings.json")
-        if os.path.exists(mapping_file):
-            try:
-                with open(mapping_file, encoding="utf-8") as f:
-                    self.url_mappings = json.load(f)
-                self.logger.info(f"Loaded {len(self.url_mappings)} URL mappings")
-            except Exception as e:
-                self.logger.error(f"Error loading URL mappings: {str(e)}")
-        else:
+        journal_file = os.path.join(self.input_dir, "url_mappings.jsonl")
+        mapping_found = True
+        try:
+            with open(mapping_file, "rb") as f:
+                self._url_mappings = orjson.loads(f.read())
+            self.logger.info(f"Loaded {len(self.url_mappings)} URL mappings")
+        except FileNotFoundError:
+            mapping_found = False
+        except Exception as e:
+            self.logger.error(f"Error loading URL mappings: {str(e)}")
+
+        # A crawl that did not finish leaves its mappings in the append-only journal
+        journal_found = self._load_url_mapping_journal(journal_file)
+
+        if not mapping_found and not journal_found:
             self.logger.warning(f"URL mapping file not found: {mapping_file}")
             # Still continue processing - URL mappings are optional
 
-    def _get_original_url(self, file_path: str | Path) -> str | None:
+        self._build_url_mapping_indexes()
+
+    def _load_url_mapping_journal(self, journal_file: str) -> bool:
         """
-        Get the original URL for a file path from the URL mappings.
+        Merge URL mappings from a crawler's JSON Lines journal.
 
         Args:
-            file_path: Path to the HTML file
+            journal_file: Path to the url_mappings.jsonl journal
 
         Returns:
-            Original URL or None if not found
+            False if there is no journal, True otherwise
         """
-        file_path_str = str(file_path)
-
-        # Try different lookup strategies
-        url = (
-            self._try_exact_match(file_path_str)
-            or self._try_relative_path_match(file_path_str)
-            or self._try_filename_match(file_path_str)
-        )
-
-        if not url:
-            self.logger.debug(f"No URL mapping found for {file_path}")
-        return url
+        recovered = 0
+        try:
+            with open(journal_file, "rb") as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A partially written final line from an interrupted crawl
+                        continue
+                    self.url_mappings[record.pop("path")] = record
+                    recovered += 1
+            self.logger.info(f"Loaded {recovered} URL mappings from crawl journal")
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.error(f"Error loading URL mapping journal: {str(e)}")
+        return True
 
-    def _try_exact_match(self, file_path_str: str) -> str | None:
+    def _get_relative_path(self, file_path: str | Path) -> str | None:
         """
-        Try exact match in URL mappings.
+        Get the path of a file relative to the input directory, with forward slashes.
+
+        The input directory is fixed, so the relative path is sliced off the
+        absolute path rather than computed by os.path.relpath for every file.
 
         Args:
-            file_path_str: String representation of the file path
+            file_path: Path to the file
 
         Returns:
-            Original URL or None if not found
+            The relative path, or None if the file is not inside the input directory
         """
-        for key, value in self.url_mappings.items():
-            if file_path_str.endswith(key):
-                return value.get("url")
-        return None
+        abs_path = os.path.abspath(file_path)
+        if not abs_path.startswith(self._input_prefix):
+            return None
+        rel_path = abs_path[len(self._input_prefix) :]
+        return rel_path.replace(os.sep, "/") if os.sep != "/" else rel_path
 
-    def _try_relative_path_match(self, file_path_str: str) -> str | None:
+    def _get_original_url(self, file_path: str | Path, rel_path: str | None = None) -> str | None:
         """
-        Try relative path matching with OS compatibility.
+        Get the original URL for a file path from the URL mappings.
+
+        The path is looked up by its path relative to the input directory, then by
+        its trailing path components and finally by its filename alone.
 
         Args:
-            file_path_str: String representation of the file path
+            file_path: Path to the HTML file
+            rel_path: Path relative to the input directory if already computed
 
         Returns:
             Original URL or None if not found
         """
-        try:
-            rel_path = os.path.relpath(file_path_str, self.input_dir)
-            # Check both slash directions
-            for path_variant in [rel_path, rel_path.replace("\\", "/")]:
-                if path_variant in self.url_mappings:
-                    return self.url_mappings[path_variant].get("url")
-        except Exception as e:
-            self.logger.debug(f"Error in relative path matching: {e}")
-        return None
+        path_index, filename_index = self._url_mapping_indexes
+        parts = str(file_path).replace("\\", "/").split("/")
 
-    def _try_filename_match(self, file_path_str: str) -> str | None:
-        """
-        Try matching by filename only.
+        if rel_path is None:
+            rel_path = self._get_relative_path(file_path)
+        url = path_index.get(rel_path) if rel_path is not None else None
 
-        Args:
-            file_path_str: String representation of the file path
+        # Fall back to the longest trailing part of the path that has a mapping
+        if url is None:
+            for i in range(1, len(parts)):
+                url = path_index.get("/".join(parts[i:]))
+                if url is not None:
+                    break
 
-        Returns:
-            Original URL or None if not found
+        if url is None:
+            url = filename_index.get(parts[-1])
+
+        if not url:
+            self.logger.debug("No URL mapping found for %s", file_path)
+        return url
+
+    def _build_url_mapping_indexes(self) -> None:
         """
-        try:
-            filename = os.path.basename(file_path_str)
-            for key, value in self.url_mappings.items():
-                if key.endswith(filename):
-                    return value.get("url")
-        except Exception as e:
-            self.logger.debug(f"Error in filename matching: {e}")
-        return None
+        Build the lookup indexes over the URL mappings.
+
+        The indexes are a relative path -> URL index and a filename -> URL index.
+        When several mappings share a filename, the first one loaded wins. They are
+        rebuilt whenever url_mappings is assigned, but not when it is changed in place.
+        """
+        path_index: dict[str, str] = {}
+        filename_index: dict[str, str] = {}
+        for key, value in self._url_mappings.items():
+            url = value.get("url")
+            if not url:
+                continue
+            normalized_key = key.replace("\\", "/")
+            path_index.setdefault(normalized_key, url)
+            filename_index.setdefault(normalized_key.rsplit("/", 1)[-1], url)
+        self._url_mapping_indexes = (path_index, filename_index)
 
     # The _load_site_config and _load_config_registry methods have been replaced
     # by using the ConfigManager from tapio.config
 
-    def _parse_html(self, html_content: str) -> tuple[str, str]:
+    def _parse_html(self, html_content: str | bytes) -> tuple[str, str]:
         """
         Parse HTML content using site-specific selectors.
 
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content, either text or the UTF-8 bytes of the file
 
         Returns:
             Tuple containing (title, content)
         """
         try:
             # Parse the HTML content
-            tree = html.fromstring(html_content)
+            tree = html.fromstring(html_content, parser=_get_html_parser())
 
             # Extract the title using the configured selector
-            title_elements = tree.xpath(self.config.parser_config.title_selector)
+            title_elements = compile_xpath(self.config.parser_config.title_selector)(tree)
             title = title_elements[0].text if title_elements else "Untitled"
 
             # Find content using the configured selectors
             content_section = self.config.parser_config.get_content_selector(tree)
 
-            # Prepare HTML content for conversion
+            # Prepare HTML content for conversion. Links are made absolute on the
+            # already parsed element, so its HTML is serialized once and not re-parsed
             if content_section is not None:
                 # Get the HTML of just this element
+                self._make_links_absolute(content_section)
                 content_html = html.tostring(
                     content_section,
                     encoding="unicode",
                     pretty_print=True,
                 )
-                self.logger.info("Successfully extracted content section")
+                self.logger.debug("Successfully extracted content section")
             elif self.config.parser_config.fallback_to_body:
                 # If no content section found and fallback is enabled, use the body
-                body = tree.xpath("//body")
-                content_html = html.tostring(body[0], encoding="unicode", pretty_print=True) if body else html_content
+                body = _BODY_XPATH(tree)
+                if body:
+                    self._make_links_absolute(body[0])
+                    content_html = html.tostring(body[0], encoding="unicode", pretty_print=True)
+                else:
+                    if isinstance(html_content, bytes):
+                        html_content = html_content.decode("utf-8", errors="replace")
+                    content_html = self._convert_relative_links_to_absolute(html_content)
                 self.logger.warning(
                     "Could not find specific content section, using body content",
                 )
@@ -251,9 +405,6 @@ class Parser:
                 self.logger.warning("No content found and no fallback configured")
                 content_html = ""
 
-            # Convert relative links to absolute links
-            content_html = self._convert_relative_links_to_absolute(content_html)
-
             # Convert HTML to Markdown using site-specific settings
             markdown_content = self._html_to_markdown(content_html)
 
@@ -269,6 +420,7 @@ class Parser:
         attribute: str,
         base_url: str,
         absolute_prefixes: tuple[str, ...],
+        joined_urls: dict[str, str] | None = None,
     ) -> bool:
         """
         Convert a single element's link attribute to absolute URL if it's relative.
@@ -278,6 +430,7 @@ class Parser:
             attribute: Attribute name (e.g., 'href', 'src')
             base_url: Base URL to use for conversion
             absolute_prefixes: Tuple of prefixes that indicate absolute URLs
+            joined_urls: Absolute URLs already joined against base_url, keyed by link
 
         Returns:
             True if the link was converted, False otherwise
@@ -286,7 +439,12 @@ class Parser:
         if not link or link.startswith(absolute_prefixes):
             return False
 
-        absolute_url = urljoin(base_url, link)
+        if joined_urls is None:
+            absolute_url = urljoin(base_url, link)
+        elif link in joined_urls:
+            absolute_url = joined_urls[link]
+        else:
+            absolute_url = joined_urls[link] = urljoin(base_url, link)
         element.set(attribute, absolute_url)
         return True
 
@@ -304,36 +462,48 @@ class Parser:
             return html_content  # No base URL available, return unchanged
 
         try:
-            # Parse the HTML
-            tree = html.fromstring(html_content)
+            # Parse the HTML as UTF-8 bytes with the same lean parser as _parse_html
+            tree = html.fromstring(html_content.encode("utf-8"), parser=_get_html_parser())
+
+            self._make_links_absolute(tree)
+
+            # Convert back to string
+            return html.tostring(tree, encoding="unicode", pretty_print=True)
+        except Exception as e:
+            self.logger.error(f"Error converting relative links: {str(e)}")
+            return html_content  # Return original content if there's an error
+
+    def _make_links_absolute(self, element: html.HtmlElement) -> None:
+        """
+        Convert relative links in an element and its descendants to absolute URLs in place.
 
-            # Define absolute prefixes for different attribute types
-            href_prefixes = ("http://", "https://", "//", "mailto:", "#", "tel:")
-            src_prefixes = ("http://", "https://", "//", "data:")
+        Args:
+            element: HTML element whose links to convert
+        """
+        if not self.current_base_url:
+            return  # No base URL available, leave links unchanged
 
-            # Find all links and process them
-            for element in tree.xpath("//*[@href]"):
+        # Navigation, footers and sidebars repeat the same links, so each is joined once per document
+        joined_urls: dict[str, str] = {}
+        try:
+            # Find links and images in a single pass over the tree and process both attributes
+            for link_element in _LINK_ELEMENTS_XPATH(element):
                 self._convert_element_link_to_absolute(
-                    element,
+                    link_element,
                     "href",
                     self.current_base_url,
-                    href_prefixes,
+                    _HREF_ABSOLUTE_PREFIXES,
+                    joined_urls,
                 )
-
-            # Find all images and process them
-            for element in tree.xpath("//*[@src]"):
                 self._convert_element_link_to_absolute(
-                    element,
+                    link_element,
                     "src",
                     self.current_base_url,
-                    src_prefixes,
+                    _SRC_ABSOLUTE_PREFIXES,
+                    joined_urls,
                 )
-
-            # Convert back to string
-            return html.tostring(tree, encoding="unicode", pretty_print=True)
         except Exception as e:
             self.logger.error(f"Error converting relative links: {str(e)}")
-            return html_content  # Return original content if there's an error
 
     def _html_to_markdown(self, html_content: str) -> str:
         """
@@ -360,60 +530,47 @@ class Parser:
 
         return markdown_text
 
-    def _construct_base_url_from_path(self, file_path: str) -> str:
+    def _construct_base_url_from_path(self, file_path: str, rel_path: str | None = None) -> str:
         """
         Construct base URL from file path when no URL mapping exists.
 
         Args:
             file_path: Path to the HTML file
+            rel_path: Path relative to the input directory if already computed
 
         Returns:
             Constructed base URL
         """
-        try:
-            # Calculate relative path directly from the input directory
-            rel_path = os.path.relpath(file_path, self.input_dir)
-
-            if rel_path.startswith(".."):
-                # File is outside input directory
-                self.logger.info(f"File outside input dir, using base URL: {self.config.base_url}")
-                return str(self.config.base_url)
-
-            # Normalize path and construct URL
-            normalized_path = rel_path.replace("\\", "/")
-            # Convert HttpUrl to string for urljoin
-            base_url_str = str(self.config.base_url)
-            constructed_url = urljoin(base_url_str, normalized_path)
-            self.logger.info(f"Constructed base URL: {constructed_url}")
-            return constructed_url
+        if rel_path is None:
+            rel_path = self._get_relative_path(file_path)
 
-        except ValueError:
-            self.logger.warning(
-                f"Error constructing URL from path, using base URL: {self.config.base_url}",
-            )  # noqa: E501
+        if rel_path is None:
+            # File is outside input directory
+            self.logger.debug("File outside input dir, using base URL: %s", self.config.base_url)
             return str(self.config.base_url)
 
-    def _extract_domain_from_path(self, file_path: str | Path) -> str:
+        # Convert HttpUrl to string for urljoin
+        base_url_str = str(self.config.base_url)
+        constructed_url = urljoin(base_url_str, rel_path)
+        self.logger.debug("Constructed base URL: %s", constructed_url)
+        return constructed_url
+
+    def _extract_domain_from_path(self, file_path: str | Path, rel_path: str | None = None) -> str:
         """
         Extract the first part of the path (typically a domain or language directory).
 
         Args:
             file_path: Path to the HTML file
+            rel_path: Path relative to the input directory if already computed
 
         Returns:
             First directory name from the relative path or "unknown" if not found
         """
-        try:
-            # Get the path relative to the input directory
-            rel_path = Path(file_path).relative_to(Path(self.input_dir))
-            path_parts = rel_path.parts
-            if len(path_parts) > 0:
-                first_part = path_parts[0]
-            else:
-                first_part = "unknown"
-            return first_part
-        except ValueError:
+        if rel_path is None:
+            rel_path = self._get_relative_path(file_path)
+        if not rel_path or rel_path == ".":
             return "unknown"
+        return rel_path.split("/", 1)[0]
 
     def _create_directory_scope(self) -> DirectoryScope:
         """
@@ -431,19 +588,21 @@ class Parser:
     def _parse_file_with_context(
         self,
         html_file: str | Path,
-    ) -> dict[str, Any] | None:
+        html_content: str | bytes | None = None,
+    ) -> ParseResult | None:
         """
         Parse a single file with URL context preservation.
 
         Args:
             html_file: Path to the HTML file to parse
+            html_content: Content of the file if already read, otherwise it is read from disk
 
         Returns:
-            Dictionary containing information about the parsed file or None if parsing failed
+            ParseResult describing the parsed file or None if parsing failed
         """
         try:
             # Parse the file with URL context preservation
-            return self.parse_file(html_file, preserve_url_context=True)
+            return self.parse_file(html_file, preserve_url_context=True, html_content=html_content)
 
         except Exception as e:
             self.logger.error(f"Error parsing {html_file} with context: {str(e)}")
@@ -453,7 +612,8 @@ class Parser:
         self,
         html_file: str | Path,
         preserve_url_context: bool = False,
-    ) -> dict[str, Any] | None:
+        html_content: str | bytes | None = None,
+    ) -> ParseResult | None:
         """
         Parse a single HTML file from the configured domain.
 
@@ -461,13 +621,17 @@ class Parser:
             html_file: Path to the HTML file
             preserve_url_context: If True, don't restore original base_url after parsing,
                                  needed for batch processing
+            html_content: Content of the file if already read, otherwise it is read from disk
 
         Returns:
-            Dictionary containing information about the parsed file
+            ParseResult describing the parsed file
         """
 
+        # Work out the path relative to the input directory once, for all the helpers below
+        rel_path = self._get_relative_path(html_file)
+
         # Get the original URL of this file from URL mappings if available
-        original_url = self._get_original_url(html_file)
+        original_url = self._get_original_url(html_file, rel_path)
 
         # Store original base_url only if we need to restore it later
         original_base_url = self.current_base_url if not preserve_url_context else None
@@ -477,39 +641,57 @@ class Parser:
 
         # If no URL mapping found, construct URL from configuration and file path
         if not self.current_base_url:
-            file_path_str = str(html_file)
-            self.current_base_url = self._construct_base_url_from_path(file_path_str)
+            self.current_base_url = self._construct_base_url_from_path(str(html_file), rel_path)
 
         # Parse the file
-        html_file_path = Path(html_file)
-        self.logger.info(f"Parsing {html_file_path}")
+        html_file_path = os.fspath(html_file)
+        self.logger.debug("Parsing %s", html_file_path)
 
         try:
             # Read the HTML content
-            with open(html_file_path, encoding="utf-8") as f:
-                html_content = f.read()
+            if html_content is None:
+                html_content = self._read_html_file(html_file_path)
 
             # Extract the domain from the file path
-            domain = self._extract_domain_from_path(html_file_path)
+            domain = self._extract_domain_from_path(html_file_path, rel_path)
+
+            # Reuse the output of a file with the same content parsed earlier in this run
+            content_hashes = self._content_hashes
+            content_hash = None
+            if content_hashes is not None:
+                content_bytes = html_content.encode("utf-8") if isinstance(html_content, str) else html_content
+                content_hash = hashlib.blake2b(content_bytes, digest_size=16).digest()
+                duplicate = content_hashes.get(content_hash)
+                if duplicate is not None:
+                    self.logger.debug("Skipping %s, same content as %s", html_file_path, duplicate.source_file)
+                    return ParseResult(
+                        source_file=html_file_path,
+                        output_file=duplicate.output_file,
+                        title=duplicate.title,
+                        domain=domain,
+                    )
 
             # Generate a filename for the output markdown
-            output_filename = self._get_output_filename(html_file_path)
+            output_filename = self._get_output_filename(html_file_path, rel_path)
 
             # Parse the HTML content
             title, content = self._parse_html(html_content)
 
             # Create metadata for the markdown file
-            metadata = self._create_metadata(html_file_path, title)
+            metadata = self._create_metadata(html_file_path, title, rel_path, original_url)
 
             # Save the content as Markdown with frontmatter
             output_path = self._save_markdown(output_filename, title, content, metadata)
 
-            return {
-                "source_file": str(html_file_path),
-                "output_file": output_path,
-                "title": title,
-                "domain": domain,
-            }
+            result = ParseResult(
+                source_file=html_file_path,
+                output_file=output_path,
+                title=title,
+                domain=domain,
+            )
+            if content_hashes is not None and content_hash is not None:
+                content_hashes[content_hash] = result
+            return result
 
         except Exception as e:
             self.logger.error(f"Error parsing {html_file_path}: {str(e)}")
@@ -519,63 +701,67 @@ class Parser:
             if original_base_url is not None and not preserve_url_context:
                 self.current_base_url = original_base_url
 
-    def _create_metadata(self, file_path: str | Path, title: str) -> dict[str, Any]:
+    def _create_metadata(
+        self,
+        file_path: str | Path,
+        title: str,
+        rel_path: str | None = None,
+        original_url: str | None = None,
+    ) -> dict[str, Any]:
         """
         Create metadata for the markdown file including the original URL.
 
         Args:
             file_path: Path to the HTML file
             title: Title of the page
+            rel_path: Path relative to the input directory if already computed
+            original_url: Original URL of the page if already looked up
 
         Returns:
             Dictionary with metadata
         """
         # Extract domain using the helper method
-        domain = self._extract_domain_from_path(file_path)
+        domain = self._extract_domain_from_path(file_path, rel_path)
 
         # Basic metadata
         metadata = {
             "source_file": str(file_path),
             "title": title,
             "domain": domain,
-            "parse_timestamp": datetime.now().isoformat(),
+            "parse_timestamp": self._run_timestamp or datetime.now().isoformat(),
             "parser": self.__class__.__name__,
         }
 
         # Add the original URL to the metadata if available
-        original_url = self._get_original_url(file_path)
+        if original_url is None:
+            original_url = self._get_original_url(file_path, rel_path)
         if original_url:
             metadata["source_url"] = original_url
 
         return metadata
 
-    def _get_output_filename(self, html_file_path: Path) -> str:
+    def _get_output_filename(self, html_file_path: str | Path, rel_path: str | None = None) -> str:
         """
         Generate an output filename for the parsed markdown file.
         Preserves the directory structure from the input directory.
 
         Args:
             html_file_path: Path to the source HTML file
+            rel_path: Path relative to the input directory if already computed
 
         Returns:
             Output filename with path (without extension)
         """
-        # Try to extract relative path from the file path
-        try:
-            rel_path = html_file_path.relative_to(Path(self.input_dir))
-            parts = rel_path.parts
-
-            # If there are multiple parts in the path, preserve the structure
-            if len(parts) >= 2:
-                # Preserve the original directory structure but replace .html extension
-                rel_output_path = str(rel_path).replace(".html", "")
-                return rel_output_path
-            else:
-                # Just use filename if there's only one part
-                return html_file_path.stem
-        except ValueError:
-            # If the file is not in the input directory, just use its name
-            return html_file_path.stem
+        if rel_path is None:
+            rel_path = self._get_relative_path(html_file_path)
+
+        # If the file is in a subdirectory of the input directory, preserve the structure
+        if rel_path is not None and "/" in rel_path:
+            # Preserve the original directory structure but drop the .html extension
+            return rel_path.removesuffix(".html")
+
+        # Just use the filename if the file is directly in, or outside, the input directory
+        return os.path.splitext(os.path.basename(html_file_path))[0]
 
     def _save_markdown(
         self,
@@ -604,66 +790,349 @@ class Parser:
         output_path = os.path.join(self.output_dir, filename)
 
         # Create parent directories if needed
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        parent_dir = os.path.dirname(output_path)
+        if parent_dir not in self._created_dirs:
+            os.makedirs(parent_dir, exist_ok=True)
+            self._created_dirs.add(parent_dir)
 
         # Prepare the markdown content with frontmatter
-        frontmatter = yaml.dump(metadata, default_flow_style=False)
+        frontmatter = _dump_frontmatter(metadata)
         markdown_content = f"---\n{frontmatter}---\n\n# {title}\n\n{content}\n"
 
-        # Save the file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        # Save the file as UTF-8 in one write, without a buffered file object
+        self._write_file(output_path, markdown_content.encode("utf-8"))
 
-        self.logger.info(f"Saved markdown to {output_path}")
+        self.logger.debug("Saved markdown to %s", output_path)
         return output_path
 
-    def parse_all(self) -> list[dict[str, Any]]:
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> None:
+        """
+        Write a file with raw os.write calls, replacing any existing content.
+
+        This skips the stat and buffer set-up that open() does for every file.
+
+        Args:
+            path: Path of the file to write
+            data: Content of the file
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                # A single write normally takes everything, but may be cut short
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+    def parse_all(self, workers: int | None = None, force: bool = False) -> list[ParseResult]:
         """
         Parse all HTML files in the configured site's directory.
 
         This parser is focused on processing only files within the specific
-        domain directory defined in the configuration.
+        domain directory defined in the configuration. Parsing is CPU-bound, so
+        the files are spread over a pool of worker processes. Files whose Markdown
+        output is newer than the HTML are not parsed again; their results from the
+        previous run are reused. Files with the same content as a file parsed
+        earlier in the run, such as a page saved under several URLs, share that
+        file's Markdown output instead of being parsed again.
+
+        Args:
+            workers: Number of worker processes, defaults to the number of CPUs.
+                With a single worker, files are parsed in this process.
+            force: If True, parse every file even if its output is up to date,
+                e.g. after changing the site configuration
 
         Returns:
-            List of dictionaries containing information about parsed files
+            List of ParseResults describing the parsed files
         """
         self.logger.info(
             f"Parsing HTML files for site '{self.site}' from directory '{self.input_dir}'",
         )
 
+        # Stamp every file from this run with the same parse timestamp instead of
+        # building and formatting a new datetime per file
+        self._run_timestamp = datetime.now().isoformat()
+        self._content_hashes = {}
+        try:
+            return self._parse_all_files(workers, force)
+        finally:
+            self._run_timestamp = None
+            self._content_hashes = None
+
+    def _parse_all_files(self, workers: int | None = None, force: bool = False) -> list[ParseResult]:
+        """
+        Parse the HTML files in the site's directory and write the index.
+
+        Args:
+            workers: Number of worker processes, defaults to the number of CPUs
+            force: If True, parse every file even if its output is up to date
+
+        Returns:
+            List of ParseResults describing the parsed files
+        """
         # Create a directory scope for processing only files in the site's directory
         with self._create_directory_scope() as scoped_dir:
-            results: list[dict[str, Any]] = []
+            results: list[ParseResult] = []
 
             # Get all HTML files
             html_dir = scoped_dir
 
             # Find all HTML files recursively
-            html_files = []
-            for root, _, files in os.walk(html_dir):
-                for file in files:
-                    if file.endswith(".html"):
-                        html_files.append(os.path.join(root, file))
+            html_files = list(self._iter_html_files(html_dir))
 
             self.logger.info(f"Found {len(html_files)} HTML files to parse")
 
-            # Parse each file with URL context preservation
-            for html_file in html_files:
-                try:
-                    result = self._parse_file_with_context(html_file)
+            # Reuse the previous results of files whose output is up to date
+            previous_results = {} if force else self._load_previous_results()
+            up_to_date = {
+                html_file: previous_results[html_file]
+                for html_file in html_files
+                if self._is_up_to_date(html_file, previous_results)
+            }
+            # Duplicates share their output with another file, so they are stale too
+            # when that file's output is about to be rewritten
+            rewritten = {
+                previous_results[html_file].output_file
+                for html_file in html_files
+                if html_file not in up_to_date and html_file in previous_results
+            }
+            if rewritten:
+                up_to_date = {
+                    html_file: result for html_file, result in up_to_date.items() if result.output_file not in rewritten
+                }
+            if up_to_date:
+                self.logger.info(f"Skipping {len(up_to_date)} files with up-to-date output")
+
+            # Parse each remaining file with URL context preservation
+            stale_files = [html_file for html_file in html_files if html_file not in up_to_date]
+            parsed_count = 0
+            with contextlib.closing(self._parse_files(stale_files, workers)) as parsed:
+                for html_file in html_files:
+                    result: ParseResult | None
+                    if html_file in up_to_date:
+                        result = up_to_date[html_file]
+                    else:
+                        result = next(parsed)
+                        parsed_count += 1
+                        # Per-file messages are debug level, so report progress in batches
+                        if parsed_count % self.PROGRESS_INTERVAL == 0:
+                            self.logger.info("Parsed %d/%d files", parsed_count, len(stale_files))
                     if result:
                         results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Error parsing {html_file}: {str(e)}")
+
+            self._save_results(results)
 
             # Create an index file for all parsed files
             if results:
                 self._create_index(results)
 
-            self.logger.info(f"Parsed {len(results)} files")
+            failed = len(stale_files) - (len(results) - len(up_to_date))
+            self.logger.info(
+                "Processed %d files: %d parsed, %d up to date, %d failed",
+                len(html_files),
+                len(stale_files) - failed,
+                len(up_to_date),
+                failed,
+            )
             return results
 
-    def _create_index(self, results: list[dict[str, Any]]) -> str:
+    def _load_previous_results(self) -> dict[str, ParseResult]:
+        """
+        Load the results of the previous run.
+
+        Returns:
+            Dictionary mapping each source file to its result, empty if there is no usable results file
+        """
+        results_file = os.path.join(self.output_dir, self.RESULTS_FILE)
+        try:
+            with open(results_file, "rb") as f:
+                results = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            self.logger.warning(f"Could not load previous parse results from {results_file}: {str(e)}")
+            return {}
+        if not isinstance(results, dict):
+            return {}
+        previous_results = {}
+        for source_file, result in results.items():
+            try:
+                previous_results[source_file] = ParseResult(**result)
+            except TypeError:
+                continue
+        return previous_results
+
+    def _save_results(self, results: list[ParseResult]) -> None:
+        """
+        Save the results of this run, keyed by source file, for the next run.
+
+        Args:
+            results: List of parsing results
+        """
+        results_file = os.path.join(self.output_dir, self.RESULTS_FILE)
+        with open(results_file, "wb") as f:
+            f.write(orjson.dumps({result.source_file: result.to_dict() for result in results}))
+
+    @staticmethod
+    def _is_up_to_date(html_file: str, previous_results: dict[str, ParseResult]) -> bool:
+        """
+        Check whether a file was parsed before and its output is at least as new as the HTML.
+
+        Args:
+            html_file: Path to the HTML file
+            previous_results: Results of the previous run, keyed by source file
+
+        Returns:
+            True if the file does not need to be parsed again
+        """
+        previous = previous_results.get(html_file)
+        if not previous:
+            return False
+        try:
+            return os.stat(previous.output_file).st_mtime >= os.stat(html_file).st_mtime
+        except OSError:
+            return False
+
+    def _iter_html_files(self, directory: str) -> Iterator[str]:
+        """
+        Find HTML files in a directory tree.
+
+        Uses os.scandir directly, whose entries carry their file type, so no
+        entry needs a separate stat call. Directories are walked from an explicit
+        stack rather than by recursion, so each path is yielded straight to the
+        caller instead of through one generator per directory level, and deep
+        trees cannot hit the recursion limit. Symlinked directories are not followed.
+
+        Args:
+            directory: Directory to search
+
+        Yields:
+            Paths of the HTML files found
+        """
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".html"):
+                            yield entry.path
+            except OSError as e:
+                self.logger.warning(f"Could not list directory {current}: {str(e)}")
+
+    def _parse_files(
+        self,
+        html_files: list[str],
+        workers: int | None = None,
+    ) -> Generator[ParseResult | None, None, None]:
+        """
+        Parse HTML files, in worker processes when there is more than one worker.
+
+        Either way, files are read on background threads while earlier files are
+        parsed, so the parser does not sit idle waiting on the disk.
+
+        Args:
+            html_files: Paths of the HTML files to parse
+            workers: Number of worker processes, defaults to the number of CPUs
+
+        Yields:
+            Parse results in the same order as html_files, None for failed files
+        """
+        max_workers = min(workers or os.cpu_count() or 1, len(html_files))
+        if max_workers <= 1:
+            for html_file, html_content in self._prefetch_html_files(html_files):
+                yield self._parse_file_safely(html_file, html_content)
+            return
+
+        self.logger.info(f"Parsing with {max_workers} worker processes")
+        chunksize = max(1, min(16, len(html_files) // (max_workers * 4)))
+        chunks = [html_files[i : i + chunksize] for i in range(0, len(html_files), chunksize)]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_parse_worker,
+            initargs=(self,),
+        ) as executor:
+            for chunk_results in executor.map(_parse_files_in_worker, chunks):
+                yield from chunk_results
+
+    def _prefetch_html_files(
+        self,
+        html_files: list[str],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> Iterator[tuple[str, bytes | None]]:
+        """
+        Read HTML files on background threads, ahead of the file being parsed.
+
+        This overlaps waiting on the disk with parsing the previous files.
+
+        Args:
+            html_files: Paths of the HTML files to read
+            executor: Thread pool to read on, a new one for this call if not given
+
+        Yields:
+            Tuples of each path and its content, in order. The content is None if
+            reading failed, leaving the error to be reported when the file is parsed.
+        """
+        if executor is None:
+            with _new_prefetch_executor() as executor:
+                yield from self._prefetch_html_files(html_files, executor)
+            return
+
+        pending: deque[tuple[str, Future[bytes]]] = deque()
+        files = iter(html_files)
+        for html_file in files:
+            pending.append((html_file, executor.submit(self._read_html_file, html_file)))
+            if len(pending) >= self.PREFETCH_FILES:
+                break
+
+        while pending:
+            html_file, future = pending.popleft()
+            next_file = next(files, None)
+            if next_file is not None:
+                pending.append((next_file, executor.submit(self._read_html_file, next_file)))
+            try:
+                yield html_file, future.result()
+            except Exception:
+                yield html_file, None
+
+    @staticmethod
+    def _read_html_file(html_file: str | Path) -> bytes:
+        """
+        Read the raw content of an HTML file.
+
+        The bytes are handed to lxml as they are, which decodes them as UTF-8
+        while parsing, replacing any undecodable bytes.
+
+        Args:
+            html_file: Path to the HTML file
+
+        Returns:
+            The file content
+        """
+        with open(html_file, "rb") as f:
+            return f.read()
+
+    def _parse_file_safely(self, html_file: str, html_content: str | bytes | None = None) -> ParseResult | None:
+        """
+        Parse a single file, logging rather than raising any error.
+
+        Args:
+            html_file: Path to the HTML file to parse
+            html_content: Content of the file if already read, otherwise it is read from disk
+
+        Returns:
+            ParseResult describing the parsed file or None if parsing failed
+        """
+        try:
+            return self._parse_file_with_context(html_file, html_content)
+        except Exception as e:
+            self.logger.error(f"Error parsing {html_file}: {str(e)}")
+            return None
+
+    def _create_index(self, results: list[ParseResult]) -> str:
         """
         Create an index markdown file for all parsed content.
 
@@ -675,19 +1144,23 @@ class Parser:
         """
         index_path = os.path.join(self.output_dir, "index.md")
 
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(f"# {self.site or 'Site'} Parsed Content Index\n\n")
-            f.write(f"Total pages parsed: {len(results)}\n\n")
-            f.write("| Title | Source File | Output File |\n")
-            f.write("|-------|-------------|-------------|\n")
-
-            for result in results:
-                title = result.get("title", "Untitled")
-                source = os.path.basename(result.get("source_file", ""))
-                output = os.path.basename(result.get("output_file", ""))
-
-                # Create relative links to the files
-                f.write(f"| {title} | {source} | [{output}]({output}) |\n")
+        # Build the whole index in memory and write it at once
+        rows = []
+        for result in results:
+            title = result.title or "Untitled"
+            source = os.path.basename(result.source_file)
+            output = os.path.basename(result.output_file)
+
+            # Create relative links to the files
+            rows.append(f"| {title} | {source} | [{output}]({output}) |\n")
+
+        header = (
+            f"# {self.site or 'Site'} Parsed Content Index\n\n"
+            f"Total pages parsed: {len(results)}\n\n"
+            "| Title | Source File | Output File |\n"
+            "|-------|-------------|-------------|\n"
+        )
+        self._write_file(index_path, (header + "".join(rows)).encode("utf-8"))
 
         self.logger.info(f"Created index at {index_path}")
         return index_path
@@ -728,3 +1201,45 @@ class Parser:
         except ValueError:
             # Return None if site doesn't exist, to maintain backward compatibility
             return None
+
+
+def _new_prefetch_executor() -> ThreadPoolExecutor:
+    """Create the thread pool that reads HTML files ahead of parsing them."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="html-prefetch")
+
+
+# Parser of the current worker process during a parallel parse_all run
+_worker_parser: Parser | None = None
+# Prefetch thread pool of the current worker process, shared by all of its chunks
+_worker_prefetch_executor: ThreadPoolExecutor | None = None
+
+
+def _init_parse_worker(parser: Parser) -> None:
+    """
+    Install the parser and prefetch thread pool that a parse worker process uses for every file.
+
+    Args:
+        parser: The parser running parse_all
+    """
+    global _worker_parser, _worker_prefetch_executor
+    _worker_parser = parser
+    _worker_prefetch_executor = _new_prefetch_executor()
+
+
+def _parse_files_in_worker(html_files: list[str]) -> list[ParseResult | None]:
+    """
+    Parse a chunk of files in a parse worker process, reading each file ahead of parsing it.
+
+    Args:
+        html_files: Paths of the HTML files to parse
+
+    Returns:
+        Parse results in the same order as html_files, None for failed files
+    """
+    if _worker_parser is None or _worker_prefetch_executor is None:
+        raise RuntimeError("Parse worker was not initialized")
+    parser = _worker_parser
+    return [
+        parser._parse_file_safely(html_file, html_content)
+        for html_file, html_content in parser._prefetch_html_files(html_files, _worker_prefetch_executor)
+    ]
@@ -1,5 +1,6 @@
 """Utility functions for loading prompt templates from files."""
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -36,33 +37,51 @@ def get_prompt_path(prompt_name: str) -> str:
     return str(md_path)
 
 
-def load_prompt(prompt_name: str, **kwargs: Any) -> str:
-    """Load a prompt template from file and substitute any variables.
+@functools.cache
+def _load_template(prompt_name: str) -> Template:
+    """Read and compile a prompt template, caching it for later calls.
+
+    Prompt templates ship with the package, so each is read from disk once per
+    process. Failed loads raise and are therefore not cached.
 
     Args:
         prompt_name: Name of the prompt template without extension
-        **kwargs: Variables to substitute in the template
 
     Returns:
-        The loaded and formatted prompt text
+        The compiled prompt template
+
+    Raises:
+        FileNotFoundError: If there is no template with this name
     """
     prompt_path = get_prompt_path(prompt_name)
+    if not os.path.exists(prompt_path):
+        raise FileNotFoundError(prompt_path)
 
-    try:
-        if not os.path.exists(prompt_path):
-            logger.warning(f"Prompt template not found: {prompt_path}")
-            return ""
+    with open(prompt_path, encoding="utf-8") as file:
+        return Template(file.read())
 
-        with open(prompt_path, encoding="utf-8") as file:
-            prompt_template = file.read()
 
-        # If kwargs are provided, substitute them in the template
-        if kwargs:
-            template = Template(prompt_template)
-            return template.safe_substitute(**kwargs)
+def load_prompt(prompt_name: str, **kwargs: Any) -> str:
+    """Load a prompt template and substitute any variables.
 
-        return prompt_template
+    Args:
+        prompt_name: Name of the prompt template without extension
+        **kwargs: Variables to substitute in the template
 
+    Returns:
+        The loaded and formatted prompt text
+    """
+    try:
+        template = _load_template(prompt_name)
+    except FileNotFoundError as e:
+        logger.warning(f"Prompt template not found: {e}")
+        return ""
     except Exception as e:
         logger.error(f"Error loading prompt template {prompt_name}: {e}")
         return ""
+
+    # If kwargs are provided, substitute them in the template
+    if kwargs:
+        return template.safe_substitute(**kwargs)
+
+    return template.template
@@ -1,4 +1,5 @@
 from tapio.services.document_retrieval_service import DocumentRetrievalService
 from tapio.services.llm_service import LLMService
+from tapio.services.response_cache import ResponseCache
 
-__all__ = ["LLMService", "DocumentRetrievalService"]
+__all__ = ["LLMService", "DocumentRetrievalService", "ResponseCache"]
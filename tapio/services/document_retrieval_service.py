@@ -1,5 +1,6 @@
 """Document retrieval service for the Tapio Assistant."""
 
+import io
 import logging
 from typing import Any
 
@@ -37,11 +38,13 @@ class DocumentRetrievalService:
             f"Initialized document retrieval service with collection '{collection_name}'",
         )
 
-    def retrieve_documents(self, query_text: str) -> list[Any]:
+    def retrieve_documents(self, query_text: str, query_embedding: list[float] | None = None) -> list[Any]:
         """Retrieve relevant documents for the given query.
 
         Args:
             query_text: The user's query
+            query_embedding: Embedding of the query if already computed, otherwise
+                the vector store embeds the query
 
         Returns:
             List of retrieved documents
@@ -51,6 +54,7 @@ class DocumentRetrievalService:
             retrieved_docs = self.vector_store.query(
                 query_text=query_text,
                 n_results=self.num_results,
+                query_embedding=query_embedding,
             )
             logger.info(f"Retrieved {len(retrieved_docs)} documents")
             return retrieved_docs
@@ -90,10 +94,15 @@ class DocumentRetrievalService:
         if not documents:
             return "No relevant documents found."
 
-        formatted_docs = []
+        # Write every document into one buffer rather than building a string per
+        # document and copying them all again when joining
+        buffer = io.StringIO()
         for i, doc in enumerate(documents):
+            if i:
+                buffer.write("\n")
+
             # Extract metadata
-            metadata = doc.metadata if hasattr(doc, "metadata") else {}
+            metadata = getattr(doc, "metadata", None) or {}
             source = metadata.get(
                 "source_url",
                 metadata.get("url", "Unknown source"),
@@ -101,15 +110,7 @@ class DocumentRetrievalService:
             title = metadata.get("title", f"Document {i + 1}")
 
             # Format the document with metadata
-            doc_content = (
-                doc.page_content
-                if hasattr(
-                    doc,
-                    "page_content",
-                )
-                else str(doc)
-            )
-            formatted_doc = f"### {title}\n**Source**: {source}\n\n{doc_content}\n\n"
-            formatted_docs.append(formatted_doc)
+            doc_content = doc.page_content if hasattr(doc, "page_content") else str(doc)
+            buffer.write(f"### {title}\n**Source**: {source}\n\n{doc_content}\n\n")
 
-        return "\n".join(formatted_docs)
+        return buffer.getvalue()
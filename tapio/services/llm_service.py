@@ -1,17 +1,25 @@
 """Service for interacting with LLM models through Ollama."""
 
 import logging
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
 import ollama
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prefix of the message returned in place of a response when generation fails
+GENERATION_ERROR_MESSAGE = "Error: Could not generate a response."
+
 
 class LLMService:
     """Service for interacting with LLM models through Ollama."""
 
+    # Seconds a successful model availability check is reused before Ollama is asked again
+    MODEL_CHECK_TTL = 300.0
+
     def __init__(
         self,
         model_name: str = "llama3.2",
@@ -28,14 +36,24 @@ class LLMService:
         self.model_name = model_name
         self.max_tokens = max_tokens
         self.temperature = temperature
+        # Created on first use, so the synchronous code paths never open an async connection pool
+        self._async_client: ollama.AsyncClient | None = None
+        # When the model was last found available, to skip repeated checks
+        self._model_available_at: float | None = None
         logger.info(f"Initialized LLM service with model: {model_name}")
 
     def check_model_availability(self) -> bool:
         """Check if Ollama is running and has the required model.
 
+        A successful check is reused for MODEL_CHECK_TTL seconds, while a failed
+        check is repeated on the next call so a freshly pulled model is noticed.
+
         Returns:
             bool: True if the model is available, False otherwise
         """
+        if self._model_available_at is not None and time.monotonic() - self._model_available_at < self.MODEL_CHECK_TTL:
+            return True
+
         try:
             models_response = ollama.list()
 
@@ -60,35 +78,35 @@ class LLMService:
             )
 
             # Check for exact match or base name match (handle :tag variations)
-            for model_name in available_models:
-                # Exact match
-                if model_name == self.model_name:
-                    model_exists = True
-                    logger.info(f"Found exact matching model: {model_name}")
-                    break
-                # If user provided base name (no tag), match any variant with tags
-                elif ":" not in self.model_name and model_name.startswith(f"{self.model_name}:"):
-                    model_exists = True
-                    logger.info(
-                        f"Found matching model: {model_name} for base name {self.model_name}",
-                    )
-                    break
-                # If user provided name with tag, check if base names match
-                elif ":" in self.model_name and ":" in model_name:
-                    user_base = self.model_name.split(":")[0]
-                    model_base = model_name.split(":")[0]
-                    if user_base == model_base:
+            if self.model_name in available_models:
+                model_exists = True
+                logger.info(f"Found exact matching model: {self.model_name}")
+            else:
+                for model_name in available_models:
+                    # If user provided base name (no tag), match any variant with tags
+                    if ":" not in self.model_name and model_name.startswith(f"{self.model_name}:"):
                         model_exists = True
                         logger.info(
-                            f"Found matching model: {model_name} for requested {self.model_name}",
+                            f"Found matching model: {model_name} for base name {self.model_name}",
                         )
                         break
+                    # If user provided name with tag, check if base names match
+                    elif ":" in self.model_name and ":" in model_name:
+                        user_base = self.model_name.split(":")[0]
+                        model_base = model_name.split(":")[0]
+                        if user_base == model_base:
+                            model_exists = True
+                            logger.info(
+                                f"Found matching model: {model_name} for requested {self.model_name}",
+                            )
+                            break
 
             if not model_exists:
                 logger.warning(
                     f"{self.model_name} model not found in Ollama. Please pull it with 'ollama pull {self.model_name}'",
                 )
                 return False
+            self._model_available_at = time.monotonic()
             return True
         except Exception as e:
             logger.warning(f"Could not connect to Ollama: {e}")
@@ -106,30 +124,15 @@ class LLMService:
             str: The generated response
         """
         try:
-            messages = []
-
-            # Add system message if provided
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            # Add user message
-            messages.append({"role": "user", "content": prompt})
-
             response = ollama.chat(
                 model=self.model_name,
-                messages=messages,
-                options={
-                    "temperature": self.temperature,
-                    "num_predict": self.max_tokens,
-                },
+                messages=self._build_messages(prompt, system_prompt),
+                options=self._generation_options(),
             )
             return response["message"]["content"]
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            return (
-                f"Error: Could not generate a response. "
-                f"Please check if Ollama is running with the {self.model_name} model."
-            )
+            return f"{GENERATION_ERROR_MESSAGE} Please check if Ollama is running with the {self.model_name} model."
 
     def generate_response_stream(self, prompt: str, system_prompt: str | None = None) -> Generator[str, None, None]:
         """Generate a streaming response from the LLM model.
@@ -142,30 +145,12 @@ class LLMService:
             str: Chunks of the generated response
         """
         try:
-            messages = []
-
-            # Add system message if provided
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            # Add user message
-            messages.append({"role": "user", "content": prompt})
-
             # Use streaming chat with optimized options for faster response
             logger.info("About to call ollama.chat with streaming")
             stream = ollama.chat(
                 model=self.model_name,
-                messages=messages,
-                options={
-                    "temperature": self.temperature,
-                    "num_predict": self.max_tokens,
-                    "num_ctx": 2048,  # Reduce context window for faster processing
-                    "top_k": 40,
-                    "top_p": 0.9,
-                    "repeat_penalty": 1.1,
-                    "seed": -1,
-                    "num_thread": 0,  # Use all available threads
-                },
+                messages=self._build_messages(prompt, system_prompt),
+                options=self._streaming_options(),
                 stream=True,
                 keep_alive="5m",  # Keep model loaded for faster subsequent requests
             )
@@ -181,10 +166,115 @@ class LLMService:
 
         except Exception as e:
             logger.error(f"Error generating streaming response: {e}")
-            yield (
-                f"Error: Could not generate a response. "
-                f"Please check if Ollama is running with the {self.model_name} model."
+            yield f"{GENERATION_ERROR_MESSAGE} Please check if Ollama is running with the {self.model_name} model."
+
+    async def agenerate_response(self, prompt: str, system_prompt: str | None = None) -> str:
+        """Generate a response from the LLM model without blocking the event loop.
+
+        Args:
+            prompt: The prompt to generate a response for
+            system_prompt: Optional system prompt to set context
+
+        Returns:
+            str: The generated response
+        """
+        try:
+            response = await self._get_async_client().chat(
+                model=self.model_name,
+                messages=self._build_messages(prompt, system_prompt),
+                options=self._generation_options(),
             )
+            return response["message"]["content"]
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return f"{GENERATION_ERROR_MESSAGE} Please check if Ollama is running with the {self.model_name} model."
+
+    async def agenerate_response_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Generate a streaming response from the LLM model without blocking the event loop.
+
+        Args:
+            prompt: The prompt to generate a response for
+            system_prompt: Optional system prompt to set context
+
+        Yields:
+            str: Chunks of the generated response
+        """
+        try:
+            stream = await self._get_async_client().chat(
+                model=self.model_name,
+                messages=self._build_messages(prompt, system_prompt),
+                options=self._streaming_options(),
+                stream=True,
+                keep_alive="5m",
+            )
+            async for chunk in stream:
+                if "message" in chunk and "content" in chunk["message"]:
+                    yield chunk["message"]["content"]
+        except Exception as e:
+            logger.error(f"Error generating streaming response: {e}")
+            yield f"{GENERATION_ERROR_MESSAGE} Please check if Ollama is running with the {self.model_name} model."
+
+    def _get_async_client(self) -> ollama.AsyncClient:
+        """Get the Ollama async client, creating it on first use.
+
+        Returns:
+            ollama.AsyncClient: The shared async client
+        """
+        if self._async_client is None:
+            self._async_client = ollama.AsyncClient()
+        return self._async_client
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: str | None) -> list[dict[str, str]]:
+        """Build the chat messages for a prompt.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+
+        Returns:
+            list[dict[str, str]]: The chat messages
+        """
+        messages = []
+
+        # Add system message if provided
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        # Add user message
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _generation_options(self) -> dict[str, Any]:
+        """Get the model options for a complete response.
+
+        Returns:
+            dict[str, Any]: The Ollama model options
+        """
+        return {
+            "temperature": self.temperature,
+            "num_predict": self.max_tokens,
+        }
+
+    def _streaming_options(self) -> dict[str, Any]:
+        """Get the model options for a streamed response, tuned for a fast first token.
+
+        Returns:
+            dict[str, Any]: The Ollama model options
+        """
+        return {
+            **self._generation_options(),
+            "num_ctx": 2048,  # Reduce context window for faster processing
+            "top_k": 40,
+            "top_p": 0.9,
+            "repeat_penalty": 1.1,
+            "seed": -1,
+            "num_thread": 0,  # Use all available threads
+        }
 
     def get_model_name(self) -> str:
         """Get the name of the model being used.
@@ -1,12 +1,14 @@
 """RAG orchestrator service that coordinates document retrieval and LLM generation."""
 
+import asyncio
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 from tapio.prompts import load_prompt
 from tapio.services.document_retrieval_service import DocumentRetrievalService
-from tapio.services.llm_service import LLMService
+from tapio.services.llm_service import GENERATION_ERROR_MESSAGE, LLMService
+from tapio.services.response_cache import ResponseCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ class RAGOrchestrator:
         model_name: str = "llama3.2",
         max_tokens: int = 1024,
         num_results: int = 5,
+        cache_responses: bool = True,
     ):
         """Initialize the RAG orchestrator.
 
@@ -31,6 +34,7 @@ class RAGOrchestrator:
             model_name: Name of the LLM model to use
             max_tokens: Maximum number of tokens to generate
             num_results: Number of documents to retrieve from the vector store
+            cache_responses: Whether to reuse responses to repeated queries
         """
         # Initialize the document retrieval service
         self.doc_retrieval_service = DocumentRetrievalService(
@@ -45,6 +49,9 @@ class RAGOrchestrator:
             max_tokens=max_tokens,
         )
 
+        # Repeated questions are answered from the cache instead of the LLM
+        self.response_cache = ResponseCache() if cache_responses else None
+
         logger.info(
             f"Initialized RAG orchestrator with collection '{collection_name}' and model '{model_name}'",
         )
@@ -69,18 +76,12 @@ class RAGOrchestrator:
                 query_text,
             )
 
-            # Step 2: Format documents as context for LLM
-            context_text = self.doc_retrieval_service.format_documents_as_context(
-                retrieved_docs,
-            )
+            cached_response = self._get_cached_response(query_text, retrieved_docs)
+            if cached_response is not None:
+                return cached_response, retrieved_docs
 
-            # Step 3: Create prompts
-            system_prompt = load_prompt("system_prompt")
-            user_prompt = load_prompt(
-                "user_query",
-                context=context_text,
-                question=query_text,
-            )
+            # Steps 2-3: Format documents as context and create prompts
+            system_prompt, user_prompt = self._build_prompts(query_text, retrieved_docs)
 
             # Step 4: Generate response using LLM service
             logger.info("Generating response with LLM")
@@ -89,6 +90,7 @@ class RAGOrchestrator:
                 system_prompt=system_prompt,
             )
 
+            self._cache_response(query_text, str(response), retrieved_docs)
             return str(response), retrieved_docs
         except Exception as e:
             logger.error(f"Error generating RAG response: {e}")
@@ -118,18 +120,16 @@ class RAGOrchestrator:
                 query_text,
             )
 
-            # Step 2: Format documents as context for LLM
-            context_text = self.doc_retrieval_service.format_documents_as_context(
-                retrieved_docs,
-            )
+            cached_response = self._get_cached_response(query_text, retrieved_docs)
+            if cached_response is not None:
 
-            # Step 3: Create prompts
-            system_prompt = load_prompt("system_prompt")
-            user_prompt = load_prompt(
-                "user_query",
-                context=context_text,
-                question=query_text,
-            )
+                def cached_generator() -> Generator[str, None, None]:
+                    yield cached_response
+
+                return cached_generator(), retrieved_docs
+
+            # Steps 2-3: Format documents as context and create prompts
+            system_prompt, user_prompt = self._build_prompts(query_text, retrieved_docs)
 
             # Step 4: Create the streaming generator
             logger.info("Generating streaming response with LLM")
@@ -139,11 +139,15 @@ class RAGOrchestrator:
                     prompt=user_prompt,
                     system_prompt=system_prompt,
                 )
+                chunks = []
                 try:
                     logger.info("Starting to consume LLM response stream")
-                    # Stream the LLM response directly using yield from
-                    yield from llm_response_stream
+                    for chunk in llm_response_stream:
+                        chunks.append(chunk)
+                        yield chunk
 
+                    # Only a fully consumed stream is a complete response worth caching
+                    self._cache_response(query_text, "".join(chunks), retrieved_docs)
                 except Exception:
                     logger.exception("Error in stream generator")
                     yield "I encountered an error while processing your query. Please try again."
@@ -162,6 +166,160 @@ class RAGOrchestrator:
 
             return error_generator(), []
 
+    async def aquery(
+        self,
+        query_text: str,
+        history: list[dict[str, Any]] | None = None,
+    ) -> tuple[str, list[Any]]:
+        """Generate a response using RAG without blocking the event loop.
+
+        The vector store lookup runs in a worker thread and the LLM is called
+        through Ollama's async client, so other queries are served while this
+        one waits for generation.
+
+        Args:
+            query_text: The user's query
+            history: Chat history (optional)
+
+        Returns:
+            Tuple containing the response and the retrieved documents
+        """
+        try:
+            retrieved_docs = await asyncio.to_thread(
+                self.doc_retrieval_service.retrieve_documents,
+                query_text,
+            )
+
+            cached_response = self._get_cached_response(query_text, retrieved_docs)
+            if cached_response is not None:
+                return cached_response, retrieved_docs
+
+            system_prompt, user_prompt = self._build_prompts(query_text, retrieved_docs)
+
+            logger.info("Generating response with LLM")
+            response = await self.llm_service.agenerate_response(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+            )
+
+            self._cache_response(query_text, response, retrieved_docs)
+            return response, retrieved_docs
+        except Exception as e:
+            logger.error(f"Error generating RAG response: {e}")
+            return (
+                "I encountered an error while processing your query. Please try again.",
+                [],
+            )
+
+    async def aquery_stream(
+        self,
+        query_text: str,
+        history: list[dict[str, Any]] | None = None,
+    ) -> tuple[AsyncGenerator[str, None], list[Any]]:
+        """Generate a streaming response using RAG without blocking the event loop.
+
+        Args:
+            query_text: The user's query
+            history: Chat history (optional)
+
+        Returns:
+            Tuple containing the async response generator and the retrieved documents
+        """
+        try:
+            logger.info("Retrieving relevant documents")
+            retrieved_docs = await asyncio.to_thread(
+                self.doc_retrieval_service.retrieve_documents,
+                query_text,
+            )
+
+            cached_response = self._get_cached_response(query_text, retrieved_docs)
+            if cached_response is not None:
+
+                async def cached_generator() -> AsyncGenerator[str, None]:
+                    yield cached_response
+
+                return cached_generator(), retrieved_docs
+
+            system_prompt, user_prompt = self._build_prompts(query_text, retrieved_docs)
+
+            logger.info("Generating streaming response with LLM")
+
+            async def stream_generator() -> AsyncGenerator[str, None]:
+                llm_response_stream = self.llm_service.agenerate_response_stream(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                )
+                chunks = []
+                try:
+                    async for chunk in llm_response_stream:
+                        chunks.append(chunk)
+                        yield chunk
+
+                    # Only a fully consumed stream is a complete response worth caching
+                    self._cache_response(query_text, "".join(chunks), retrieved_docs)
+                except Exception:
+                    logger.exception("Error in stream generator")
+                    yield "I encountered an error while processing your query. Please try again."
+                finally:
+                    await llm_response_stream.aclose()
+
+            return stream_generator(), retrieved_docs
+
+        except Exception:
+            logger.exception("Error in query_stream setup")
+
+            async def error_generator() -> AsyncGenerator[str, None]:
+                yield "I encountered an error while processing your query. Please try again."
+
+            return error_generator(), []
+
+    def _build_prompts(self, query_text: str, retrieved_docs: list[Any]) -> tuple[str, str]:
+        """Create the system and user prompts for a query.
+
+        Args:
+            query_text: The user's query
+            retrieved_docs: Documents retrieved for the query
+
+        Returns:
+            Tuple containing the system prompt and the user prompt
+        """
+        context_text = self.doc_retrieval_service.format_documents_as_context(
+            retrieved_docs,
+        )
+        system_prompt = load_prompt("system_prompt")
+        user_prompt = load_prompt(
+            "user_query",
+            context=context_text,
+            question=query_text,
+        )
+        return system_prompt, user_prompt
+
+    def _get_cached_response(self, query_text: str, retrieved_docs: list[Any]) -> str | None:
+        """Look up a cached response to a query.
+
+        Args:
+            query_text: The user's query
+            retrieved_docs: Documents retrieved for the query
+
+        Returns:
+            The cached response, or None if caching is disabled or there is no match
+        """
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(query_text, retrieved_docs)
+
+    def _cache_response(self, query_text: str, response: str, retrieved_docs: list[Any]) -> None:
+        """Cache a generated response unless it reports a generation error.
+
+        Args:
+            query_text: The user's query
+            response: The generated response
+            retrieved_docs: Documents the response was generated from
+        """
+        if self.response_cache is None or not response or response.startswith(GENERATION_ERROR_MESSAGE):
+            return
+        self.response_cache.put(query_text, response, retrieved_docs)
+
     def check_model_availability(self) -> bool:
         """Check if the LLM model is available.
 
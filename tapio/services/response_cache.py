@@ -0,0 +1,143 @@
+"""Response cache for the RAG orchestrator."""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query_text: str) -> str:
+    """Normalize a query so trivially different phrasings share a cache entry.
+
+    The query is lowercased, punctuation is removed and whitespace is collapsed.
+
+    Args:
+        query_text: The user's query
+
+    Returns:
+        The normalized query
+    """
+    without_punctuation = _PUNCTUATION_RE.sub(" ", query_text.lower())
+    return _WHITESPACE_RE.sub(" ", without_punctuation).strip()
+
+
+def document_ids(documents: list[Any]) -> frozenset[str]:
+    """Build stable identifiers for retrieved documents.
+
+    Args:
+        documents: List of retrieved documents
+
+    Returns:
+        Set of identifiers derived from each document's source and content
+    """
+    ids = set()
+    for doc in documents:
+        metadata = doc.metadata if hasattr(doc, "metadata") and isinstance(doc.metadata, dict) else {}
+        source = str(metadata.get("source_url", metadata.get("url", "")))
+        content = doc.page_content if hasattr(doc, "page_content") else str(doc)
+        digest = hashlib.blake2b(str(content).encode("utf-8"), digest_size=16).hexdigest()
+        ids.add(f"{source}#{digest}")
+    return frozenset(ids)
+
+
+class _CacheEntry(NamedTuple):
+    response: str
+    doc_ids: frozenset[str]
+    created_at: float
+
+
+class ResponseCache:
+    """Thread-safe cache of generated responses keyed on the normalized query.
+
+    A cached response is only served when the documents retrieved for the new
+    query overlap enough with the documents the response was generated from, so
+    answers go stale together with the vector store content they were grounded on.
+    Entries expire after a TTL and the least recently used entries are evicted
+    once the cache is full.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        min_doc_overlap: float = 0.8,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Number of seconds a cached response stays valid
+            min_doc_overlap: Minimum Jaccard similarity between the cached and the
+                newly retrieved documents for a cached response to be served
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.min_doc_overlap = min_doc_overlap
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, query_text: str, retrieved_docs: list[Any]) -> str | None:
+        """Look up a cached response for a query.
+
+        Args:
+            query_text: The user's query
+            retrieved_docs: Documents retrieved for the query
+
+        Returns:
+            The cached response, or None if there is no valid, grounded entry
+        """
+        key = normalize_query(query_text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            if _jaccard(entry.doc_ids, document_ids(retrieved_docs)) < self.min_doc_overlap:
+                return None
+            self._entries.move_to_end(key)
+
+        logger.info(f"Serving cached response for query: {query_text}")
+        return entry.response
+
+    def put(self, query_text: str, response: str, retrieved_docs: list[Any]) -> None:
+        """Cache a generated response.
+
+        Args:
+            query_text: The user's query
+            response: The generated response
+            retrieved_docs: Documents the response was generated from
+        """
+        key = normalize_query(query_text)
+        entry = _CacheEntry(response, document_ids(retrieved_docs), time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _jaccard(first: frozenset[str], second: frozenset[str]) -> float:
+    """Compute the Jaccard similarity of two sets, treating two empty sets as identical."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
@@ -2,14 +2,33 @@
 
 import logging
 import os
+from typing import Any
 
 import frontmatter  # type: ignore[import-untyped]
+from frontmatter.default_handlers import YAMLHandler  # type: ignore[import-untyped]
 
 from tapio.config.settings import DEFAULT_DIRS
 
+try:
+    from yaml import CSafeLoader as FrontmatterLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as FrontmatterLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+class _FastYAMLHandler(YAMLHandler):
+    """YAML frontmatter handler that parses with the libyaml loader when available."""
+
+    def load(self, fm: str, **kwargs: object) -> Any:
+        kwargs.setdefault("Loader", FrontmatterLoader)
+        return super().load(fm, **kwargs)
+
+
+# The parser only writes YAML frontmatter, so the format is not detected per file
+_YAML_HANDLER = _FastYAMLHandler()
+
+
 def read_markdown_file(file_path: str) -> tuple[dict, str]:
     """
     Read a markdown file with frontmatter and return the metadata and content separately.
@@ -22,7 +41,7 @@ def read_markdown_file(file_path: str) -> tuple[dict, str]:
     """
     try:
         with open(file_path, encoding="utf-8") as f:
-            post = frontmatter.load(f)
+            post = frontmatter.load(f, handler=_YAML_HANDLER)
             metadata = post.metadata
             content = post.content
 
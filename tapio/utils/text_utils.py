@@ -11,6 +11,26 @@ from langchain_text_splitters import (  # type: ignore[import-not-found]
     RecursiveCharacterTextSplitter,
 )
 
+# Patterns are compiled once at import time rather than looked up in the
+# re module cache on every call
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", flags=re.DOTALL)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", flags=re.DOTALL)
+_COMMENT_RE = re.compile(r"<!--.*?-->", flags=re.DOTALL)
+_EVENT_ATTR_DOUBLE_RE = re.compile(r' on\w+="[^"]*"')
+_EVENT_ATTR_SINGLE_RE = re.compile(r" on\w+='[^']*'")
+_JS_HREF_DOUBLE_RE = re.compile(r'href="javascript:[^"]*"')
+_JS_HREF_SINGLE_RE = re.compile(r"href='javascript:[^']*'")
+_INLINE_JS_RE = re.compile(r"(\s)javascript:")
+_H1_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", flags=re.DOTALL)
+_H2_RE = re.compile(r"<h2[^>]*>(.*?)</h2>", flags=re.DOTALL)
+_H3_RE = re.compile(r"<h3[^>]*>(.*?)</h3>", flags=re.DOTALL)
+_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", flags=re.DOTALL)
+_BREAK_RE = re.compile(r"<br[^>]*>")
+_LIST_ITEM_RE = re.compile(r"<li[^>]*>(.*?)</li>", flags=re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n\s+\n")
+
 
 def is_pdf_url(url: str) -> bool:
     """
@@ -64,8 +84,8 @@ def chunk_html_content(
         return [{"content": html_content.strip(), "metadata": {}}]
 
     # Extract plain text for size estimation
-    plain_text = re.sub(r"<[^>]+>", " ", html_content)
-    plain_text = re.sub(r"\s+", " ", plain_text).strip()
+    plain_text = _TAG_RE.sub(" ", html_content)
+    plain_text = _WHITESPACE_RE.sub(" ", plain_text).strip()
 
     # If the content is already small, don't bother chunking
     if len(plain_text) <= chunk_size:
@@ -157,18 +177,18 @@ def remove_javascript(html_content: str) -> str:
         HTML content with JavaScript removed
     """
     # Remove all <script> tags and their contents
-    cleaned = re.sub(r"<script[^>]*>.*?</script>", "", html_content, flags=re.DOTALL)
+    cleaned = _SCRIPT_RE.sub("", html_content)
 
     # Remove onclick, onload and other JavaScript event attributes
-    cleaned = re.sub(r' on\w+="[^"]*"', "", cleaned)
-    cleaned = re.sub(r" on\w+='[^']*'", "", cleaned)
+    cleaned = _EVENT_ATTR_DOUBLE_RE.sub("", cleaned)
+    cleaned = _EVENT_ATTR_SINGLE_RE.sub("", cleaned)
 
     # Remove JavaScript: URLs
-    cleaned = re.sub(r'href="javascript:[^"]*"', 'href="#"', cleaned)
-    cleaned = re.sub(r"href='javascript:[^']*'", "href='#'", cleaned)
+    cleaned = _JS_HREF_DOUBLE_RE.sub('href="#"', cleaned)
+    cleaned = _JS_HREF_SINGLE_RE.sub("href='#'", cleaned)
 
     # Remove inline JS that might have been missed
-    cleaned = re.sub(r"(\s)javascript:", r"\1", cleaned)
+    cleaned = _INLINE_JS_RE.sub(r"\1", cleaned)
 
     return cleaned
 
@@ -215,34 +235,29 @@ def _basic_clean_html(html_content: str) -> str:
     while preserving important structural elements
     """
     # Remove script and style tags with their content
-    cleaned = re.sub(r"<script[^>]*>.*?</script>", "", html_content, flags=re.DOTALL)
-    cleaned = re.sub(r"<style[^>]*>.*?</style>", "", cleaned, flags=re.DOTALL)
+    cleaned = _SCRIPT_RE.sub("", html_content)
+    cleaned = _STYLE_RE.sub("", cleaned)
 
     # Remove comments
-    cleaned = re.sub(r"<!--.*?-->", "", cleaned, flags=re.DOTALL)
+    cleaned = _COMMENT_RE.sub("", cleaned)
 
     # Convert headers to plain text with newlines
-    cleaned = re.sub(r"<h1[^>]*>(.*?)</h1>", r"\n\n# \1\n\n", cleaned, flags=re.DOTALL)
-    cleaned = re.sub(r"<h2[^>]*>(.*?)</h2>", r"\n\n## \1\n\n", cleaned, flags=re.DOTALL)
-    cleaned = re.sub(
-        r"<h3[^>]*>(.*?)</h3>",
-        r"\n\n### \1\n\n",
-        cleaned,
-        flags=re.DOTALL,
-    )
+    cleaned = _H1_RE.sub(r"\n\n# \1\n\n", cleaned)
+    cleaned = _H2_RE.sub(r"\n\n## \1\n\n", cleaned)
+    cleaned = _H3_RE.sub(r"\n\n### \1\n\n", cleaned)
 
     # Convert paragraphs and breaks to newlines
-    cleaned = re.sub(r"<p[^>]*>(.*?)</p>", r"\n\n\1\n\n", cleaned, flags=re.DOTALL)
-    cleaned = re.sub(r"<br[^>]*>", "\n", cleaned)
+    cleaned = _PARAGRAPH_RE.sub(r"\n\n\1\n\n", cleaned)
+    cleaned = _BREAK_RE.sub("\n", cleaned)
 
     # Convert lists to text with bullet points
-    cleaned = re.sub(r"<li[^>]*>(.*?)</li>", r"\n• \1", cleaned, flags=re.DOTALL)
+    cleaned = _LIST_ITEM_RE.sub(r"\n• \1", cleaned)
 
     # Remove other HTML tags
-    cleaned = re.sub(r"<[^>]+>", " ", cleaned)
+    cleaned = _TAG_RE.sub(" ", cleaned)
 
     # Fix whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    cleaned = re.sub(r"\n\s+\n", "\n\n", cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned)
+    cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)
 
     return cleaned.strip()
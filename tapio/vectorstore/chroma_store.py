@@ -1,5 +1,6 @@
 """ChromaDB vector store abstraction using LangChain."""
 
+import functools
 import logging
 from typing import Any
 
@@ -24,6 +25,8 @@ class ChromaStore:
         """
         # Initialize embeddings
         self.embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+        # Repeated questions reuse their embedding instead of running the model again
+        self._embed_query = functools.lru_cache(maxsize=1024)(self.embeddings.embed_query)
 
         # Initialize the vector store
         self.vector_db = Chroma(
@@ -32,7 +35,7 @@ class ChromaStore:
             persist_directory=persist_directory,
         )
 
-        logger.debug(f"Initialized ChromaStore with collection: {collection_name}")
+        logger.debug("Initialized ChromaStore with collection: %s", collection_name)
 
     def add_document(
         self,
@@ -52,21 +55,7 @@ class ChromaStore:
             metadata: Document metadata
         """
         try:
-            # Extract content from metadata if available
-            document_text = metadata.get("content", "") if metadata else ""
-
-            # If content is missing from metadata but available elsewhere, try to find it
-            if not document_text and metadata is not None:
-                # Look for content in other common field names
-                for field in ["text", "body", "page_content", "full_text"]:
-                    if metadata is not None and field in metadata:
-                        document_text = metadata[field]
-                        break
-
-            # Ensure we have some text content
-            if not document_text:
-                logger.warning(f"No content found for document {document_id}")
-                document_text = f"Empty document: {document_id}"
+            document_text = self._get_document_text(document_id, metadata)
 
             # Create document dictionary with IDs
             # Note: LangChain's Chroma will compute embeddings automatically if not provided
@@ -76,25 +65,118 @@ class ChromaStore:
                 ids=[document_id],
             )
 
-            logger.debug(f"Added document {document_id} to vector store")
+            logger.debug("Added document %s to vector store", document_id)
 
         except Exception as e:
             logger.error(f"Failed to add document {document_id}: {e}")
             raise
 
-    def query(self, query_text: str, n_results: int = 5) -> list[Document]:
+    def add_documents(
+        self,
+        document_ids: list[str],
+        metadatas: list[dict[str, Any]],
+        batch_size: int = 256,
+    ) -> None:
+        """
+        Add many documents to the vector store in batches.
+
+        Each batch is embedded and inserted with a single call, which avoids the
+        per-call overhead of adding documents one at a time with add_document.
+
+        Args:
+            document_ids: Unique identifiers for the documents
+            metadatas: Metadata for each document, with the text in the same fields
+                add_document reads it from
+            batch_size: Number of documents embedded and inserted per call
+
+        Raises:
+            ValueError: If the number of IDs and metadata entries differ
+        """
+        if len(document_ids) != len(metadatas):
+            raise ValueError(
+                f"Got {len(document_ids)} document IDs but {len(metadatas)} metadata entries",
+            )
+
+        for start in range(0, len(document_ids), batch_size):
+            batch_ids = document_ids[start : start + batch_size]
+            batch_metadatas = metadatas[start : start + batch_size]
+            try:
+                self.vector_db.add_texts(
+                    texts=[
+                        self._get_document_text(document_id, metadata)
+                        for document_id, metadata in zip(batch_ids, batch_metadatas, strict=True)
+                    ],
+                    metadatas=batch_metadatas,
+                    ids=batch_ids,
+                )
+                logger.debug("Added %d documents to vector store", len(batch_ids))
+            except Exception as e:
+                logger.error(f"Failed to add documents {batch_ids[0]}..{batch_ids[-1]}: {e}")
+                raise
+
+    @staticmethod
+    def _get_document_text(document_id: str, metadata: dict[str, Any] | None) -> str:
+        """
+        Get the text of a document from its metadata.
+
+        Args:
+            document_id: Unique identifier for the document
+            metadata: Document metadata
+
+        Returns:
+            The document text, or a placeholder if the metadata has none
+        """
+        # Extract content from metadata if available
+        document_text = metadata.get("content", "") if metadata else ""
+
+        # If content is missing from metadata but available elsewhere, try to find it
+        if not document_text and metadata is not None:
+            # Look for content in other common field names
+            for field in ["text", "body", "page_content", "full_text"]:
+                if field in metadata:
+                    document_text = metadata[field]
+                    break
+
+        # Ensure we have some text content
+        if not document_text:
+            logger.warning(f"No content found for document {document_id}")
+            document_text = f"Empty document: {document_id}"
+
+        return document_text
+
+    def embed_query(self, query_text: str) -> list[float]:
+        """
+        Embed a query, reusing the embedding of a recently embedded identical query.
+
+        Args:
+            query_text: Text to embed
+
+        Returns:
+            The query embedding. It may be shared with other callers and must not be modified.
+        """
+        return self._embed_query(query_text)
+
+    def query(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        query_embedding: list[float] | None = None,
+    ) -> list[Document]:
         """
         Query the vector store by text.
 
         Args:
             query_text: Text to search for
             n_results: Number of results to return
+            query_embedding: Embedding of query_text if the caller already computed it
 
         Returns:
             List of documents most similar to the query
         """
         try:
-            results = self.vector_db.similarity_search(query=query_text, k=n_results)
+            if query_embedding is None:
+                query_embedding = self.embed_query(query_text)
+            results = self.vector_db.similarity_search_by_vector(embedding=query_embedding, k=n_results)
 
             # Enhance results with citation information
             for doc in results:
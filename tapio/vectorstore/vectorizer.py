@@ -2,6 +2,7 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from langchain.schema.document import Document  # type: ignore[import-not-found]
@@ -9,10 +10,15 @@ from langchain_chroma import Chroma  # type: ignore[import-not-found]
 from langchain_huggingface import HuggingFaceEmbeddings  # type: ignore[import-not-found]
 from langchain_text_splitters import MarkdownTextSplitter  # type: ignore[import-not-found]
 
+from tapio.config.settings import DEFAULT_VECTORIZE_BATCH_SIZE
 from tapio.utils.markdown_utils import find_markdown_files, read_markdown_file
 
 logger = logging.getLogger(__name__)
 
+# Inference backends supported by sentence-transformers. The ONNX and OpenVINO
+# backends need the matching extra, e.g. ``sentence-transformers[onnx]``.
+EMBEDDING_BACKENDS = ("torch", "onnx", "openvino")
+
 
 class MarkdownVectorizer:
     """Vectorize markdown content and store in ChromaDB using LangChain."""
@@ -24,6 +30,8 @@ class MarkdownVectorizer:
         embedding_model_name: str = "all-MiniLM-L6-v2",
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        embedding_backend: str = "torch",
+        embedding_model_file: str | None = None,
     ):
         """
         Initialize the vectorizer.
@@ -34,9 +42,20 @@ class MarkdownVectorizer:
             embedding_model_name: Name of the sentence-transformers model to use
             chunk_size: Size of text chunks in characters
             chunk_overlap: Overlap between chunks in characters
+            embedding_backend: Inference backend for the embedding model ("torch", "onnx" or "openvino")
+            embedding_model_file: Optional model file to load for the ONNX/OpenVINO backends,
+                e.g. a quantized export such as "onnx/model_qint8_avx512_vnni.onnx"
         """
+        if embedding_backend not in EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"Unsupported embedding backend: {embedding_backend}. Expected one of: {', '.join(EMBEDDING_BACKENDS)}",
+            )
+
         # Initialize embedding model
-        self.embeddings = HuggingFaceEmbeddings(model_name=embedding_model_name)
+        self.embeddings = HuggingFaceEmbeddings(
+            model_name=embedding_model_name,
+            model_kwargs=self._build_model_kwargs(embedding_backend, embedding_model_file),
+        )
 
         # Initialize text splitter for markdown
         self.text_splitter = MarkdownTextSplitter(
@@ -57,14 +76,34 @@ class MarkdownVectorizer:
 
         # Save configuration
         self.embedding_model_name = embedding_model_name
+        self.embedding_backend = embedding_backend
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
 
+    @staticmethod
+    def _build_model_kwargs(backend: str, model_file: str | None) -> dict[str, Any]:
+        """
+        Build the sentence-transformers keyword arguments for an embedding backend.
+
+        Args:
+            backend: Inference backend for the embedding model
+            model_file: Optional model file to load for the ONNX/OpenVINO backends
+
+        Returns:
+            Keyword arguments passed through to the SentenceTransformer constructor
+        """
+        model_kwargs: dict[str, Any] = {}
+        if backend != "torch":
+            model_kwargs["backend"] = backend
+        if model_file:
+            model_kwargs["model_kwargs"] = {"file_name": model_file}
+        return model_kwargs
+
     def process_directory(
         self,
         input_dir: str,
         site_filter: str | None = None,
-        batch_size: int = 20,
+        batch_size: int = DEFAULT_VECTORIZE_BATCH_SIZE,
     ) -> int:
         """
         Process all markdown files in a directory.
@@ -83,17 +122,25 @@ class MarkdownVectorizer:
 
         logger.info(f"Found {total_files} markdown files to process")
 
-        # Process files in batches
+        # Process files in batches. While one batch is being embedded and stored,
+        # a background thread reads and splits the next one, so disk reads overlap
+        # with the CPU-bound embedding step.
+        batches = [markdown_files[i : i + batch_size] for i in range(0, total_files, batch_size)]
         processed_count = 0
         chunk_count = 0
-        for i in range(0, total_files, batch_size):
-            batch = markdown_files[i : i + batch_size]
-            new_chunks = self._process_batch(batch)
-            processed_count += len(batch)
-            chunk_count += new_chunks
-            logger.info(
-                f"Processed {processed_count}/{total_files} files ({chunk_count} chunks)",
-            )
+        if batches:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="markdown-reader") as reader:
+                pending = reader.submit(self._load_batch, batches[0])
+                for index, batch in enumerate(batches):
+                    documents = pending.result()
+                    if index + 1 < len(batches):
+                        pending = reader.submit(self._load_batch, batches[index + 1])
+
+                    chunk_count += self._store_documents(documents)
+                    processed_count += len(batch)
+                    logger.info(
+                        f"Processed {processed_count}/{total_files} files ({chunk_count} chunks)",
+                    )
 
         return processed_count
 
@@ -107,6 +154,18 @@ class MarkdownVectorizer:
         Returns:
             Number of chunks processed
         """
+        return self._store_documents(self._load_batch(file_paths))
+
+    def _load_batch(self, file_paths: list[str]) -> list[Document]:
+        """
+        Read and split a batch of markdown files into chunk documents.
+
+        Args:
+            file_paths: List of paths to markdown files
+
+        Returns:
+            Chunk documents ready to be embedded
+        """
         all_documents = []
 
         for file_path in file_paths:
@@ -141,11 +200,22 @@ class MarkdownVectorizer:
             except Exception as e:
                 logger.error(f"Error processing file {file_path}: {e}")
 
-        # Add all documents to the vector store
-        if all_documents:
-            self.vector_db.add_documents(all_documents)
+        return all_documents
+
+    def _store_documents(self, documents: list[Document]) -> int:
+        """
+        Embed documents and add them to the vector store in a single call.
+
+        Args:
+            documents: Chunk documents to store
+
+        Returns:
+            Number of chunks stored
+        """
+        if documents:
+            self.vector_db.add_documents(documents)
 
-        return len(all_documents)
+        return len(documents)
 
     def _prepare_metadata(
         self,
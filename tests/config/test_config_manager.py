@@ -204,3 +204,23 @@ class TestConfigManager:
             assert site_descriptions["site2"] == "Second site description"
             # Test that default description is generated for sites without a description
             assert site_descriptions["site3"] == "Configuration for site3"
+
+    def test_config_parsed_once_per_content(self, multi_site_config_yaml):
+        """Test that managers loading the same configuration share one parsed registry."""
+        with patch("tapio.config.config_manager.open", mock_open(read_data=multi_site_config_yaml)):
+            with patch("tapio.config.config_manager.yaml.load", wraps=yaml.load) as mock_load:
+                first = ConfigManager()
+                second = ConfigManager()
+
+        assert mock_load.call_count <= 1
+        assert first._config_registry is second._config_registry
+
+    def test_get_site_config_returns_copy(self, multi_site_config_yaml):
+        """Test that changes to a returned site configuration do not leak into the shared registry."""
+        with patch("tapio.config.config_manager.open", mock_open(read_data=multi_site_config_yaml)):
+            config_manager = ConfigManager()
+
+        site_config = config_manager.get_site_config("site1")
+        site_config.crawler_config.max_depth = 5
+
+        assert config_manager.get_site_config("site1").crawler_config.max_depth == 1
@@ -9,6 +9,7 @@ from tapio.config.config_models import (
     ParserConfig,
     ParserConfigRegistry,
     SiteConfig,
+    compile_xpath,
 )
 
 
@@ -151,6 +152,21 @@ class TestParserConfig:
         element = config.get_content_selector(tree)
         assert element is None
 
+    def test_get_content_selector_priority(self):
+        """Test that an earlier selector wins even when a later one matches earlier in the document."""
+        from lxml import html as lxml_html
+
+        config = ParserConfig(content_selectors=["//article", '//div[@class="content"]'])
+        tree = lxml_html.fromstring(
+            '<html><body><div class="content">Content here</div><article>Article content</article></body></html>',
+        )
+
+        assert config.get_content_selector(tree).text == "Article content"
+
+    def test_compile_xpath_reuses_compiled_selector(self):
+        """Test that each selector is compiled once and reused."""
+        assert compile_xpath("//article") is compile_xpath("//article")
+
 
 class TestSiteConfig:
     """Test the SiteConfig model."""
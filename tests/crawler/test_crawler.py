@@ -1,16 +1,18 @@
 """Test cases for the async BaseCrawler implementation."""
 
 import asyncio
+import json
 import os
+import threading
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from urllib.parse import urljoin
 
 import httpx
 import pytest
-from bs4 import BeautifulSoup
 from pydantic import HttpUrl
 
 from tapio.config.config_models import CrawlerConfig, SiteConfig
-from tapio.crawler.crawler import BaseCrawler
+from tapio.crawler.crawler import BaseCrawler, canonicalize_url
 
 
 def create_test_site_config(
@@ -96,21 +98,53 @@ class TestBaseCrawler:
         expected = os.path.join(crawler.output_dir, "example.com", "path.html")
         assert path == expected
 
+    def test_get_file_path_from_url_with_html_extension(self):
+        """Test that an existing .html extension is kept once, after any query."""
+        site_config = create_test_site_config("https://example.com")
+        crawler = BaseCrawler("test_site", site_config)
+
+        path = crawler._get_file_path_from_url("https://example.com/page.html")
+        assert path == os.path.join(crawler.output_dir, "example.com", "page.html")
+
+        path = crawler._get_file_path_from_url("https://example.com/page.html?a=1&b=2")
+        assert path == os.path.join(crawler.output_dir, "example.com", "page_a_1_b_2.html")
+
+        path = crawler._get_file_path_from_url("https://example.com/?kieli=fi")
+        assert path == os.path.join(crawler.output_dir, "example.com", "index_kieli_fi.html")
+
     def test_save_html_content(self):
         """Test saving HTML content to file."""
         site_config = create_test_site_config("https://example.com")
         crawler = BaseCrawler("test_site", site_config)
 
         url = "https://example.com/test"
-        html_content = "<html><body><h1>Test Page</h1></body></html>"
+        html_content = "<html><body><h1>Test Page</h1>\n<p>Oleskelulupa ja työlupa</p></body></html>"
         crawler._save_html_content(url, html_content)
 
         expected_path = crawler._get_file_path_from_url(url)
         assert os.path.exists(expected_path)
 
-        with open(expected_path, encoding="utf-8") as f:
+        with open(expected_path, "rb") as f:
             saved_content = f.read()
-            assert saved_content == html_content
+            assert saved_content == html_content.encode("utf-8")
+
+    def test_save_html_content_creates_directories_once(self, tmp_path):
+        """Test that parent directories are only created once per crawler."""
+        site_config = create_test_site_config("https://example.com")
+
+        with patch("tapio.crawler.crawler.DEFAULT_CONTENT_DIR", str(tmp_path)):
+            crawler = BaseCrawler("test_site", site_config)
+
+        site_dir = os.path.join(crawler.output_dir, "example.com", "palvelut")
+        with patch("tapio.crawler.crawler.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+            crawler._save_html_content("https://example.com/palvelut/a", "<html></html>")
+            mock_makedirs.assert_any_call(site_dir, exist_ok=True)
+            mock_makedirs.reset_mock()
+
+            crawler._save_html_content("https://example.com/palvelut/b", "<html></html>")
+            mock_makedirs.assert_not_called()
+
+        assert os.path.exists(os.path.join(site_dir, "b.html"))
 
     def test_is_allowed_domain(self):
         """Test domain filtering."""
@@ -121,8 +155,12 @@ class TestBaseCrawler:
         assert not crawler._is_allowed_domain("https://test.com/page")
         assert not crawler._is_allowed_domain("https://other.com/page")
 
+        # Host names are compared case-insensitively and without port
+        assert crawler._is_allowed_domain("https://EXAMPLE.com:443/page")
+        assert not crawler._is_allowed_domain("https://[invalid/page")
+
     def test_extract_links(self):
-        """Test extracting links from BeautifulSoup."""
+        """Test extracting links from an HTML page."""
         site_config = create_test_site_config("https://example.com")
         crawler = BaseCrawler("test_site", site_config)
 
@@ -138,15 +176,90 @@ class TestBaseCrawler:
         </html>
         """
 
-        soup = BeautifulSoup(html, "lxml")
         base_url = "https://example.com"
 
-        links = crawler._extract_links(soup, base_url)
+        links = crawler._extract_links(html, base_url)
 
         expected_links = ["https://example.com/page1", "https://example.com/page2"]
 
         assert sorted(links) == sorted(expected_links)
 
+    def test_extract_links_resolves_only_relative_links(self):
+        """Test that absolute links are used as they are and only relative links go through urljoin."""
+        site_config = create_test_site_config("https://example.com")
+        crawler = BaseCrawler("test_site", site_config)
+
+        html = '<html><body><a href="https://example.com/page2">Page 2</a><a href="page1">Page 1</a></body></html>'
+
+        with patch("tapio.crawler.crawler.urljoin", wraps=urljoin) as mock_urljoin:
+            links = crawler._extract_links(html, "https://example.com/docs/")
+
+        mock_urljoin.assert_called_once_with("https://example.com/docs/", "page1")
+        assert links == ["https://example.com/page2", "https://example.com/docs/page1"]
+
+    def test_extract_links_canonicalizes_duplicates(self):
+        """Test that variants of the same URL are returned once in canonical form."""
+        site_config = create_test_site_config("https://example.com")
+        crawler = BaseCrawler("test_site", site_config)
+
+        html = """
+        <html>
+            <body>
+                <a href="/page1">Page 1</a>
+                <a href="https://EXAMPLE.com:443/page1">Page 1 again</a>
+                <a href="/page1?utm_source=newsletter&fbclid=abc">Page 1 tracked</a>
+                <a href="/search?q=oleskelulupa&utm_medium=email">Search</a>
+            </body>
+        </html>
+        """
+
+        links = crawler._extract_links(html, "https://example.com")
+
+        assert links == ["https://example.com/page1", "https://example.com/search?q=oleskelulupa"]
+
+    def test_extract_links_skips_non_page_links(self):
+        """Test that links to non-HTML resources and non-HTTP schemes are not followed."""
+        site_config = create_test_site_config("https://example.com")
+        crawler = BaseCrawler("test_site", site_config)
+
+        html = """
+        <html>
+            <body>
+                <a href="/lomakkeet/hakemus.PDF">Form</a>
+                <a href="/kuvat/logo.png?v=2">Logo</a>
+                <a href="tel:+358295419600">Phone</a>
+                <a href=" javascript:void(0)">Script</a>
+                <a href="/documents/ohje">Guide</a>
+                <a href="/ohjeet.html">Guide page</a>
+            </body>
+        </html>
+        """
+
+        links = crawler._extract_links(html, "https://example.com")
+
+        assert links == ["https://example.com/documents/ohje", "https://example.com/ohjeet.html"]
+
+    def test_extract_links_edge_cases(self):
+        """Test link extraction from empty pages and pages with an XML declaration."""
+        site_config = create_test_site_config("https://example.com")
+        crawler = BaseCrawler("test_site", site_config)
+
+        assert crawler._extract_links("", "https://example.com") == []
+
+        xhtml = '<?xml version="1.0" encoding="utf-8"?><html><body><a href="/sivu-ä">Sivu</a></body></html>'
+        assert crawler._extract_links(xhtml, "https://example.com") == ["https://example.com/sivu-ä"]
+
+    def test_canonicalize_url(self):
+        """Test URL canonicalization."""
+        assert canonicalize_url("HTTPS://Example.COM") == "https://example.com/"
+        assert canonicalize_url("http://example.com:80/a") == "http://example.com/a"
+        assert canonicalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+        assert canonicalize_url("https://example.com/a#section") == "https://example.com/a"
+        assert canonicalize_url("https://example.com/a?b=2&a=1") == "https://example.com/a?b=2&a=1"
+        assert canonicalize_url("https://example.com/a?UTM_Source=x&gclid=y") == "https://example.com/a"
+        # Paths are case-sensitive and keep their trailing slash
+        assert canonicalize_url("https://example.com/Path/") == "https://example.com/Path/"
+
     def test_save_url_mappings(self):
         """Test saving URL mappings to a JSON file."""
         site_config = create_test_site_config("https://example.com")
@@ -160,10 +273,104 @@ class TestBaseCrawler:
             },
         }
 
-        with patch("builtins.open", mock_open()) as mock_file:
+        with (
+            patch("builtins.open", mock_open()) as mock_file,
+            patch("tapio.crawler.crawler.os.replace") as mock_replace,
+        ):
             crawler._save_url_mappings()
             expected_path = os.path.join(crawler.output_dir, "url_mappings.json")
-            mock_file.assert_called_once_with(expected_path, "w", encoding="utf-8")
+            mock_file.assert_called_once_with(f"{expected_path}.tmp", "wb")
+            mock_replace.assert_called_once_with(f"{expected_path}.tmp", expected_path)
+
+    def test_url_mappings_round_trip(self, tmp_path):
+        """Test that saved URL mappings are loaded back by a new crawler."""
+        site_config = create_test_site_config("https://example.com")
+
+        with patch("tapio.crawler.crawler.DEFAULT_CONTENT_DIR", str(tmp_path)):
+            crawler = BaseCrawler("test_site", site_config)
+            crawler.url_mappings = {
+                "example.com/hakemus.html": {
+                    "url": "https://example.com/hakemus?kieli=fi&sivu=ä",
+                    "timestamp": "2023-01-01T00:00:00",
+                    "content_type": "text/html",
+                },
+            }
+            crawler._save_url_mappings()
+
+            reloaded = BaseCrawler("test_site", site_config)
+
+        assert reloaded.url_mappings == crawler.url_mappings
+
+    def test_url_mapping_journal_recovery(self, tmp_path):
+        """Test that mappings journaled by an interrupted crawl are recovered."""
+        site_config = create_test_site_config("https://example.com")
+
+        with patch("tapio.crawler.crawler.DEFAULT_CONTENT_DIR", str(tmp_path)):
+            crawler = BaseCrawler("test_site", site_config)
+            crawler._append_url_mapping(
+                "example.com/page1.html",
+                {"url": "https://example.com/page1", "timestamp": "2023-01-01T00:00:00", "content_type": "text/html"},
+            )
+            # Simulate a crawl killed in the middle of writing a line
+            with open(crawler.journal_file, "ab") as f:
+                f.write(b'{"path": "example.com/pa')
+
+            reloaded = BaseCrawler("test_site", site_config)
+            assert reloaded.url_mappings == {
+                "example.com/page1.html": {
+                    "url": "https://example.com/page1",
+                    "timestamp": "2023-01-01T00:00:00",
+                    "content_type": "text/html",
+                },
+            }
+
+            assert reloaded._mappings_dirty
+
+            reloaded._save_url_mappings()
+            assert os.path.exists(reloaded.mapping_file)
+            assert not os.path.exists(f"{reloaded.mapping_file}.tmp")
+            assert not os.path.exists(reloaded.journal_file)
+            assert not reloaded._mappings_dirty
+
+            with open(reloaded.mapping_file, "rb") as f:
+                saved = f.read()
+            assert b"\n" not in saved
+            assert json.loads(saved) == reloaded.url_mappings
+
+    def test_url_mapping_journal_flush_interval(self, tmp_path):
+        """Test that the open journal is flushed every JOURNAL_FLUSH_INTERVAL mappings."""
+        site_config = create_test_site_config("https://example.com")
+        mapping = {"url": "https://example.com/", "timestamp": "2023-01-01T00:00:00", "content_type": "text/html"}
+
+        with (
+            patch("tapio.crawler.crawler.DEFAULT_CONTENT_DIR", str(tmp_path)),
+            patch.object(BaseCrawler, "JOURNAL_FLUSH_INTERVAL", 2),
+        ):
+            crawler = BaseCrawler("test_site", site_config)
+            crawler._open_journal()
+
+            crawler._append_url_mapping("a.html", mapping)
+            assert os.path.getsize(crawler.journal_file) == 0
+
+            crawler._append_url_mapping("b.html", mapping)
+            with open(crawler.journal_file, "rb") as f:
+                assert len(f.readlines()) == 2
+
+            crawler._append_url_mapping("c.html", mapping)
+            crawler._close_journal()
+            with open(crawler.journal_file, "rb") as f:
+                assert len(f.readlines()) == 3
+
+    def test_url_mapping_journal_not_created_without_mappings(self, tmp_path):
+        """Test that a crawl that maps nothing new leaves no journal behind."""
+        site_config = create_test_site_config("https://example.com")
+
+        with patch("tapio.crawler.crawler.DEFAULT_CONTENT_DIR", str(tmp_path)):
+            crawler = BaseCrawler("test_site", site_config)
+            crawler._open_journal()
+            crawler._close_journal()
+
+            assert not os.path.exists(crawler.journal_file)
 
     def test_save_url_mappings_exception(self):
         """Test handling exceptions when saving URL mappings."""
@@ -221,7 +428,39 @@ class TestBaseCrawler:
             result = results[0]
             assert result["url"] == "https://example.com/"
             assert result["depth"] == 0
-            assert "Test" in result["html"]
+            assert result["file_path"] == "/fake/path.html"
+            assert "html" not in result
+
+            # The mapping and the crawl result share one timestamp
+            mapping = crawler.url_mappings[os.path.relpath("/fake/path.html", crawler.output_dir)]
+            assert mapping["timestamp"] == result["crawl_timestamp"]
+
+    @pytest.mark.asyncio
+    async def test_crawl_url_saves_html_off_event_loop(self):
+        """Test that page content is written from a worker thread, not the event loop thread."""
+        site_config = create_test_site_config(base_url="https://example.com", depth=1)
+        crawler = BaseCrawler("test_site", site_config)
+        crawler.max_depth = 0
+
+        mock_response = MagicMock()
+        mock_response.text = "<html><body><h1>Test</h1></body></html>"
+        mock_response.headers = {"content-type": "text/html"}
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        save_threads = []
+
+        def fake_save(url, html_content):
+            save_threads.append(threading.current_thread())
+            return "/fake/path.html"
+
+        with patch.object(crawler, "_save_html_content", side_effect=fake_save):
+            await crawler._crawl_url(mock_client, "https://example.com/", 0, [])
+
+        assert len(save_threads) == 1
+        assert save_threads[0] is not threading.current_thread()
 
     @pytest.mark.asyncio
     async def test_crawl_url_http_error(self):
@@ -599,6 +838,88 @@ class TestBaseCrawler:
                 assert len(results) > 0
                 assert results[0]["url"] == "https://example.com/"  # URLs are normalized
 
+    @pytest.mark.asyncio
+    async def test_crawl_streams_pages_without_collecting(self):
+        """Test that pages reach on_page without being collected when collect_results is False."""
+        site_config = create_test_site_config(base_url="https://example.com", depth=1)
+        crawler = BaseCrawler("test_site", site_config)
+
+        mock_response = MagicMock()
+        mock_response.text = '<html><body><a href="/page1">Page 1</a></body></html>'
+        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client_context = AsyncMock()
+        mock_client_context.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client_context.__aexit__ = AsyncMock(return_value=None)
+
+        seen: list = []
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client_context),
+            patch.object(crawler, "_save_html_content", return_value="/fake/path.html"),
+        ):
+            results = await crawler.crawl(on_page=seen.append, collect_results=False)
+
+        assert results == []
+        assert [page["url"] for page in seen] == ["https://example.com/", "https://example.com/page1"]
+        assert crawler.pages_crawled == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_skips_duplicate_content(self):
+        """Test that a page with the same content as an already saved page is not saved again."""
+        site_config = create_test_site_config(base_url="https://example.com", depth=1)
+        crawler = BaseCrawler("test_site", site_config)
+
+        # The start page links to an alias that serves identical content
+        mock_response = MagicMock()
+        mock_response.text = '<html><body><a href="/alias">Alias</a></body></html>'
+        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client_context = AsyncMock()
+        mock_client_context.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client_context.__aexit__ = AsyncMock(return_value=None)
+
+        saved_path = os.path.join(crawler.output_dir, "index.html")
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client_context),
+            patch.object(crawler, "_save_html_content", return_value=saved_path) as mock_save,
+            patch.object(crawler, "_append_url_mapping") as mock_append,
+            patch.object(crawler, "_save_url_mappings"),
+        ):
+            results = await crawler.crawl()
+
+        assert [page["url"] for page in results] == ["https://example.com/", "https://example.com/alias"]
+        # The duplicate points at the file saved for the first page
+        assert [page["file_path"] for page in results] == [saved_path, saved_path]
+        mock_save.assert_called_once()
+        mock_append.assert_called_once()
+        assert crawler.url_mappings["index.html"]["url"] == "https://example.com/"
+
+    @pytest.mark.asyncio
+    async def test_crawl_skips_mapping_save_when_unchanged(self):
+        """Test that the mapping file is not rewritten when a crawl stores no new pages."""
+        site_config = create_test_site_config(base_url="https://example.com", depth=1)
+        crawler = BaseCrawler("test_site", site_config)
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+        mock_client_context = AsyncMock()
+        mock_client_context.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client_context.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client_context),
+            patch.object(crawler, "_save_url_mappings") as mock_save,
+        ):
+            await crawler.crawl()
+
+        mock_save.assert_not_called()
+
     def test_get_file_path_from_url_path_traversal_protection(self):
         """Test that path traversal attacks are prevented."""
         site_config = create_test_site_config("https://example.com")
@@ -1,8 +1,16 @@
+import asyncio
+import importlib
+import inspect
+import sys
+import threading
+import time
+import types
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from tapio.config.config_models import CrawlerConfig, SiteConfig
+from tapio.crawler import runner as runner_module
 from tapio.crawler.runner import CrawlerRunner
 
 
@@ -42,7 +50,7 @@ class TestCrawlerRunner:
             return_value=[
                 {
                     "url": "https://example.com",
-                    "html": "<html><body>Test</body></html>",
+                    "file_path": "content/example/crawled/example.com/index.html",
                     "depth": 0,
                     "crawl_timestamp": "2023-01-01T00:00:00",
                     "content_type": "text/html",
@@ -100,7 +108,7 @@ class TestCrawlerRunner:
             return_value=[
                 {
                     "url": "https://example.com",
-                    "html": "<html><body>Test</body></html>",
+                    "file_path": "content/example/crawled/example.com/index.html",
                     "depth": 0,
                     "crawl_timestamp": "2023-01-01T00:00:00",
                     "content_type": "text/html",
@@ -124,3 +132,189 @@ class TestCrawlerRunner:
         # Verify results were returned
         assert len(results) == 1
         assert results[0]["url"] == "https://example.com"
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_run_forwards_on_page_callback(self, mock_base_crawler):
+        """Test that the per-page callback and collection flag are handed to the crawler."""
+        mock_crawler_instance = MagicMock()
+        mock_crawler_instance.crawl = AsyncMock(return_value=[])
+        mock_base_crawler.return_value = mock_crawler_instance
+
+        def on_page(page):
+            pass
+
+        self.runner.run("test_site", create_test_site_config(), on_page=on_page, collect_results=False)
+
+        mock_crawler_instance.crawl.assert_called_once_with(on_page=on_page, collect_results=False)
+
+    @patch("tapio.crawler.runner.HAS_UVLOOP", False)
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_run_without_uvloop(self, mock_base_crawler):
+        """Test that the runner falls back to asyncio when uvloop is unavailable."""
+        mock_crawler_instance = MagicMock()
+        mock_crawler_instance.crawl = AsyncMock(return_value=[])
+        mock_base_crawler.return_value = mock_crawler_instance
+
+        with patch("tapio.crawler.runner.asyncio.run", wraps=asyncio.run) as mock_run:
+            results = self.runner.run("test_site", create_test_site_config())
+
+        mock_run.assert_called_once()
+        assert results == []
+
+    @patch("tapio.crawler.runner.HAS_UVLOOP", True)
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_run_with_uvloop(self, mock_base_crawler):
+        """Test that the runner runs the crawl with uvloop when it is available."""
+        mock_crawler_instance = MagicMock()
+        mock_crawler_instance.crawl = AsyncMock(return_value=[])
+        mock_base_crawler.return_value = mock_crawler_instance
+        mock_uvloop = MagicMock()
+        mock_uvloop.run.side_effect = asyncio.run
+
+        with patch("tapio.crawler.runner.uvloop", mock_uvloop, create=True):
+            results = self.runner.run("test_site", create_test_site_config())
+
+        mock_uvloop.run.assert_called_once()
+        assert results == []
+
+    def test_old_uvloop_falls_back_to_asyncio(self):
+        """Test that a uvloop release without uvloop.run (before 0.18) is not used."""
+        old_uvloop = types.ModuleType("uvloop")
+        try:
+            with patch.dict(sys.modules, {"uvloop": old_uvloop}):
+                importlib.reload(runner_module)
+                assert not runner_module.HAS_UVLOOP
+        finally:
+            importlib.reload(runner_module)
+
+    @staticmethod
+    def _streaming_crawler(page_count: int, error: Exception | None = None) -> MagicMock:
+        """Create a mock crawler whose crawl reports pages through the on_page callback."""
+        crawler = MagicMock()
+        crawler.cancelled = False
+
+        async def crawl(on_page=None, collect_results=True):
+            try:
+                for i in range(page_count):
+                    await asyncio.sleep(0)
+                    page_handled = on_page({"url": f"https://example.com/{i}", "file_path": f"{i}.html"})
+                    if inspect.isawaitable(page_handled):
+                        await page_handled
+            except asyncio.CancelledError:
+                crawler.cancelled = True
+                raise
+            if error is not None:
+                raise error
+            return []
+
+        crawler.crawl = crawl
+        return crawler
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_yields_pages_in_order(self, mock_base_crawler):
+        """Test that iter_pages streams every crawled page to the consumer."""
+        mock_base_crawler.return_value = self._streaming_crawler(20)
+
+        pages = list(self.runner.iter_pages("test_site", create_test_site_config(), max_buffered=2))
+
+        assert [page["url"] for page in pages] == [f"https://example.com/{i}" for i in range(20)]
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_slow_consumer_does_not_block_event_loop(self, mock_base_crawler):
+        """Test that other fetches keep making progress while a slow consumer leaves the queue full."""
+        fetch_times: list[float] = []
+
+        async def crawl(on_page=None, collect_results=True):
+            async def fetch_other_pages():
+                for _ in range(100):
+                    await asyncio.sleep(0.005)
+                    fetch_times.append(time.monotonic())
+
+            async def report_pages():
+                for i in range(5):
+                    await on_page({"url": f"https://example.com/{i}", "file_path": f"{i}.html"})
+
+            await asyncio.gather(fetch_other_pages(), report_pages())
+            return []
+
+        crawler = MagicMock()
+        crawler.crawl = crawl
+        mock_base_crawler.return_value = crawler
+
+        pages = self.runner.iter_pages("test_site", create_test_site_config(), max_buffered=1)
+        first = next(pages)
+        paused_at = time.monotonic()
+        time.sleep(0.2)
+        resumed_at = time.monotonic()
+        rest = list(pages)
+
+        assert [page["url"] for page in [first, *rest]] == [f"https://example.com/{i}" for i in range(5)]
+        assert sum(paused_at < t < resumed_at for t in fetch_times) >= 5
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_close_cancels_crawl(self, mock_base_crawler):
+        """Test that closing the iterator early cancels the background crawl."""
+        crawler = self._streaming_crawler(1000)
+        mock_base_crawler.return_value = crawler
+
+        pages = self.runner.iter_pages("test_site", create_test_site_config(), max_buffered=1)
+        first = next(pages)
+        pages.close()
+
+        assert first["url"] == "https://example.com/0"
+        assert crawler.cancelled
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_close_after_crawl_finished(self, mock_base_crawler):
+        """Test that closing the iterator once the crawl is over, before the end marker is read, is a no-op."""
+        crawler = self._streaming_crawler(1)
+        mock_base_crawler.return_value = crawler
+
+        pages = self.runner.iter_pages("test_site", create_test_site_config(), max_buffered=2)
+        first = next(pages)
+        # Wait for the crawl thread to finish and close its event loop
+        deadline = time.monotonic() + 5
+        while any(t.name == "crawler-test_site" for t in threading.enumerate()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pages.close()
+
+        assert first["url"] == "https://example.com/0"
+        assert not crawler.cancelled
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_close_right_after_first_page(self, mock_base_crawler):
+        """Test that closing the iterator right after the first page cancels a crawl that is still running."""
+        crawler = MagicMock()
+        crawler.cancelled = False
+
+        async def crawl(on_page=None, collect_results=True):
+            try:
+                await on_page({"url": "https://example.com/0", "file_path": "0.html"})
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                crawler.cancelled = True
+                raise
+            return []
+
+        crawler.crawl = crawl
+        mock_base_crawler.return_value = crawler
+
+        pages = self.runner.iter_pages("test_site", create_test_site_config())
+        next(pages)
+        started = time.monotonic()
+        pages.close()
+
+        assert crawler.cancelled
+        assert time.monotonic() - started < 5
+
+    @patch("tapio.crawler.runner.BaseCrawler")
+    def test_iter_pages_reraises_crawl_error(self, mock_base_crawler):
+        """Test that an error that stops the crawl surfaces in the consumer."""
+        mock_base_crawler.return_value = self._streaming_crawler(2, error=RuntimeError("boom"))
+
+        pages = []
+        with pytest.raises(RuntimeError, match="boom"):
+            for page in self.runner.iter_pages("test_site", create_test_site_config()):
+                pages.append(page)
+
+        assert len(pages) == 2
@@ -39,3 +39,10 @@ class TestDocument:
         assert document.url == ""
         assert document.content == ""
         assert document.metadata == {}
+
+    def test_uses_slots(self):
+        """Test that Document instances store their fields in slots rather than a __dict__."""
+        document = Document(url="https://example.com/page", content="Content", metadata={})
+
+        assert not hasattr(document, "__dict__")
+        assert document == Document(url="https://example.com/page", content="Content", metadata={})
@@ -0,0 +1,28 @@
+"""Tests for the ParseResult model."""
+
+import pytest
+
+from tapio.models.parse_result import ParseResult
+
+
+class TestParseResult:
+    """Tests for the ParseResult model."""
+
+    def test_to_dict(self):
+        """Test that to_dict round-trips through the constructor."""
+        result = ParseResult(
+            source_file="content/example/crawled/en/services.html",
+            output_file="content/example/parsed/en/services.md",
+            title="Services",
+            domain="en",
+        )
+
+        assert ParseResult(**result.to_dict()) == result
+
+    def test_uses_slots(self):
+        """Test that results carry no per-instance dict."""
+        result = ParseResult(source_file="a.html", output_file="a.md", title="A", domain="en")
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = "value"  # type: ignore[attr-defined]
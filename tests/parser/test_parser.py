@@ -1,14 +1,19 @@
 """Tests for the Parser class."""
 
+import logging
 import os
+import pickle
 import shutil
 import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import orjson
 import yaml
 
+from tapio.models.parse_result import ParseResult
 from tapio.parser import Parser
+from tapio.parser import parser as parser_module
 
 
 class TestParser(unittest.TestCase):
@@ -302,12 +307,352 @@ class TestParser(unittest.TestCase):
         )
 
         # Validate the content of parsed files
-        titles = [result["title"] for result in results]
+        titles = [result.title for result in results]
         self.assertIn("Example Website", titles)
         self.assertIn("About Example", titles)
         self.assertIn("No Main Content", titles)
         self.assertIn("Services", titles)
 
+    def test_parse_all_with_worker_processes(self):
+        """Test that parsing in worker processes gives the same results as parsing in-process."""
+        sequential = self.parser.parse_all(workers=1)
+        parallel = self.parser.parse_all(workers=2, force=True)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(len(parallel), 4)
+
+    def test_parse_files_in_worker(self):
+        """Test that a worker parses its chunk in order, with None for files that fail."""
+        files = [os.path.join(self.input_dir, name) for name in ("about.html", "missing.html", "index.html")]
+
+        with (
+            patch.object(parser_module, "_worker_parser", None),
+            patch.object(parser_module, "_worker_prefetch_executor", None),
+        ):
+            parser_module._init_parse_worker(self.parser)
+            executor = parser_module._worker_prefetch_executor
+            try:
+                with patch.object(parser_module, "ThreadPoolExecutor") as new_executor:
+                    results = parser_module._parse_files_in_worker(files)
+                    second_results = parser_module._parse_files_in_worker(files[:1])
+            finally:
+                executor.shutdown()
+
+        self.assertEqual(
+            [result.title if result else None for result in results], ["About Example", None, "Example Website"]
+        )
+        self.assertEqual([result.title for result in second_results], ["About Example"])
+        # Every chunk of the worker reads on the thread pool created when the worker started
+        new_executor.assert_not_called()
+
+    def test_parse_all_logs_progress_in_batches(self):
+        """Test that progress is reported once per batch of parsed files."""
+        with patch.object(Parser, "PROGRESS_INTERVAL", 2):
+            self.parser.parse_all(workers=1)
+
+        progress = [c.args for c in self.parser.logger.info.call_args_list if c.args[0] == "Parsed %d/%d files"]
+        self.assertEqual(progress, [("Parsed %d/%d files", 2, 4), ("Parsed %d/%d files", 4, 4)])
+
+    def test_parse_all_skips_up_to_date_files(self):
+        """Test that a second run reuses the results of files whose output is newer than the HTML."""
+        first = self.parser.parse_all(workers=1)
+
+        with patch.object(self.parser, "_parse_files", wraps=self.parser._parse_files) as parse_files:
+            second = self.parser.parse_all(workers=1)
+
+        parse_files.assert_called_once_with([], 1)
+        self.assertEqual(second, first)
+
+    def test_parse_all_reparses_modified_files(self):
+        """Test that files changed since their output was written are parsed again."""
+        first = self.parser.parse_all(workers=1)
+        about_file = os.path.join(self.input_dir, "about.html")
+        output_mtime = os.stat(next(r.output_file for r in first if r.source_file == about_file)).st_mtime
+        os.utime(about_file, (output_mtime + 10, output_mtime + 10))
+
+        with patch.object(self.parser, "_parse_files", wraps=self.parser._parse_files) as parse_files:
+            second = self.parser.parse_all(workers=1)
+
+        parse_files.assert_called_once_with([about_file], 1)
+        self.assertEqual(second, first)
+        self.parser.logger.info.assert_called_with(
+            "Processed %d files: %d parsed, %d up to date, %d failed", 4, 1, 3, 0
+        )
+
+    def test_parse_all_force(self):
+        """Test that force parses every file even if its output is up to date."""
+        first = self.parser.parse_all(workers=1)
+
+        with patch.object(self.parser, "_parse_files", wraps=self.parser._parse_files) as parse_files:
+            second = self.parser.parse_all(workers=1, force=True)
+
+        self.assertEqual(len(parse_files.call_args.args[0]), len(first))
+        self.assertEqual(second, first)
+
+    def test_parse_all_deduplicates_identical_pages(self):
+        """Test that a page saved twice is parsed once and both files share its output."""
+        about_file = os.path.join(self.input_dir, "about.html")
+        copy_file = os.path.join(self.input_dir, "about-copy.html")
+        shutil.copy(about_file, copy_file)
+
+        with patch.object(self.parser, "_parse_html", wraps=self.parser._parse_html) as parse_html:
+            results = {result.source_file: result for result in self.parser.parse_all(workers=1)}
+
+        self.assertEqual(parse_html.call_count, 4)
+        self.assertEqual(results[copy_file].output_file, results[about_file].output_file)
+        self.assertEqual(results[copy_file].title, "About Example")
+        outputs = [os.path.exists(os.path.join(self.output_dir, name)) for name in ("about.md", "about-copy.md")]
+        self.assertEqual(sorted(outputs), [False, True])
+
+    def test_parse_all_reparses_duplicates_of_modified_files(self):
+        """Test that a duplicate gets its own output once the file it shared output with changes."""
+        about_file = os.path.join(self.input_dir, "about.html")
+        copy_file = os.path.join(self.input_dir, "about-copy.html")
+        shutil.copy(about_file, copy_file)
+        first = {result.source_file: result for result in self.parser.parse_all(workers=1)}
+        # Whichever copy was found first owns the shared output
+        owner = about_file if os.path.exists(os.path.join(self.output_dir, "about.md")) else copy_file
+        duplicate = copy_file if owner == about_file else about_file
+
+        with open(owner, "w") as f:
+            f.write("<html><head><title>Changed</title></head><body><main>New</main></body></html>")
+        output_mtime = os.stat(first[owner].output_file).st_mtime
+        os.utime(owner, (output_mtime + 10, output_mtime + 10))
+        second = {result.source_file: result for result in self.parser.parse_all(workers=1)}
+
+        self.assertEqual(second[owner].title, "Changed")
+        self.assertEqual(second[duplicate].title, "About Example")
+        self.assertNotEqual(second[duplicate].output_file, second[owner].output_file)
+        self.assertTrue(os.path.exists(second[duplicate].output_file))
+
+    def test_load_previous_results_skips_malformed_entries(self):
+        """Test that sidecar entries that do not describe a result are ignored."""
+        first = self.parser.parse_all(workers=1)
+        results_file = os.path.join(self.output_dir, Parser.RESULTS_FILE)
+        with open(results_file, "wb") as f:
+            f.write(
+                orjson.dumps({first[0].source_file: first[0].to_dict(), first[1].source_file: {"title": "Broken"}}),
+            )
+
+        self.assertEqual(self.parser._load_previous_results(), {first[0].source_file: first[0]})
+
+    def test_prefetch_html_files(self):
+        """Test that prefetched files come back in order, with None for unreadable files."""
+        files = [os.path.join(self.input_dir, name) for name in ("index.html", "missing.html", "about.html")]
+
+        with patch.object(Parser, "PREFETCH_FILES", 1):
+            prefetched = list(self.parser._prefetch_html_files(files))
+
+        self.assertEqual([path for path, _ in prefetched], files)
+        self.assertIn(b"Example Website", prefetched[0][1])
+        self.assertIsNone(prefetched[1][1])
+        self.assertIn(b"About Example", prefetched[2][1])
+
+    def test_parse_file_replaces_invalid_utf8(self):
+        """Test that undecodable bytes do not stop a file from being parsed."""
+        html_path = os.path.join(self.input_dir, "latin1.html")
+        with open(html_path, "wb") as f:
+            f.write(b"<html><head><title>Caf\xe9</title></head><body><main><p>Text</p></main></body></html>")
+
+        result = self.parser.parse_file(html_path)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.title, "Caf\ufffd")
+
+    def test_parse_html_from_utf8_bytes(self):
+        """Test that file bytes are parsed as UTF-8 whatever the page declares, without comments."""
+        html_bytes = (
+            '<html><head><meta charset="iso-8859-1"><title>Oleskelulupa työhön</title></head>'
+            "<body><main><p>Hakemus</p><!-- internal note --></main></body></html>"
+        ).encode()
+
+        title, content = self.parser._parse_html(html_bytes)
+
+        self.assertEqual(title, "Oleskelulupa työhön")
+        self.assertIn("Hakemus", content)
+        self.assertNotIn("internal note", content)
+
+    def test_dump_frontmatter(self):
+        """Test that parser metadata is written directly and loads back unchanged."""
+        metadata = {
+            "title": 'Residence permit: "work" #1\u2028next',
+            "source_file": "en/services.html",
+            "parse_timestamp": "2025-06-01T12:00:00.123456",
+            "domain": "en",
+        }
+
+        frontmatter = parser_module._dump_frontmatter(metadata)
+
+        self.assertEqual(frontmatter.splitlines()[0], 'domain: "en"')
+        self.assertEqual(yaml.safe_load(frontmatter), metadata)
+
+    def test_dump_frontmatter_falls_back_to_yaml(self):
+        """Test that metadata outside the parser's own schema is written by PyYAML."""
+        metadata = {"title": "Services", "tags": ["permits", "work"], "draft": False}
+
+        frontmatter = parser_module._dump_frontmatter(metadata)
+
+        self.assertEqual(frontmatter, yaml.safe_dump(metadata, default_flow_style=False))
+
+    def test_write_file_replaces_content_and_finishes_short_writes(self):
+        """Test that existing content is truncated and partial writes are continued."""
+        path = os.path.join(self.output_dir, "written.md")
+        with open(path, "wb") as f:
+            f.write(b"much longer previous content")
+
+        real_write = os.write
+        with patch("tapio.parser.parser.os.write", side_effect=lambda fd, data: real_write(fd, data[:3])):
+            Parser._write_file(path, "päivä".encode())
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), "päivä".encode())
+
+    def test_create_index(self):
+        """Test the index table written for the parsed files."""
+        index_path = self.parser._create_index(
+            [
+                ParseResult(
+                    source_file="en/services.html",
+                    output_file="out/en/services.md",
+                    title="Services",
+                    domain="en",
+                ),
+                ParseResult(source_file="", output_file="", title="", domain=""),
+            ],
+        )
+
+        with open(index_path, encoding="utf-8") as f:
+            self.assertEqual(
+                f.read(),
+                "# example Parsed Content Index\n\n"
+                "Total pages parsed: 2\n\n"
+                "| Title | Source File | Output File |\n"
+                "|-------|-------------|-------------|\n"
+                "| Services | services.html | [services.md](services.md) |\n"
+                "| Untitled |  | []() |\n",
+            )
+
+    def test_save_markdown_creates_each_directory_once(self):
+        """Test that output directories are only created for the first file saved in them."""
+        en_dir = os.path.join(self.output_dir, "en")
+        with patch("tapio.parser.parser.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+            self.parser._save_markdown("en/first", "First", "Content", {"title": "First"})
+            mock_makedirs.assert_any_call(en_dir, exist_ok=True)
+            mock_makedirs.reset_mock()
+
+            output_path = self.parser._save_markdown("en/second", "Second", "Sisältö", {"title": "Second"})
+            mock_makedirs.assert_not_called()
+
+        with open(output_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), '---\ntitle: "Second"\n---\n\n# Second\n\nSisältö\n')
+
+    def test_iter_html_files(self):
+        """Test that HTML files are found recursively and other files are skipped."""
+        with open(os.path.join(self.input_dir, "en", "notes.txt"), "w") as f:
+            f.write("Not HTML")
+
+        found = sorted(os.path.relpath(path, self.input_dir) for path in self.parser._iter_html_files(self.input_dir))
+
+        self.assertEqual(
+            found,
+            sorted(["about.html", "index.html", "no-main-content.html", os.path.join("en", "services.html")]),
+        )
+        self.assertEqual(list(self.parser._iter_html_files(os.path.join(self.input_dir, "missing"))), [])
+
+    def test_parser_pickles_without_logger(self):
+        """Test that a parser sent to a worker process re-acquires its logger and keeps its URL indexes."""
+        self.parser.url_mappings = {"about.html": {"url": "https://example.com/about"}}
+
+        restored = pickle.loads(pickle.dumps(self.parser))
+
+        self.assertIsInstance(restored.logger, logging.Logger)
+        self.assertEqual(restored._url_mapping_indexes, self.parser._url_mapping_indexes)
+        self.assertEqual(
+            restored._get_original_url(os.path.join(self.input_dir, "about.html")),
+            "https://example.com/about",
+        )
+
+    def test_parse_all_shares_parse_timestamp(self):
+        """Test that all files parsed in one run share the run's parse timestamp."""
+        self.parser.parse_all()
+
+        timestamps = set()
+        for root, _, files in os.walk(self.output_dir):
+            for file in files:
+                if not file.endswith(".md") or (file == "index.md" and root == self.output_dir):
+                    continue
+                with open(os.path.join(root, file), encoding="utf-8") as f:
+                    frontmatter = yaml.safe_load(f.read().split("---")[1])
+                timestamps.add(frontmatter["parse_timestamp"])
+
+        self.assertEqual(len(timestamps), 1)
+        self.assertIsNone(self.parser._run_timestamp)
+
+    def test_get_original_url(self):
+        """Test URL lookups by relative path, trailing path components and filename."""
+        self.parser.url_mappings = {
+            "example.com/en/services.html": {"url": "https://example.com/en/services"},
+            "example.com/about.html": {"url": "https://example.com/about"},
+            "other.com/about.html": {"url": "https://other.com/about"},
+        }
+
+        self.assertEqual(
+            self.parser._get_original_url(os.path.join(self.input_dir, "example.com", "en", "services.html")),
+            "https://example.com/en/services",
+        )
+        self.assertEqual(
+            self.parser._get_original_url("/elsewhere/other.com/about.html"),
+            "https://other.com/about",
+        )
+        # Filename-only matches resolve to the first mapping with that filename
+        self.assertEqual(self.parser._get_original_url("/elsewhere/about.html"), "https://example.com/about")
+        self.assertIsNone(self.parser._get_original_url("/elsewhere/missing.html"))
+
+    def test_get_original_url_reindexes_reassigned_mappings(self):
+        """Test that URL lookups reflect reassigned mappings, even of the same size."""
+        self.parser.url_mappings = {"about.html": {"url": "https://example.com/about"}}
+        self.assertEqual(
+            self.parser._get_original_url(os.path.join(self.input_dir, "about.html")),
+            "https://example.com/about",
+        )
+
+        self.parser.url_mappings = {"about.html": {"url": "https://example.com/about-us"}}
+        self.assertEqual(
+            self.parser._get_original_url(os.path.join(self.input_dir, "about.html")),
+            "https://example.com/about-us",
+        )
+
+    def test_get_relative_path(self):
+        """Test relative paths inside the input directory and None for files outside it."""
+        self.assertEqual(
+            self.parser._get_relative_path(os.path.join(self.input_dir, "example.com", "en", "services.html")),
+            "example.com/en/services.html",
+        )
+        self.assertIsNone(self.parser._get_relative_path(os.path.join(self.temp_dir, "elsewhere.html")))
+        # A sibling directory that merely shares the input directory's name as a prefix is outside it
+        self.assertIsNone(self.parser._get_relative_path(self.input_dir + "_old" + os.sep + "page.html"))
+        self.assertEqual(
+            self.parser._get_relative_path(os.path.join(self.input_dir, "en", "..", "about.html")),
+            "about.html",
+        )
+
+    def test_get_output_filename(self):
+        """Test that only the trailing .html is dropped from output filenames."""
+        nested = os.path.join(self.input_dir, "en", "archive.html", "page.html.html")
+        self.assertEqual(self.parser._get_output_filename(nested), "en/archive.html/page.html")
+        self.assertEqual(self.parser._get_output_filename(os.path.join(self.input_dir, "about.html")), "about")
+
+    def test_parse_file_computes_relative_path_once(self):
+        """Test that the helpers share the relative path parse_file computes."""
+        services_file = os.path.join(self.input_dir, "en", "services.html")
+
+        with patch.object(self.parser, "_get_relative_path", wraps=self.parser._get_relative_path) as relative_path:
+            result = self.parser.parse_file(services_file)
+
+        relative_path.assert_called_once_with(services_file)
+        self.assertEqual(result.domain, "en")
+        self.assertEqual(result.output_file, os.path.join(self.output_dir, "en/services.md"))
+
     def test_list_available_site_configs(self):
         """Test listing available site configurations."""
         available_sites = Parser.list_available_site_configs(self.config_path)
@@ -444,6 +789,14 @@ class TestParser(unittest.TestCase):
         self.assertIn('src="//cdn.example.org/image.jpg"', result)  # Unchanged
         self.assertIn('src="data:image/png;base64,abc123"', result)  # Unchanged
 
+    def test_convert_relative_links_with_xml_declaration(self):
+        """Test that text with an XML declaration is parsed, with comments dropped."""
+        html_content = '<?xml version="1.0" encoding="utf-8"?><p>Sivu <!-- nav --><a href="ohje">Ohje</a></p>'
+        self.parser.current_base_url = "https://test.com/fi/"
+        result = self.parser._convert_relative_links_to_absolute(html_content)
+        self.assertIn('href="https://test.com/fi/ohje"', result)
+        self.assertNotIn("nav", result)
+
     def test_convert_relative_links_no_base_url(self):
         """Test that conversion is skipped when no base URL is available."""
         html_content = '<a href="page.html">Link</a>'
@@ -5,8 +5,11 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest.mock import patch
+from urllib.parse import urljoin
 
 import yaml
+from lxml import html
 
 from tapio.parser import Parser
 
@@ -141,6 +144,50 @@ class TestRelativeLinks(unittest.TestCase):
         self.assertIn("https://example.com", markdown_content)
         self.assertIn(f"https://{self.domain}/page2.html", markdown_content)
 
+    def test_parse_html_converts_links_without_reparsing(self):
+        """Test that links in the extracted content are converted on the parsed tree."""
+        self.parser.current_base_url = f"https://{self.domain}/section/"
+        html_content = """
+        <html><body>
+            <div id="content"><a href="child">Child</a><img src="../up.png" alt="Up"></div>
+        </body></html>
+        """
+
+        with patch.object(self.parser, "_convert_relative_links_to_absolute") as mock_convert:
+            _, markdown_content = self.parser._parse_html(html_content)
+
+        mock_convert.assert_not_called()
+        self.assertIn(f"https://{self.domain}/section/child", markdown_content)
+        self.assertIn(f"https://{self.domain}/up.png", markdown_content)
+
+    def test_make_links_absolute_converts_href_and_src_on_one_element(self):
+        """Test that an element carrying both attributes has both converted."""
+        self.parser.current_base_url = f"https://{self.domain}/section/"
+        element = html.fromstring('<div><embed href="info" src="../media/clip.mp4"><a href="#top">Top</a></div>')
+
+        self.parser._make_links_absolute(element)
+
+        embed = element.find(".//embed")
+        self.assertEqual(embed.get("href"), f"https://{self.domain}/section/info")
+        self.assertEqual(embed.get("src"), f"https://{self.domain}/media/clip.mp4")
+        self.assertEqual(element.find(".//a").get("href"), "#top")
+
+    def test_make_links_absolute_joins_repeated_links_once(self):
+        """Test that a link repeated within a document is joined against the base URL once."""
+        self.parser.current_base_url = f"https://{self.domain}/section/"
+        element = html.fromstring(
+            '<div><a href="info">A</a><a href="info">B</a><img src="info"><a href="x">X</a></div>'
+        )
+
+        with patch("tapio.parser.parser.urljoin", wraps=urljoin) as mock_urljoin:
+            self.parser._make_links_absolute(element)
+
+        self.assertEqual(mock_urljoin.call_count, 2)
+        self.assertEqual(
+            [el.get("href") or el.get("src") for el in element.iter("a", "img")],
+            [f"https://{self.domain}/section/info"] * 3 + [f"https://{self.domain}/section/x"],
+        )
+
     def test_parse_file(self):
         """Test that parse_file sets the correct base URL."""
         # Parse the file
@@ -157,7 +204,7 @@ class TestRelativeLinks(unittest.TestCase):
         )
 
         # Read the output markdown file to verify links were converted
-        output_path = result["output_file"]
+        output_path = result.output_file
         with open(output_path) as f:
             markdown_content = f.read()
 
@@ -166,6 +213,22 @@ class TestRelativeLinks(unittest.TestCase):
         self.assertIn(f"https://{self.domain}/images/test.png", markdown_content)
         self.assertIn(f"https://{self.domain}/page2.html", markdown_content)
 
+    def test_url_mappings_from_crawl_journal(self):
+        """Test that mappings journaled by an unfinished crawl are loaded."""
+        journal_path = os.path.join(self.input_dir, "url_mappings.jsonl")
+        with open(journal_path, "w") as f:
+            f.write(json.dumps({"path": f"{self.domain}/page2.html", "url": f"https://{self.domain}/page2"}) + "\n")
+            # Simulate a crawl killed in the middle of writing a line
+            f.write('{"path": "test-site.com/pa')
+
+        parser = Parser(site_name="test_site", config_path=self.config_path)
+
+        self.assertEqual(
+            parser.url_mappings[f"{self.domain}/page2.html"],
+            {"url": f"https://{self.domain}/page2"},
+        )
+        self.assertIn(f"{self.domain}/page-with-links.html", parser.url_mappings)
+
     def test_domain_specific_url_handling(self):
         """Test handling of domain-specific URLs."""
         # Create a file in a domain-specific directory
@@ -219,7 +282,7 @@ class TestRelativeLinks(unittest.TestCase):
         self.assertTrue(parser.current_base_url and parser.current_base_url.startswith(f"https://{self.domain}"))
 
         # Read the output markdown file to verify links were converted
-        output_path = result["output_file"]
+        output_path = result.output_file
         with open(output_path) as f:
             markdown_content = f.read()
 
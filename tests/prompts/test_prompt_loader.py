@@ -82,3 +82,42 @@ def test_load_prompt_file_error():
         with mock.patch("builtins.open", side_effect=OSError("Mock error")):
             result = load_prompt("error_prompt")
             assert result == ""
+
+
+def test_load_prompt_caches_template():
+    """Test that a prompt template is read from disk only once."""
+    with tempfile.NamedTemporaryFile(mode="w+", suffix=".md", delete=False) as temp_file:
+        temp_file.write("Question: $question")
+        temp_file.flush()
+
+        prompt_name = Path(temp_file.name).stem
+
+        try:
+            with mock.patch(
+                "tapio.prompts.prompt_loader.get_prompt_path",
+                return_value=temp_file.name,
+            ) as mock_get_prompt_path:
+                assert load_prompt(prompt_name, question="first") == "Question: first"
+                assert load_prompt(prompt_name, question="second") == "Question: second"
+                mock_get_prompt_path.assert_called_once_with(prompt_name)
+        finally:
+            os.unlink(temp_file.name)
+
+
+def test_load_prompt_does_not_cache_missing_template():
+    """Test that a missing template is looked up again on the next call."""
+    with mock.patch("os.path.exists", return_value=False):
+        assert load_prompt("later_prompt") == ""
+
+    with tempfile.NamedTemporaryFile(mode="w+", suffix=".md", delete=False) as temp_file:
+        temp_file.write("Now available")
+        temp_file.flush()
+
+        try:
+            with mock.patch(
+                "tapio.prompts.prompt_loader.get_prompt_path",
+                return_value=temp_file.name,
+            ):
+                assert load_prompt("later_prompt") == "Now available"
+        finally:
+            os.unlink(temp_file.name)
@@ -51,6 +51,7 @@ def test_document_retrieval_service_retrieves_documents(doc_retrieval_service):
     doc_retrieval_service.vector_store.query.assert_called_once_with(
         query_text="Test query",
         n_results=3,
+        query_embedding=None,
     )
 
     # Verify the results
@@ -109,3 +110,18 @@ def test_document_retrieval_service_formats_display(doc_retrieval_service):
     assert "### Document 2" in display_text
     assert "**Source**: http://example.com/2" in display_text
     assert "Second document content" in display_text
+
+
+def test_document_retrieval_service_formats_display_layout(doc_retrieval_service):
+    """Test the exact display layout, including documents without metadata."""
+    doc_with_metadata = mock.MagicMock()
+    doc_with_metadata.page_content = "First document content"
+    doc_with_metadata.metadata = {"title": "Residence permits", "url": "http://example.com/1"}
+
+    display_text = doc_retrieval_service.format_documents_for_display([doc_with_metadata, "Plain text"])
+
+    assert display_text == (
+        "### Residence permits\n**Source**: http://example.com/1\n\nFirst document content\n\n"
+        "\n"
+        "### Document 2\n**Source**: Unknown source\n\nPlain text\n\n"
+    )
@@ -1,6 +1,6 @@
 """Tests for the LLM service module."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -228,6 +228,34 @@ class TestLLMService:
         assert result is True
         mock_list.assert_called_once()
 
+    @patch("tapio.services.llm_service.ollama.list")
+    def test_check_model_availability_reuses_successful_check(self, mock_list):
+        """Test that a successful check is reused until it expires."""
+        mock_model = MagicMock()
+        mock_model.model = "llama3.2:latest"
+        mock_list.return_value = MagicMock(models=[mock_model])
+
+        service = LLMService("llama3.2")
+        with patch("tapio.services.llm_service.time.monotonic", side_effect=[100.0, 200.0, 500.0, 500.0]):
+            assert service.check_model_availability() is True
+            assert service.check_model_availability() is True
+            mock_list.assert_called_once()
+
+            # The cached result expires after MODEL_CHECK_TTL seconds
+            assert service.check_model_availability() is True
+            assert mock_list.call_count == 2
+
+    @patch("tapio.services.llm_service.ollama.list")
+    def test_check_model_availability_repeats_failed_check(self, mock_list):
+        """Test that a failed check is not cached."""
+        mock_list.return_value = MagicMock(models=[])
+
+        service = LLMService("llama3.2")
+        service.check_model_availability()
+        service.check_model_availability()
+
+        assert mock_list.call_count == 2
+
     @patch("tapio.services.llm_service.ollama.chat")
     def test_generate_response_success(self, mock_chat):
         """Test successful response generation."""
@@ -294,3 +322,58 @@ class TestLLMService:
         assert "Error: Could not generate a response" in result
         assert "llama3.2:latest" in result
         mock_chat.assert_called_once()
+
+    @patch("tapio.services.llm_service.ollama.AsyncClient")
+    async def test_agenerate_response_success(self, mock_async_client):
+        """Test async response generation through the Ollama async client."""
+        mock_client = mock_async_client.return_value
+        mock_client.chat = AsyncMock(return_value={"message": {"content": "Async response."}})
+
+        service = LLMService("llama3.2:latest", max_tokens=512, temperature=0.5)
+        result = await service.agenerate_response("Test prompt", system_prompt="System")
+        await service.agenerate_response("Another prompt")
+
+        assert result == "Async response."
+        # The client is created once and reused
+        mock_async_client.assert_called_once_with()
+        mock_client.chat.assert_any_call(
+            model="llama3.2:latest",
+            messages=[
+                {"role": "system", "content": "System"},
+                {"role": "user", "content": "Test prompt"},
+            ],
+            options={
+                "temperature": 0.5,
+                "num_predict": 512,
+            },
+        )
+
+    @patch("tapio.services.llm_service.ollama.AsyncClient")
+    async def test_agenerate_response_error(self, mock_async_client):
+        """Test async response generation when an error occurs."""
+        mock_async_client.return_value.chat = AsyncMock(side_effect=Exception("Connection error"))
+
+        service = LLMService("llama3.2:latest")
+        result = await service.agenerate_response("Test prompt")
+
+        assert "Error: Could not generate a response" in result
+
+    @patch("tapio.services.llm_service.ollama.AsyncClient")
+    async def test_agenerate_response_stream(self, mock_async_client):
+        """Test async streaming yields the content of each chunk."""
+
+        async def stream():
+            yield {"message": {"content": "Hello"}}
+            yield {"done": True}
+            yield {"message": {"content": " world"}}
+
+        mock_client = mock_async_client.return_value
+        mock_client.chat = AsyncMock(return_value=stream())
+
+        service = LLMService("llama3.2:latest")
+        chunks = [chunk async for chunk in service.agenerate_response_stream("Test prompt")]
+
+        assert chunks == ["Hello", " world"]
+        call_kwargs = mock_client.chat.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["options"]["num_ctx"] == 2048
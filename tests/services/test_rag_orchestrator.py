@@ -174,3 +174,91 @@ def test_rag_orchestrator_format_documents_for_display(rag_orchestrator):
 
     # Verify the result
     assert result == "Formatted documents"
+
+
+def test_rag_orchestrator_query_reuses_cached_response(rag_orchestrator):
+    """Test that a repeated query is answered from the cache without calling the LLM again."""
+    with mock.patch("tapio.services.rag_orchestrator.load_prompt", return_value="prompt"):
+        mock_doc = mock.MagicMock()
+        mock_doc.page_content = "Test document content"
+        mock_doc.metadata = {"source_url": "https://migri.fi/page"}
+        rag_orchestrator.mock_doc_service.retrieve_documents.return_value = [mock_doc]
+        rag_orchestrator.mock_llm_service.generate_response.return_value = "Test LLM response"
+
+        first_response, _ = rag_orchestrator.query("Test query")
+        second_response, docs = rag_orchestrator.query("test query?")
+
+    assert first_response == second_response == "Test LLM response"
+    assert docs == [mock_doc]
+    assert rag_orchestrator.mock_doc_service.retrieve_documents.call_count == 2
+    rag_orchestrator.mock_llm_service.generate_response.assert_called_once()
+
+
+def test_rag_orchestrator_query_does_not_cache_errors(rag_orchestrator):
+    """Test that generation errors are not cached."""
+    with mock.patch("tapio.services.rag_orchestrator.load_prompt", return_value="prompt"):
+        rag_orchestrator.mock_doc_service.retrieve_documents.return_value = []
+        rag_orchestrator.mock_llm_service.generate_response.return_value = (
+            "Error: Could not generate a response. Please check if Ollama is running with the test_model model."
+        )
+
+        rag_orchestrator.query("Test query")
+        rag_orchestrator.query("Test query")
+
+    assert rag_orchestrator.mock_llm_service.generate_response.call_count == 2
+
+
+def test_rag_orchestrator_query_stream_reuses_cached_response(rag_orchestrator):
+    """Test that a fully streamed response is cached and replayed for a repeated query."""
+    with mock.patch("tapio.services.rag_orchestrator.load_prompt", return_value="prompt"):
+        rag_orchestrator.mock_doc_service.retrieve_documents.return_value = []
+        rag_orchestrator.mock_llm_service.generate_response_stream.return_value = iter(["Test ", "response"])
+
+        first_stream, _ = rag_orchestrator.query_stream("Test query")
+        assert list(first_stream) == ["Test ", "response"]
+
+        second_stream, _ = rag_orchestrator.query_stream("Test query")
+        assert list(second_stream) == ["Test response"]
+
+    rag_orchestrator.mock_llm_service.generate_response_stream.assert_called_once()
+
+
+async def test_rag_orchestrator_aquery(rag_orchestrator):
+    """Test that the async query retrieves documents and awaits the async LLM call."""
+    with mock.patch("tapio.services.rag_orchestrator.load_prompt", side_effect=["System", "User"]):
+        mock_doc = mock.MagicMock()
+        mock_doc.page_content = "Test document content"
+        rag_orchestrator.mock_doc_service.retrieve_documents.return_value = [mock_doc]
+        rag_orchestrator.mock_llm_service.agenerate_response = mock.AsyncMock(return_value="Async LLM response")
+
+        response, docs = await rag_orchestrator.aquery("Test query")
+
+    assert response == "Async LLM response"
+    assert docs == [mock_doc]
+    rag_orchestrator.mock_doc_service.retrieve_documents.assert_called_once_with("Test query")
+    rag_orchestrator.mock_llm_service.agenerate_response.assert_awaited_once_with(
+        prompt="User",
+        system_prompt="System",
+    )
+
+
+async def test_rag_orchestrator_aquery_stream(rag_orchestrator):
+    """Test that the async streaming query yields the LLM chunks and caches the full response."""
+
+    async def mock_stream(prompt, system_prompt=None):
+        yield "Test "
+        yield "response"
+
+    with mock.patch("tapio.services.rag_orchestrator.load_prompt", return_value="prompt"):
+        rag_orchestrator.mock_doc_service.retrieve_documents.return_value = []
+        rag_orchestrator.mock_llm_service.agenerate_response_stream = mock_stream
+
+        response_stream, docs = await rag_orchestrator.aquery_stream("Test query")
+        chunks = [chunk async for chunk in response_stream]
+
+        cached_stream, _ = await rag_orchestrator.aquery_stream("Test query")
+        cached_chunks = [chunk async for chunk in cached_stream]
+
+    assert docs == []
+    assert chunks == ["Test ", "response"]
+    assert cached_chunks == ["Test response"]
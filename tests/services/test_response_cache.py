@@ -0,0 +1,77 @@
+"""Tests for the RAG response cache."""
+
+from unittest import mock
+
+from tapio.services.response_cache import ResponseCache, document_ids, normalize_query
+
+
+def make_doc(content: str, url: str = "https://migri.fi/page") -> mock.MagicMock:
+    """Create a mock retrieved document."""
+    doc = mock.MagicMock()
+    doc.page_content = content
+    doc.metadata = {"source_url": url}
+    return doc
+
+
+def test_normalize_query():
+    """Test that case, punctuation and whitespace differences are normalized away."""
+    assert normalize_query("  How do I  apply for a Residence permit?! ") == "how do i apply for a residence permit"
+
+
+def test_document_ids_depend_on_source_and_content():
+    """Test that document identifiers change with either the source or the content."""
+    doc = make_doc("Content")
+
+    assert document_ids([doc]) == document_ids([make_doc("Content")])
+    assert document_ids([doc]) != document_ids([make_doc("Other content")])
+    assert document_ids([doc]) != document_ids([make_doc("Content", url="https://migri.fi/other")])
+
+
+def test_get_returns_response_for_normalized_query():
+    """Test that a cached response is served for an equivalent query."""
+    cache = ResponseCache()
+    docs = [make_doc("Permit info")]
+    cache.put("What is a residence permit?", "A permit to stay.", docs)
+
+    assert cache.get("what is a residence permit", docs) == "A permit to stay."
+    assert cache.get("What is citizenship?", docs) is None
+
+
+def test_get_requires_overlapping_documents():
+    """Test that a cached response is not served when different documents are retrieved."""
+    cache = ResponseCache(min_doc_overlap=0.5)
+    docs = [make_doc("First"), make_doc("Second")]
+    cache.put("query", "response", docs)
+
+    assert cache.get("query", [make_doc("First"), make_doc("Second"), make_doc("Third")]) == "response"
+    assert cache.get("query", [make_doc("Third"), make_doc("Fourth")]) is None
+
+
+def test_entries_expire_after_ttl():
+    """Test that expired entries are dropped."""
+    cache = ResponseCache(ttl_seconds=10)
+    docs = [make_doc("Content")]
+
+    with mock.patch("tapio.services.response_cache.time.monotonic", return_value=100.0):
+        cache.put("query", "response", docs)
+    with mock.patch("tapio.services.response_cache.time.monotonic", return_value=105.0):
+        assert cache.get("query", docs) == "response"
+    with mock.patch("tapio.services.response_cache.time.monotonic", return_value=111.0):
+        assert cache.get("query", docs) is None
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache evicts the least recently used entry when full."""
+    cache = ResponseCache(max_entries=2)
+    docs = [make_doc("Content")]
+    cache.put("first", "1", docs)
+    cache.put("second", "2", docs)
+    cache.get("first", docs)
+    cache.put("third", "3", docs)
+
+    assert len(cache) == 2
+    assert cache.get("first", docs) == "1"
+    assert cache.get("second", docs) is None
+    assert cache.get("third", docs) == "3"
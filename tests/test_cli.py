@@ -2,13 +2,18 @@
 
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
-from tapio.cli import app, find_sites_with_crawled_content
-from tapio.config.settings import DEFAULT_CHROMA_COLLECTION, DEFAULT_CONTENT_DIR, DEFAULT_DIRS
+from tapio.cli import app, find_sites_with_crawled_content, run_tapio_app
+from tapio.config.settings import (
+    DEFAULT_CHROMA_COLLECTION,
+    DEFAULT_CONTENT_DIR,
+    DEFAULT_DIRS,
+    DEFAULT_VECTORIZE_BATCH_SIZE,
+)
 
 
 @pytest.fixture
@@ -35,13 +40,18 @@ class TestCli:
         assert "vectorize" in result.stdout
         assert "info" in result.stdout
 
-    @patch("tapio.cli.CrawlerRunner")
+    @patch("tapio.crawler.runner.CrawlerRunner")
     @patch("tapio.cli.ConfigManager")
     def test_crawl_command(self, mock_config_manager, mock_crawler_runner, runner):
         """Test the crawl command."""
         # Set up mocks
+        def fake_run(site, site_config, on_page=None, collect_results=True):
+            for page in ["page1", "page2", "page3"]:
+                on_page(page)
+            return []
+
         mock_runner_instance = MagicMock()
-        mock_runner_instance.run.return_value = ["page1", "page2", "page3"]
+        mock_runner_instance.run.side_effect = fake_run
         mock_crawler_runner.return_value = mock_runner_instance
 
         # Mock ConfigManager
@@ -83,7 +93,12 @@ class TestCli:
         mock_crawler_runner.assert_called_once()
 
         # Check that run was called with the new interface
-        mock_runner_instance.run.assert_called_once_with("migri", mock_site_config)
+        mock_runner_instance.run.assert_called_once_with(
+            "migri",
+            mock_site_config,
+            on_page=ANY,
+            collect_results=False,
+        )
 
         # Check that depth was overridden
         assert mock_site_config.crawler_config.max_depth == 2
@@ -93,7 +108,36 @@ class TestCli:
         assert "Crawling completed" in result.stdout
         assert "Processed 3 pages" in result.stdout
 
-    @patch("tapio.cli.CrawlerRunner")
+    @patch("tapio.crawler.runner.CrawlerRunner")
+    @patch("tapio.cli.ConfigManager")
+    def test_crawl_command_rate_limit_overrides(self, mock_config_manager, mock_crawler_runner, runner):
+        """Test that --concurrency and --delay override the site's crawler config."""
+        mock_crawler_runner.return_value = MagicMock()
+
+        mock_config_instance = MagicMock()
+        mock_site_config = MagicMock()
+        mock_site_config.crawler_config.delay_between_requests = 1.0
+        mock_site_config.crawler_config.max_concurrent = 5
+        mock_config_instance.get_site_config.return_value = mock_site_config
+        mock_config_instance.list_available_sites.return_value = ["migri"]
+        mock_config_manager.return_value = mock_config_instance
+
+        result = runner.invoke(app, ["crawl", "migri", "--concurrency", "10", "--delay", "0.2"])
+
+        assert result.exit_code == 0
+        assert mock_site_config.crawler_config.max_concurrent == 10
+        assert mock_site_config.crawler_config.delay_between_requests == 0.2
+        assert "Using 0.2s delay between requests and max 10 concurrent requests" in result.stdout
+
+    @patch("tapio.cli.ConfigManager")
+    def test_crawl_command_invalid_concurrency(self, mock_config_manager, runner):
+        """Test that an out of range --concurrency value is rejected."""
+        result = runner.invoke(app, ["crawl", "migri", "--concurrency", "0"])
+
+        assert result.exit_code != 0
+        mock_config_manager.assert_not_called()
+
+    @patch("tapio.crawler.runner.CrawlerRunner")
     @patch("tapio.cli.ConfigManager")
     def test_crawl_command_keyboard_interrupt(self, mock_config_manager, mock_crawler_runner, runner):
         """Test handling of keyboard interrupt in crawl command."""
@@ -128,7 +172,7 @@ class TestCli:
         assert "Crawling interrupted by user" in result.stdout
         assert "Partial results have been saved" in result.stdout
 
-    @patch("tapio.cli.CrawlerRunner")
+    @patch("tapio.crawler.runner.CrawlerRunner")
     @patch("tapio.cli.ConfigManager")
     def test_crawl_command_exception(self, mock_config_manager, mock_crawler_runner, runner):
         """Test handling of exceptions in crawl command."""
@@ -181,7 +225,7 @@ class TestCli:
         assert "Available sites: migri, te_palvelut, kela" in result.stdout
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     def test_parse_command(self, mock_parser, mock_config_manager, runner):
         """Test the parse command."""
         # Set up mock parser
@@ -216,7 +260,7 @@ class TestCli:
         mock_config_instance.list_available_sites.assert_called_once()
 
         # Check that parse_all was called correctly (without domain parameter)
-        mock_parser_instance.parse_all.assert_called_once_with()
+        mock_parser_instance.parse_all.assert_called_once_with(force=False)
 
         # Check expected output in stdout
         assert "Starting HTML parsing" in result.stdout
@@ -246,7 +290,7 @@ class TestCli:
         mock_config_instance.list_available_sites.assert_called_once()
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     def test_parse_command_exception(self, mock_parser, mock_config_manager, runner):
         """Test handling of exceptions in parse command."""
         # Set up mock parser that raises an exception
@@ -273,7 +317,7 @@ class TestCli:
         mock_config_instance.list_available_sites.assert_called_once()
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     @patch("os.path.exists")
     def test_parse_command_custom_config(self, mock_exists, mock_parser, mock_config_manager, runner):
         """Test the parse command with a custom config path."""
@@ -317,9 +361,9 @@ class TestCli:
         )
 
         # Check that parse_all was called correctly (without domain parameter)
-        mock_parser_instance.parse_all.assert_called_once_with()
+        mock_parser_instance.parse_all.assert_called_once_with(force=False)
 
-    @patch("tapio.cli.MarkdownVectorizer")
+    @patch("tapio.vectorstore.vectorizer.MarkdownVectorizer")
     def test_vectorize_command(self, mock_vectorizer, runner):
         """Test the vectorize command."""
         # Set up mock
@@ -345,13 +389,15 @@ class TestCli:
             embedding_model_name="all-MiniLM-L6-v2",
             chunk_size=1000,
             chunk_overlap=200,
+            embedding_backend="torch",
+            embedding_model_file=None,
         )
 
         # Check that process_directory was called correctly
         mock_vectorizer_instance.process_directory.assert_called_once_with(
             input_dir=DEFAULT_CONTENT_DIR,
             site_filter=None,
-            batch_size=20,
+            batch_size=DEFAULT_VECTORIZE_BATCH_SIZE,
         )
 
         # Check expected output in stdout
@@ -361,7 +407,7 @@ class TestCli:
         assert "Vectorization completed" in result.stdout
         assert "Processed 5 files" in result.stdout
 
-    @patch("tapio.cli.MarkdownVectorizer")
+    @patch("tapio.vectorstore.vectorizer.MarkdownVectorizer")
     def test_vectorize_command_with_site(self, mock_vectorizer, runner):
         """Test the vectorize command with site filter."""
         # Set up mock
@@ -382,7 +428,7 @@ class TestCli:
         mock_vectorizer_instance.process_directory.assert_called_once_with(
             input_dir=expected_input_dir,
             site_filter=None,
-            batch_size=20,
+            batch_size=DEFAULT_VECTORIZE_BATCH_SIZE,
         )
 
         # Check expected output in stdout
@@ -390,7 +436,7 @@ class TestCli:
         assert "Vectorization completed" in result.stdout
         assert "Processed 3 files" in result.stdout
 
-    @patch("tapio.cli.MarkdownVectorizer")
+    @patch("tapio.vectorstore.vectorizer.MarkdownVectorizer")
     def test_vectorize_command_exception(self, mock_vectorizer, runner):
         """Test handling of exceptions in vectorize command."""
         # Set up mock to raise an exception
@@ -454,8 +500,8 @@ class TestCli:
             share=True,
         )
 
-    @patch("tapio.cli.tapio_app")
-    def test_dev_command(self, mock_tapio_app, runner):
+    @patch("tapio.cli._launch_app")
+    def test_dev_command(self, mock_launch_app, runner):
         """Test the dev command."""
         # Run the command
         result = runner.invoke(app, ["dev"])
@@ -463,8 +509,8 @@ class TestCli:
         # Check that the command ran successfully
         assert result.exit_code == 0
 
-        # Check that tapio_app was called correctly
-        mock_tapio_app.assert_called_once_with(
+        # Check that the app was launched with the dev defaults
+        mock_launch_app.assert_called_once_with(
             model_name="llama3.2",
             share=False,
         )
@@ -472,6 +518,16 @@ class TestCli:
         # Check expected output in stdout
         assert "Launching Tapio Assistant chatbot development server" in result.stdout
 
+    @patch("tapio.cli._launch_app")
+    def test_run_tapio_app(self, mock_launch_app):
+        """Test the run_tapio_app entry point launches the app with the dev defaults."""
+        run_tapio_app()
+
+        mock_launch_app.assert_called_once_with(
+            model_name="llama3.2",
+            share=False,
+        )
+
     @patch("tapio.cli.ConfigManager")
     def test_list_sites_command(self, mock_config_manager, runner):
         """Test the list-sites command."""
@@ -562,7 +618,7 @@ class TestCli:
         assert "Error listing site configurations: Test error" in result.stdout
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     @patch("os.path.exists")
     @patch("os.listdir")
     @patch("os.path.isdir")
@@ -633,7 +689,7 @@ class TestCli:
 
         # Check that parse_all was called for each parser
         for mock_instance in mock_parser_instances:
-            mock_instance.parse_all.assert_called_once_with()
+            mock_instance.parse_all.assert_called_once_with(force=False)
 
         # Check expected output in stdout
         assert "No site specified, parsing all available sites with crawled content" in result.stdout
@@ -755,7 +811,7 @@ class TestCli:
         assert "Available sites: migri, kela" in result.stdout
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     @patch("os.path.exists")
     @patch("os.listdir")
     @patch("os.path.isdir")
@@ -824,7 +880,7 @@ class TestCli:
         assert "Parsed 2 sites: migri, kela" in result.stdout
 
     @patch("tapio.cli.ConfigManager")
-    @patch("tapio.cli.Parser")
+    @patch("tapio.parser.Parser")
     @patch("os.path.exists")
     @patch("os.listdir")
     @patch("os.path.isdir")
@@ -873,7 +929,7 @@ class TestCli:
         assert "No site specified, parsing all available sites with crawled content" in result.stdout
         assert "Error during parsing: Test parsing error" in result.stdout
 
-    @patch("tapio.cli.MarkdownVectorizer")
+    @patch("tapio.vectorstore.vectorizer.MarkdownVectorizer")
     def test_vectorize_command_with_nonexistent_site(self, mock_vectorizer, runner):
         """Test the vectorize command with a non-existent site."""
         # Mock os.path.exists to return False for the site directory
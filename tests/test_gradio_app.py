@@ -1,13 +1,17 @@
 """Tests for the Gradio app module."""
 
+import asyncio
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from tapio.app import (
     DEFAULT_CHROMA_DB_PATH,
     DEFAULT_COLLECTION_NAME,
+    DEFAULT_CONCURRENCY_LIMIT,
     DEFAULT_MAX_TOKENS,
     DEFAULT_MODEL_NAME,
     DEFAULT_NUM_RESULTS,
@@ -26,6 +30,17 @@ def mock_rag_orchestrator():
     return mock_orchestrator
 
 
+async def _stream(chunks):
+    """Yield chunks from an async generator, like the orchestrator's response stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(updates):
+    """Collect the updates of an async generator handler."""
+    return [update async for update in updates]
+
+
 class TestGradioApp(unittest.TestCase):
     """Tests for the Gradio app module."""
 
@@ -54,22 +69,45 @@ class TestGradioApp(unittest.TestCase):
         _ = app._init_rag_orchestrator()
         assert mock_rag_orchestrator_class.call_count == 1
 
+    @patch("tapio.app.RAGOrchestrator")
+    def test_init_rag_orchestrator_concurrent(self, mock_rag_orchestrator_class):
+        """Test that concurrent first requests build only one RAG orchestrator."""
+
+        def slow_orchestrator(**kwargs):
+            # Widen the window in which a second thread could also start building one
+            time.sleep(0.05)
+            return Mock()
+
+        mock_rag_orchestrator_class.side_effect = slow_orchestrator
+        app = TapioAssistantApp()
+
+        orchestrators = []
+
+        def first_request():
+            orchestrators.append(app._init_rag_orchestrator())
+
+        threads = [threading.Thread(target=first_request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_rag_orchestrator_class.call_count == 1
+        assert all(orchestrator is orchestrators[0] for orchestrator in orchestrators)
+
     def test_generate_rag_response(self):
         """Test generating a RAG response."""
         # Setup
         app = TapioAssistantApp()
         app.rag_orchestrator = Mock()
-        app.rag_orchestrator.query.return_value = (
-            "Test response",
-            ["doc1", "doc2"],
-        )
+        app.rag_orchestrator.aquery = AsyncMock(return_value=("Test response", ["doc1", "doc2"]))
         app.rag_orchestrator.format_documents_for_display.return_value = "Formatted docs"
 
         # Call the method
-        response, formatted_docs = app.generate_rag_response("test query")
+        response, formatted_docs = asyncio.run(app.generate_rag_response("test query"))
 
         # Assertions
-        app.rag_orchestrator.query.assert_called_once_with(
+        app.rag_orchestrator.aquery.assert_awaited_once_with(
             query_text="test query",
             history=None,
         )
@@ -82,6 +120,95 @@ class TestGradioApp(unittest.TestCase):
         assert response == "Test response"
         assert formatted_docs == "Formatted docs"
 
+    def test_respond_stream(self):
+        """Test that streamed responses show the formatted documents from the first chunk on."""
+        app = TapioAssistantApp()
+        app.rag_orchestrator = Mock()
+        app.rag_orchestrator.aquery_stream = AsyncMock(return_value=(_stream(["Hello", " world"]), ["doc1"]))
+        app.rag_orchestrator.format_documents_for_display.return_value = "Formatted docs"
+
+        with patch.object(TapioAssistantApp, "STREAM_UPDATE_INTERVAL", 0):
+            updates = asyncio.run(_collect(app.respond_stream("test query", [])))
+
+        # User message, ellipsis, one update per chunk and the final update
+        assert len(updates) == 5
+        assert updates[0][2] == "Retrieving relevant documents..."
+        assert all(docs == "Formatted docs" for _, _, docs in updates[1:])
+        assert updates[-1][1][-1] == {"role": "assistant", "content": "Hello world"}
+        app.rag_orchestrator.format_documents_for_display.assert_called_once_with(["doc1"])
+
+    def test_respond_stream_throttles_updates(self):
+        """Test that chunks arriving within the update interval are batched into one update."""
+        app = TapioAssistantApp()
+        app.rag_orchestrator = Mock()
+        app.rag_orchestrator.aquery_stream = AsyncMock(return_value=(_stream(["Hello", " wide", " world", "!"]), []))
+        app.rag_orchestrator.format_documents_for_display.return_value = "No relevant documents found."
+
+        # The ellipsis is shown at t=0, the chunks arrive at t=0.01, 0.02, 0.03 and 0.1
+        # Only the app's clock is faked, the event loop keeps using the real one
+        with patch("tapio.app.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 0.01, 0.02, 0.03, 0.1]
+            updates = asyncio.run(_collect(app.respond_stream("test query", [])))
+
+        contents = [history[-1]["content"] for _, history, _ in updates[1:]]
+        # The first chunk is shown immediately, the next two are batched until the interval passes
+        assert contents == ["...", "Hello", "Hello wide world!", "Hello wide world!"]
+
+    def test_respond(self):
+        """Test that the non-streaming handler appends the question and the answer."""
+        app = TapioAssistantApp()
+        app.rag_orchestrator = Mock()
+        app.rag_orchestrator.aquery = AsyncMock(return_value=("Test response", ["doc1"]))
+        app.rag_orchestrator.format_documents_for_display.return_value = "Formatted docs"
+
+        message, history, docs = asyncio.run(app.respond("test query", []))
+
+        assert message == ""
+        assert history == [
+            {"role": "user", "content": "test query"},
+            {"role": "assistant", "content": "Test response"},
+        ]
+        assert docs == "Formatted docs"
+
+    def test_respond_stream_overlaps_concurrent_requests(self):
+        """Test that a response waiting on the LLM does not hold up another user's response."""
+        app = TapioAssistantApp()
+        app.rag_orchestrator = Mock()
+        app.rag_orchestrator.format_documents_for_display.return_value = ""
+        started = []
+
+        async def slow_stream(query_text):
+            started.append(query_text)
+            await asyncio.sleep(0.05)
+            yield f"Answer to {query_text}"
+
+        async def aquery_stream(query_text, history=None):
+            return slow_stream(query_text), []
+
+        app.rag_orchestrator.aquery_stream = aquery_stream
+
+        async def serve_two_users():
+            start = time.monotonic()
+            await asyncio.gather(
+                _collect(app.respond_stream("first", [])),
+                _collect(app.respond_stream("second", [])),
+            )
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(serve_two_users())
+
+        assert sorted(started) == ["first", "second"]
+        assert elapsed < 0.1
+
+    def test_interface_concurrency_limit(self):
+        """Test that the chat handlers are queued with the configured concurrency limit."""
+        app = TapioAssistantApp(concurrency_limit=2)
+
+        chat_handlers = [dependency for dependency in app.demo.fns.values() if dependency.name == "respond_stream"]
+
+        assert len(chat_handlers) == 2
+        assert all(dependency.concurrency_limit == 2 for dependency in chat_handlers)
+
     @patch("tapio.app.RAGOrchestrator")
     def test_generate_rag_response_with_error(self, mock_rag_orchestrator_class):
         """Test error handling in generate_rag_response."""
@@ -91,7 +218,7 @@ class TestGradioApp(unittest.TestCase):
 
         # Call the method - need to patch _init_rag_orchestrator first
         with patch.object(app, "_init_rag_orchestrator", side_effect=Exception("Test error")):
-            response, formatted_docs = app.generate_rag_response("test query")
+            response, formatted_docs = asyncio.run(app.generate_rag_response("test query"))
 
         # Assertions
         assert "error" in response.lower()
@@ -115,6 +242,7 @@ class TestGradioApp(unittest.TestCase):
             model_name=DEFAULT_MODEL_NAME,
             max_tokens=DEFAULT_MAX_TOKENS,
             num_results=DEFAULT_NUM_RESULTS,
+            concurrency_limit=DEFAULT_CONCURRENCY_LIMIT,
         )
         mock_app_instance.check_model_availability.assert_called_once()
         mock_app_instance.launch.assert_called_once_with(share=True)
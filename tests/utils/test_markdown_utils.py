@@ -47,6 +47,22 @@ This is test content.
         assert metadata["url"] == "example.com/page.html"
         assert content == "# Test Content\n\nThis is test content."  # No trailing newline
 
+    def test_read_markdown_file_parser_frontmatter(self):
+        """Test reading frontmatter in the quoted form the parser writes."""
+        mock_file_content = (
+            "---\n"
+            'source_url: "https://migri.fi/en/residence-permit"\n'
+            'title: "Oleskelulupa \\"työ\\"\\u2028#1"\n'
+            "---\n\n"
+            "# Oleskelulupa\n"
+        )
+        with patch("builtins.open", mock_open(read_data=mock_file_content)):
+            metadata, content = read_markdown_file("test_file.md")
+
+        assert metadata["title"] == 'Oleskelulupa "työ"\u2028#1'
+        assert metadata["url"] == "https://migri.fi/en/residence-permit"
+        assert content == "# Oleskelulupa"
+
     def test_read_markdown_file_error(self):
         """Test error handling when reading a markdown file."""
         with patch("builtins.open", side_effect=FileNotFoundError("File not found")):
@@ -91,12 +91,8 @@ class TestTextUtils:
         assert all(len(chunk["content"]) <= 500 for chunk in chunks)
 
     @patch("tapio.utils.text_utils.HTMLHeaderTextSplitter")
-    @patch("tapio.utils.text_utils.re.sub")
-    def test_chunk_html_content_header_splitter(self, mock_re_sub, mock_splitter_class):
+    def test_chunk_html_content_header_splitter(self, mock_splitter_class):
         """Test chunking HTML content with header splitter."""
-        # Make the plain text extraction return something large enough to trigger chunking
-        mock_re_sub.return_value = "A" * 2000
-
         mock_splitter = Mock()
         mock_splitter_class.return_value = mock_splitter
         mock_docs = [
@@ -105,7 +101,8 @@ class TestTextUtils:
         ]
         mock_splitter.split_text.return_value = mock_docs
 
-        html = "<h1>Header 1</h1><p>Content 1</p><h2>Header 2</h2><p>Content 2</p>"
+        # Large enough plain text to trigger chunking
+        html = "<h1>Header 1</h1><p>Content 1</p><h2>Header 2</h2><p>" + "A" * 2000 + "</p>"
         chunks = chunk_html_content(html, "text/html", splitter_type="header")
 
         mock_splitter.split_text.assert_called_once()
@@ -114,16 +111,8 @@ class TestTextUtils:
         assert chunks[1]["content"] == "Content 2"
 
     @patch("tapio.utils.text_utils.HTMLSectionSplitter")
-    @patch("tapio.utils.text_utils.re.sub")
-    def test_chunk_html_content_section_splitter(
-        self,
-        mock_re_sub,
-        mock_splitter_class,
-    ):
+    def test_chunk_html_content_section_splitter(self, mock_splitter_class):
         """Test chunking HTML content with section splitter."""
-        # Make the plain text extraction return something large enough to trigger chunking
-        mock_re_sub.return_value = "A" * 2000
-
         mock_splitter = Mock()
         mock_splitter_class.return_value = mock_splitter
         mock_docs = [
@@ -132,7 +121,8 @@ class TestTextUtils:
         ]
         mock_splitter.split_text.return_value = mock_docs
 
-        html = "<div>Section 1</div><div>Section 2</div>"
+        # Large enough plain text to trigger chunking
+        html = "<div>Section 1</div><div>" + "A" * 2000 + "</div>"
         chunks = chunk_html_content(html, "text/html", splitter_type="section")
 
         mock_splitter.split_text.assert_called_once()
@@ -141,17 +131,13 @@ class TestTextUtils:
         assert chunks[1]["content"] == "Section 2"
 
     @patch("tapio.utils.text_utils.RecursiveCharacterTextSplitter")
-    @patch("tapio.utils.text_utils.re.sub")
     @patch("tapio.utils.text_utils._basic_clean_html")
     def test_chunk_html_content_semantic_splitter(
         self,
         mock_clean_html,
-        mock_re_sub,
         mock_splitter_class,
     ):
         """Test chunking HTML content with semantic (recursive) splitter."""
-        # Make the plain text extraction return something large enough to trigger chunking
-        mock_re_sub.return_value = "A" * 2000
         mock_clean_html.return_value = "<p>Cleaned HTML</p>"
 
         mock_splitter = Mock()
@@ -162,7 +148,8 @@ class TestTextUtils:
         ]
         mock_splitter.create_documents.return_value = mock_docs
 
-        html = "<p>Chunk 1</p><p>Chunk 2</p>"
+        # Large enough plain text to trigger chunking
+        html = "<p>Chunk 1</p><p>" + "A" * 2000 + "</p>"
         chunks = chunk_html_content(html, "text/html", splitter_type="semantic")
 
         mock_splitter_class.assert_called_once()
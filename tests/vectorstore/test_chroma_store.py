@@ -117,6 +117,40 @@ class TestChromaStore:
         with pytest.raises(Exception, match="Test error"):
             store.add_document(document_id="test_doc", metadata=metadata)
 
+    @patch("tapio.vectorstore.chroma_store.Chroma")
+    @patch("tapio.vectorstore.chroma_store.HuggingFaceEmbeddings")
+    def test_add_documents_in_batches(self, mock_embeddings, mock_chroma):
+        """Test that documents are added with one call per batch."""
+        mock_vector_db = Mock()
+        mock_chroma.return_value = mock_vector_db
+
+        store = ChromaStore(collection_name="test_collection")
+
+        document_ids = ["doc_1", "doc_2", "doc_3"]
+        metadatas = [{"content": "First"}, {"text": "Second"}, {"title": "No content"}]
+        store.add_documents(document_ids, metadatas, batch_size=2)
+
+        assert mock_vector_db.add_texts.call_count == 2
+        mock_vector_db.add_texts.assert_any_call(
+            texts=["First", "Second"],
+            metadatas=metadatas[:2],
+            ids=["doc_1", "doc_2"],
+        )
+        mock_vector_db.add_texts.assert_any_call(
+            texts=["Empty document: doc_3"],
+            metadatas=metadatas[2:],
+            ids=["doc_3"],
+        )
+
+    @patch("tapio.vectorstore.chroma_store.Chroma")
+    @patch("tapio.vectorstore.chroma_store.HuggingFaceEmbeddings")
+    def test_add_documents_length_mismatch(self, mock_embeddings, mock_chroma):
+        """Test that mismatched IDs and metadata are rejected."""
+        store = ChromaStore(collection_name="test_collection")
+
+        with pytest.raises(ValueError, match="2 document IDs but 1 metadata entries"):
+            store.add_documents(["doc_1", "doc_2"], [{"content": "First"}])
+
     @patch("tapio.vectorstore.chroma_store.Chroma")
     @patch("tapio.vectorstore.chroma_store.HuggingFaceEmbeddings")
     def test_query(self, mock_embeddings, mock_chroma):
@@ -127,8 +161,9 @@ class TestChromaStore:
         mock_doc1.metadata = {}
         mock_doc2 = Mock()
         mock_doc2.metadata = {"source_url": "https://example.com/doc2"}
-        mock_vector_db.similarity_search.return_value = [mock_doc1, mock_doc2]
+        mock_vector_db.similarity_search_by_vector.return_value = [mock_doc1, mock_doc2]
         mock_chroma.return_value = mock_vector_db
+        mock_embeddings.return_value.embed_query.return_value = [0.1, 0.2]
 
         # Initialize ChromaStore
         store = ChromaStore(collection_name="test_collection")
@@ -136,9 +171,10 @@ class TestChromaStore:
         # Test query
         results = store.query(query_text="test query", n_results=2)
 
-        # Check if similarity_search was called with correct arguments
-        mock_vector_db.similarity_search.assert_called_once_with(
-            query="test query",
+        # Check that the query was embedded and searched by its embedding
+        mock_embeddings.return_value.embed_query.assert_called_once_with("test query")
+        mock_vector_db.similarity_search_by_vector.assert_called_once_with(
+            embedding=[0.1, 0.2],
             k=2,
         )
 
@@ -147,13 +183,30 @@ class TestChromaStore:
         assert "citation_url" in mock_doc2.metadata
         assert mock_doc2.metadata["citation_url"] == "https://example.com/doc2"
 
+    @patch("tapio.vectorstore.chroma_store.Chroma")
+    @patch("tapio.vectorstore.chroma_store.HuggingFaceEmbeddings")
+    def test_query_reuses_embeddings(self, mock_embeddings, mock_chroma):
+        """Test that repeated queries are embedded once and precomputed embeddings are used as is."""
+        mock_vector_db = Mock()
+        mock_vector_db.similarity_search_by_vector.return_value = []
+        mock_chroma.return_value = mock_vector_db
+        mock_embeddings.return_value.embed_query.return_value = [0.1, 0.2]
+
+        store = ChromaStore(collection_name="test_collection")
+        store.query(query_text="test query")
+        store.query(query_text="test query")
+        store.query(query_text="other query", query_embedding=[0.3, 0.4])
+
+        mock_embeddings.return_value.embed_query.assert_called_once_with("test query")
+        mock_vector_db.similarity_search_by_vector.assert_called_with(embedding=[0.3, 0.4], k=5)
+
     @patch("tapio.vectorstore.chroma_store.Chroma")
     @patch("tapio.vectorstore.chroma_store.HuggingFaceEmbeddings")
     def test_query_exception(self, mock_embeddings, mock_chroma):
         """Test handling exceptions when querying the vector store."""
         # Set up mocks
         mock_vector_db = Mock()
-        mock_vector_db.similarity_search.side_effect = Exception("Test error")
+        mock_vector_db.similarity_search_by_vector.side_effect = Exception("Test error")
         mock_chroma.return_value = mock_vector_db
 
         # Initialize ChromaStore
@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, call, patch
 
+import pytest
+
 from tapio.vectorstore.vectorizer import MarkdownVectorizer
 
 
@@ -29,7 +31,7 @@ class TestMarkdownVectorizer:
         )
 
         # Check if components were initialized correctly
-        mock_embeddings_class.assert_called_once_with(model_name="test-model")
+        mock_embeddings_class.assert_called_once_with(model_name="test-model", model_kwargs={})
         mock_splitter_class.assert_called_once_with(chunk_size=500, chunk_overlap=100)
         mock_chroma.assert_called_once_with(
             collection_name="test_collection",
@@ -43,6 +45,37 @@ class TestMarkdownVectorizer:
         assert vectorizer.embedding_model_name == "test-model"
         assert vectorizer.chunk_size == 500
         assert vectorizer.chunk_overlap == 100
+        assert vectorizer.embedding_backend == "torch"
+
+    @patch("tapio.vectorstore.vectorizer.Chroma")
+    @patch("tapio.vectorstore.vectorizer.HuggingFaceEmbeddings")
+    @patch("tapio.vectorstore.vectorizer.MarkdownTextSplitter")
+    def test_init_onnx_backend(self, mock_splitter_class, mock_embeddings_class, mock_chroma):
+        """Test that the ONNX backend and model file are passed to the embedding model."""
+        MarkdownVectorizer(
+            collection_name="test_collection",
+            embedding_model_name="test-model",
+            embedding_backend="onnx",
+            embedding_model_file="onnx/model_qint8_avx512_vnni.onnx",
+        )
+
+        mock_embeddings_class.assert_called_once_with(
+            model_name="test-model",
+            model_kwargs={
+                "backend": "onnx",
+                "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+            },
+        )
+
+    @patch("tapio.vectorstore.vectorizer.Chroma")
+    @patch("tapio.vectorstore.vectorizer.HuggingFaceEmbeddings")
+    @patch("tapio.vectorstore.vectorizer.MarkdownTextSplitter")
+    def test_init_unsupported_backend(self, mock_splitter_class, mock_embeddings_class, mock_chroma):
+        """Test that an unknown embedding backend is rejected."""
+        with pytest.raises(ValueError, match="Unsupported embedding backend"):
+            MarkdownVectorizer(collection_name="test_collection", embedding_backend="tensorrt")
+
+        mock_embeddings_class.assert_not_called()
 
     @patch("tapio.vectorstore.vectorizer.find_markdown_files")
     @patch("tapio.vectorstore.vectorizer.Chroma")
@@ -68,9 +101,9 @@ class TestMarkdownVectorizer:
         ]
         mock_find_files.return_value = test_files
 
-        # Initialize vectorizer with mocked _process_batch
+        # Initialize vectorizer with mocked _load_batch
         vectorizer = MarkdownVectorizer(collection_name="test_collection")
-        vectorizer._process_batch = Mock(return_value=2)  # 2 chunks per batch
+        vectorizer._load_batch = Mock(side_effect=[["chunk1", "chunk2"], ["chunk3"]])
 
         # Process directory
         processed_count = vectorizer.process_directory(
@@ -82,15 +115,18 @@ class TestMarkdownVectorizer:
         # Verify find_markdown_files was called correctly
         mock_find_files.assert_called_once_with("test_dir", "migri")
 
-        # Verify _process_batch was called correctly for each batch
-        assert vectorizer._process_batch.call_count == 2
-        vectorizer._process_batch.assert_has_calls(
+        # Verify _load_batch was called correctly for each batch
+        assert vectorizer._load_batch.call_count == 2
+        vectorizer._load_batch.assert_has_calls(
             [
                 call(["test_dir/file1.md", "test_dir/file2.md"]),
                 call(["test_dir/file3.md"]),
             ],
         )
 
+        # Verify each batch was stored with a single add_documents call, in order
+        mock_vector_db.add_documents.assert_has_calls([call(["chunk1", "chunk2"]), call(["chunk3"])])
+
         # Verify correct number of files was returned
         assert processed_count == 3
 